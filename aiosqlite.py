@@ -1,17 +1,30 @@
 """Lightweight stand-in for the aiosqlite package used in tests.
 
-This implementation provides the minimal async API surface that SQLAlchemy's
-aiosqlite dialect relies on. It wraps the standard sqlite3 module and executes
-blocking operations in a thread so that it behaves like the real aiosqlite
-library for basic usage.
+This implementation provides the async API surface that SQLAlchemy's aiosqlite
+dialect relies on. Each connection owns a dedicated worker thread that executes
+every sqlite3 call in order from a request queue, so a connection is only ever
+touched by one thread and no call goes through the shared default executor.
+
+Extra keyword arguments accepted by :func:`connect`:
+
+* ``pragmas``: mapping applied with ``PRAGMA name=value`` right after connecting
+  (defaults to :data:`DEFAULT_PRAGMAS`; pass ``{}`` to disable).
+* ``single_writer``: serialise write transactions on the same database file across
+  connections of this process while readers keep going (pairs well with WAL).
+* ``iter_chunk_size``: number of rows fetched per worker round-trip when iterating
+  over a cursor.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import os
+import queue
 import sqlite3
-from typing import Any, Callable, Iterable
+import threading
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable
 
 Error = sqlite3.Error
 DatabaseError = sqlite3.DatabaseError
@@ -27,35 +40,73 @@ sqlite_version = sqlite3.sqlite_version
 sqlite_version_info = sqlite3.sqlite_version_info
 Row = sqlite3.Row
 
+DEFAULT_PRAGMAS: dict[str, str] = {"journal_mode": "WAL", "synchronous": "NORMAL"}
+_READ_PREFIXES = ("SELECT", "EXPLAIN", "VALUES")
+
+_write_locks: dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock_for(database: str) -> threading.Lock:
+    key = os.path.abspath(database)
+    with _write_locks_guard:
+        return _write_locks.setdefault(key, threading.Lock())
+
+
+def _resolve(future: asyncio.Future, result: Any, error: BaseException | None) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
 
 class Cursor:
     def __init__(self, connection: "Connection", cursor: sqlite3.Cursor):
         self._connection = connection
         self._cursor = cursor
+        self.iter_chunk_size = connection._iter_chunk_size
 
     async def execute(self, sql: str, parameters: Iterable[Any] | None = None):
         params = parameters or []
-        await asyncio.to_thread(self._cursor.execute, sql, params)
+        await self._connection._execute(self._connection._statement, self._cursor.execute, sql, params)
         return self
 
     async def executemany(self, sql: str, seq_of_parameters: Iterable[Iterable[Any]]):
-        await asyncio.to_thread(self._cursor.executemany, sql, seq_of_parameters)
+        await self._connection._execute(self._connection._statement, self._cursor.executemany, sql, seq_of_parameters)
         return self
 
     async def executescript(self, sql_script: str):
-        await asyncio.to_thread(self._cursor.executescript, sql_script)
+        await self._connection._execute(self._connection._statement, self._cursor.executescript, sql_script)
         return self
 
     async def fetchall(self):
-        return await asyncio.to_thread(self._cursor.fetchall)
+        return await self._connection._execute(self._cursor.fetchall)
 
     async def fetchone(self):
-        return await asyncio.to_thread(self._cursor.fetchone)
+        return await self._connection._execute(self._cursor.fetchone)
 
     async def fetchmany(self, size: int | None = None):
         if size is None:
-            return await asyncio.to_thread(self._cursor.fetchmany)
-        return await asyncio.to_thread(self._cursor.fetchmany, size)
+            return await self._connection._execute(self._cursor.fetchmany)
+        return await self._connection._execute(self._cursor.fetchmany, size)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while True:
+            rows = await self.fetchmany(self.iter_chunk_size)
+            if not rows:
+                return
+            for row in rows:
+                yield row
+
+    @property
+    def arraysize(self) -> int:
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value: int) -> None:
+        self._cursor.arraysize = value
 
     @property
     def description(self):
@@ -70,7 +121,7 @@ class Cursor:
         return self._cursor.rowcount
 
     async def close(self):
-        await asyncio.to_thread(self._cursor.close)
+        await self._connection._execute(self._cursor.close)
 
     async def __aenter__(self):
         return self
@@ -81,41 +132,116 @@ class Cursor:
 
 
 class Connection:
-    def __init__(self, conn: sqlite3.Connection):
-        self._conn = conn
-        self._conn.row_factory = getattr(conn, "row_factory", None)
-        self.isolation_level = conn.isolation_level
-        self._tx: asyncio.Queue[tuple[asyncio.Future, Callable[[], Any]]] = asyncio.Queue()
-        self._tx_worker = asyncio.create_task(self._process_tx_queue())
-
-    @classmethod
-    async def _connect(cls, database: str, **kwargs: Any) -> "Connection":
-        kwargs["check_same_thread"] = False
-        conn = await asyncio.to_thread(sqlite3.connect, database, isolation_level=None, **kwargs)
-        return cls(conn)
-
-    async def _process_tx_queue(self):
+    def __init__(
+        self,
+        connector: Callable[[], sqlite3.Connection],
+        database: str,
+        pragmas: dict[str, Any] | None = None,
+        single_writer: bool = False,
+        iter_chunk_size: int = 64,
+        timeout: float = 5.0,
+    ):
+        self._connector = connector
+        self._conn: sqlite3.Connection | None = None
+        self._pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self._iter_chunk_size = iter_chunk_size
+        self._timeout = timeout
+        self._write_lock = _write_lock_for(database) if single_writer and database != ":memory:" else None
+        self._holds_write_lock = False
+        # SQLAlchemy's aiosqlite dialect pushes (future, function) pairs on ``_tx`` directly.
+        self._tx: queue.SimpleQueue[tuple[asyncio.Future, Callable[[], Any]] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="aiosqlite-worker", daemon=True)
+
+    @property
+    def daemon(self) -> bool:
+        return self._thread.daemon
+
+    @daemon.setter
+    def daemon(self, value: bool) -> None:
+        self._thread.daemon = value
+
+    @property
+    def isolation_level(self):
+        return self._conn.isolation_level if self._conn is not None else None
+
+    def _run(self) -> None:
+        while True:
+            item = self._tx.get()
+            if item is None:
+                return
+            future, function = item
+            result, error = None, None
+            try:
+                result = function()
+            except BaseException as exc:
+                error = exc
+            with contextlib.suppress(RuntimeError):
+                future.get_loop().call_soon_threadsafe(_resolve, future, result, error)
+
+    async def _execute(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._tx.put_nowait((future, partial(function, *args, **kwargs)))
+        return await future
+
+    def _open(self) -> sqlite3.Connection:
+        conn = self._connector()
+        for name, value in self._pragmas.items():
+            if not name.isidentifier() or not str(value).lstrip("-").replace("_", "").isalnum():
+                raise ValueError(f"Invalid pragma {name}={value}")
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    async def _connect(self) -> "Connection":
+        if self._conn is None:
+            self._thread.start()
+            try:
+                self._conn = await self._execute(self._open)
+            except BaseException:
+                self._tx.put_nowait(None)
+                raise
+        return self
+
+    def __await__(self):
+        return self._connect().__await__()
+
+    def _statement(self, function: Callable[..., Any], sql: str, *args: Any) -> Any:
+        # Runs on the worker thread. In single-writer mode a connection holds the database's
+        # write lock from its first write statement until its transaction ends.
+        if self._write_lock is not None and not self._holds_write_lock:
+            if not sql.lstrip()[:7].upper().startswith(_READ_PREFIXES):
+                if not self._write_lock.acquire(timeout=self._timeout):
+                    raise OperationalError("database is locked")
+                self._holds_write_lock = True
         try:
-            while True:
-                future, func = await self._tx.get()
-                if future.cancelled():
-                    continue
-                try:
-                    result = await asyncio.to_thread(func)
-                except Exception as exc:  # noqa: BLE001
-                    if not future.done():
-                        future.set_exception(exc)
-                else:
-                    if not future.done():
-                        future.set_result(result)
-        except asyncio.CancelledError:
-            return
+            return function(sql, *args)
+        finally:
+            self._release_if_idle()
+
+    def _release_if_idle(self) -> None:
+        if self._holds_write_lock and (self._conn is None or not self._conn.in_transaction):
+            self._holds_write_lock = False
+            assert self._write_lock is not None
+            self._write_lock.release()
+
+    def _end_transaction(self, function: Callable[[], None]) -> None:
+        try:
+            function()
+        finally:
+            self._release_if_idle()
+
+    def _close(self) -> None:
+        assert self._conn is not None
+        try:
+            self._conn.close()
+        finally:
+            self._conn = None
+            self._release_if_idle()
 
     def __getattr__(self, item: str) -> Any:
         return getattr(self._conn, item)
 
     async def cursor(self) -> Cursor:
-        cur = await asyncio.to_thread(self._conn.cursor)
+        cur = await self._execute(self._conn.cursor)
         return Cursor(self, cur)
 
     async def execute(self, sql: str, parameters: Iterable[Any] | None = None):
@@ -123,6 +249,12 @@ class Connection:
         await cursor.execute(sql, parameters)
         return cursor
 
+    async def execute_fetchall(self, sql: str, parameters: Iterable[Any] | None = None):
+        def run():
+            return self._statement(self._conn.execute, sql, parameters or []).fetchall()
+
+        return await self._execute(run)
+
     async def executemany(self, sql: str, seq_of_parameters: Iterable[Iterable[Any]]):
         cursor = await self.cursor()
         await cursor.executemany(sql, seq_of_parameters)
@@ -134,46 +266,47 @@ class Connection:
         return cursor
 
     async def commit(self):
-        await asyncio.to_thread(self._conn.commit)
+        await self._execute(self._end_transaction, self._conn.commit)
 
     async def rollback(self):
-        await asyncio.to_thread(self._conn.rollback)
+        await self._execute(self._end_transaction, self._conn.rollback)
 
     async def close(self):
-        await asyncio.to_thread(self._conn.close)
-        if self._tx_worker:
-            self._tx_worker.cancel()
-            with contextlib.suppress(Exception):
-                await self._tx_worker
-
-    def _queue_work(self, func: Callable[[], Any]):
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
-        self._tx.put_nowait((future, func))
-        return future
-
-    def create_function(self, *args: Any, **kwargs: Any):
-        def run():
-            self._conn.create_function(*args, **kwargs)
+        if self._conn is None:
+            return
+        try:
+            await self._execute(self._close)
+        finally:
+            self._tx.put_nowait(None)
 
-        return asyncio.create_task(asyncio.to_thread(run))
+    async def create_function(self, *args: Any, **kwargs: Any):
+        await self._execute(self._conn.create_function, *args, **kwargs)
 
     async def __aenter__(self):
-        return self
+        return await self._connect()
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
         return False
 
 
-class ConnectionMaker:
-    def __init__(self, database: str, **kwargs: Any):
-        self.database = database
-        self.kwargs = kwargs
-        self.daemon = False
-
-    def __await__(self):
-        return Connection._connect(self.database, **self.kwargs).__await__()
-
-
-def connect(database: str, **kwargs: Any) -> ConnectionMaker:
-    return ConnectionMaker(database, **kwargs)
+def connect(
+    database: str,
+    *,
+    pragmas: dict[str, Any] | None = None,
+    single_writer: bool = False,
+    iter_chunk_size: int = 64,
+    **kwargs: Any,
+) -> Connection:
+    kwargs["check_same_thread"] = False
+    kwargs.setdefault("isolation_level", None)
+    timeout = kwargs.setdefault("timeout", 5.0)
+    connector = partial(sqlite3.connect, database, **kwargs)
+    return Connection(
+        connector,
+        str(database),
+        pragmas=pragmas,
+        single_writer=single_writer,
+        iter_chunk_size=iter_chunk_size,
+        timeout=timeout,
+    )
@@ -0,0 +1,47 @@
+"""indexes for hot foreign-key lookups"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_ticket_time_segments_ticket_id", "ticket_time_segments", ["ticket_id"])
+    op.create_index(
+        "ix_ticket_time_segments_open",
+        "ticket_time_segments",
+        ["ticket_id"],
+        postgresql_where=sa.text("ended_at IS NULL"),
+        sqlite_where=sa.text("ended_at IS NULL"),
+    )
+    op.create_index("ix_project_memberships_project_user", "project_memberships", ["project_id", "user_id"])
+    op.create_index("ix_project_memberships_user_id", "project_memberships", ["user_id"])
+    op.create_index("ix_org_memberships_org_user", "org_memberships", ["organization_id", "user_id"])
+    op.create_index("ix_org_memberships_user_id", "org_memberships", ["user_id"])
+    op.create_index("ix_notifications_user_created", "notifications", ["user_id", "created_at"])
+    op.create_index(
+        "ix_notifications_user_unread",
+        "notifications",
+        ["user_id"],
+        postgresql_where=sa.text("read IS false"),
+        sqlite_where=sa.text("read IS 0"),
+    )
+    op.create_index("ix_agenda_events_user_start", "agenda_events", ["user_id", "start_at"])
+    op.create_index("ix_invoices_org_number", "invoices", ["organization_id", "number"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_org_number", table_name="invoices")
+    op.drop_index("ix_agenda_events_user_start", table_name="agenda_events")
+    op.drop_index("ix_notifications_user_unread", table_name="notifications")
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
+    op.drop_index("ix_org_memberships_user_id", table_name="org_memberships")
+    op.drop_index("ix_org_memberships_org_user", table_name="org_memberships")
+    op.drop_index("ix_project_memberships_user_id", table_name="project_memberships")
+    op.drop_index("ix_project_memberships_project_user", table_name="project_memberships")
+    op.drop_index("ix_ticket_time_segments_open", table_name="ticket_time_segments")
+    op.drop_index("ix_ticket_time_segments_ticket_id", table_name="ticket_time_segments")
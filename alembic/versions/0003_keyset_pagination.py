@@ -0,0 +1,24 @@
+"""keyset pagination indexes for organizations and projects"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pages compare on (created_at, id); rows without a timestamp would never be reached.
+    for table in ("organizations", "projects"):
+        op.execute(sa.text(f"UPDATE {table} SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL"))
+    op.create_index("ix_organizations_created_id", "organizations", ["created_at", "id"])
+    op.create_index("ix_projects_created_id", "projects", ["created_at", "id"])
+    op.create_index("ix_projects_org_created_id", "projects", ["organization_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_org_created_id", table_name="projects")
+    op.drop_index("ix_projects_created_id", table_name="projects")
+    op.drop_index("ix_organizations_created_id", table_name="organizations")
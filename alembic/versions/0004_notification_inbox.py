@@ -0,0 +1,27 @@
+"""notification inbox paging and retention indexes"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
+    op.create_index("ix_notifications_user_created", "notifications", ["user_id", "created_at", "id"])
+    op.create_index(
+        "ix_notifications_read_created",
+        "notifications",
+        ["created_at"],
+        postgresql_where=sa.text("read IS true"),
+        sqlite_where=sa.text("read IS 1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_read_created", table_name="notifications")
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
+    op.create_index("ix_notifications_user_created", "notifications", ["user_id", "created_at"])
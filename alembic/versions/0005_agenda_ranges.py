@@ -0,0 +1,16 @@
+"""agenda end_at index for range and overlap queries"""
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_agenda_events_user_end", "agenda_events", ["user_id", "end_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agenda_events_user_end", table_name="agenda_events")
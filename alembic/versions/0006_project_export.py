@@ -0,0 +1,20 @@
+"""indexes for streaming project exports"""
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tickets_project_id", "tickets", ["project_id"])
+    op.create_index("ix_ticket_comments_ticket_id", "ticket_comments", ["ticket_id"])
+    op.create_index("ix_events_ticket_id", "events", ["ticket_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_ticket_id", table_name="events")
+    op.drop_index("ix_ticket_comments_ticket_id", table_name="ticket_comments")
+    op.drop_index("ix_tickets_project_id", table_name="tickets")
@@ -0,0 +1,35 @@
+"""lexicographic ticket ranks within kanban columns"""
+
+from itertools import groupby
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.lexorank import spread_ranks
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tickets", sa.Column("rank", sa.String(length=255)))
+    tickets = sa.table("tickets", sa.column("id", sa.Integer), sa.column("column_id", sa.Integer), sa.column("rank"))
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(tickets.c.id, tickets.c.column_id).order_by(tickets.c.column_id, tickets.c.id))
+    for _, group in groupby(rows, key=lambda row: row.column_id):
+        ids = [row.id for row in group]
+        bind.execute(
+            tickets.update().where(tickets.c.id == sa.bindparam("ticket_id")).values(rank=sa.bindparam("new_rank")),
+            [{"ticket_id": ticket_id, "new_rank": rank} for ticket_id, rank in zip(ids, spread_ranks(len(ids)))],
+        )
+    with op.batch_alter_table("tickets") as batch:
+        batch.alter_column("rank", existing_type=sa.String(length=255), nullable=False)
+    op.create_index("ix_tickets_column_rank", "tickets", ["column_id", "rank"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_column_rank", table_name="tickets")
+    with op.batch_alter_table("tickets") as batch:
+        batch.drop_column("rank")
@@ -0,0 +1,56 @@
+"""one open time segment per ticket and tracked-time rollup on tickets"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the oldest open segment per ticket; close the duplicates with zero duration.
+    op.execute(
+        sa.text(
+            "UPDATE ticket_time_segments SET ended_at = started_at WHERE ended_at IS NULL AND id NOT IN "
+            "(SELECT MIN(id) FROM ticket_time_segments WHERE ended_at IS NULL GROUP BY ticket_id)"
+        )
+    )
+    op.drop_index("ix_ticket_time_segments_open", table_name="ticket_time_segments")
+    op.create_index(
+        "uq_ticket_time_segments_open",
+        "ticket_time_segments",
+        ["ticket_id"],
+        unique=True,
+        postgresql_where=sa.text("ended_at IS NULL"),
+        sqlite_where=sa.text("ended_at IS NULL"),
+    )
+
+    op.add_column(
+        "tickets", sa.Column("total_tracked_seconds", sa.Integer(), nullable=False, server_default="0")
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        duration = "EXTRACT(EPOCH FROM (s.ended_at - s.started_at))"
+    else:
+        duration = "(julianday(s.ended_at) - julianday(s.started_at)) * 86400"
+    op.execute(
+        sa.text(
+            "UPDATE tickets SET total_tracked_seconds = COALESCE(("
+            f"SELECT CAST(SUM({duration}) AS INTEGER) FROM ticket_time_segments s "
+            "WHERE s.ticket_id = tickets.id AND s.ended_at IS NOT NULL), 0)"
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tickets") as batch:
+        batch.drop_column("total_tracked_seconds")
+    op.drop_index("uq_ticket_time_segments_open", table_name="ticket_time_segments")
+    op.create_index(
+        "ix_ticket_time_segments_open",
+        "ticket_time_segments",
+        ["ticket_id"],
+        postgresql_where=sa.text("ended_at IS NULL"),
+        sqlite_where=sa.text("ended_at IS NULL"),
+    )
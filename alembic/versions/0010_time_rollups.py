@@ -0,0 +1,26 @@
+"""daily tracked-time rollups"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ticket_time_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("ticket_id", sa.Integer, sa.ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("project_id", sa.Integer, sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("sprint_id", sa.Integer, sa.ForeignKey("sprints.id", ondelete="SET NULL")),
+        sa.Column("seconds", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index("ix_ticket_time_rollups_project_day", "ticket_time_rollups", ["project_id", "day"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ticket_time_rollups_project_day", table_name="ticket_time_rollups")
+    op.drop_table("ticket_time_rollups")
@@ -0,0 +1,29 @@
+"""denormalized events.project_id for project activity feeds"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("events") as batch:
+        batch.add_column(sa.Column("project_id", sa.Integer()))
+        batch.create_foreign_key("fk_events_project_id", "projects", ["project_id"], ["id"], ondelete="CASCADE")
+    op.execute(
+        sa.text(
+            "UPDATE events SET project_id = (SELECT tickets.project_id FROM tickets WHERE tickets.id = events.ticket_id) "
+            "WHERE project_id IS NULL AND ticket_id IS NOT NULL"
+        )
+    )
+    op.create_index("ix_events_project_created", "events", ["project_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_project_created", table_name="events")
+    with op.batch_alter_table("events") as batch:
+        batch.drop_constraint("fk_events_project_id", type_="foreignkey")
+        batch.drop_column("project_id")
@@ -0,0 +1,26 @@
+"""full-text search over tickets and comments (FTS5 on SQLite, tsvector + GIN on PostgreSQL)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.search import POSTGRES_CREATE, POSTGRES_DROP, SQLITE_BACKFILL, SQLITE_CREATE, SQLITE_DROP
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # Generated columns are computed for existing rows while the table is rewritten.
+        statements = POSTGRES_CREATE
+    else:
+        statements = SQLITE_CREATE + SQLITE_BACKFILL
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    for statement in POSTGRES_DROP if op.get_bind().dialect.name == "postgresql" else SQLITE_DROP:
+        op.execute(sa.text(statement))
@@ -0,0 +1,62 @@
+"""daily sprint burndown snapshots"""
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sprint_daily_snapshots",
+        sa.Column("sprint_id", sa.Integer, sa.ForeignKey("sprints.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("remaining_minutes", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("completed_minutes", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("completed_tickets", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index("ix_ticket_time_rollups_sprint_day", "ticket_time_rollups", ["sprint_id", "day"])
+    # Seed one snapshot per sprint with its current state; later moves adjust it incrementally.
+    tickets = sa.table(
+        "tickets",
+        sa.column("sprint_id", sa.Integer),
+        sa.column("column_id", sa.Integer),
+        sa.column("estimation_minutes", sa.Integer),
+    )
+    columns = sa.table("kanban_columns", sa.column("id", sa.Integer), sa.column("name", sa.String))
+    done = columns.c.name == "DONE"
+    minutes = sa.func.coalesce(tickets.c.estimation_minutes, 0)
+    op.execute(
+        sa.table(
+            "sprint_daily_snapshots",
+            sa.column("sprint_id"),
+            sa.column("day"),
+            sa.column("remaining_minutes"),
+            sa.column("completed_minutes"),
+            sa.column("completed_tickets"),
+        )
+        .insert()
+        .from_select(
+            ["sprint_id", "day", "remaining_minutes", "completed_minutes", "completed_tickets"],
+            sa.select(
+                tickets.c.sprint_id,
+                sa.literal(datetime.now(timezone.utc).date(), sa.Date),
+                sa.func.sum(sa.case((done, 0), else_=minutes)),
+                sa.func.sum(sa.case((done, minutes), else_=0)),
+                sa.func.sum(sa.case((done, 1), else_=0)),
+            )
+            .join(columns, columns.c.id == tickets.c.column_id)
+            .where(tickets.c.sprint_id.is_not(None))
+            .group_by(tickets.c.sprint_id),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ticket_time_rollups_sprint_day", table_name="ticket_time_rollups")
+    op.drop_table("sprint_daily_snapshots")
@@ -0,0 +1,18 @@
+"""ticket version counter for optimistic concurrency"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tickets", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    # A plain DROP COLUMN: a batch table copy on SQLite would drop the search triggers on tickets.
+    op.drop_column("tickets", "version")
@@ -0,0 +1,52 @@
+"""move invoice PDF blobs into the content-addressed file store"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.pdf_store import pdf_store
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 100
+
+invoices = sa.table(
+    "invoices",
+    sa.column("id", sa.Integer),
+    sa.column("pdf_checksum", sa.String),
+    sa.column("pdf_blob", sa.LargeBinary),
+)
+
+
+def upgrade() -> None:
+    # Blobs are copied in id order, a batch at a time, so memory stays bounded on large tables.
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(invoices.c.id, invoices.c.pdf_blob)
+            .where(invoices.c.id > last_id, invoices.c.pdf_blob.is_not(None))
+            .order_by(invoices.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            invoices.update().where(invoices.c.id == sa.bindparam("invoice_id")).values(pdf_checksum=sa.bindparam("checksum")),
+            [{"invoice_id": row.id, "checksum": pdf_store.save(bytes(row.pdf_blob))} for row in rows],
+        )
+        last_id = rows[-1].id
+    op.drop_column("invoices", "pdf_blob")
+
+
+def downgrade() -> None:
+    op.add_column("invoices", sa.Column("pdf_blob", sa.LargeBinary()))
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(invoices.c.id, invoices.c.pdf_checksum).where(invoices.c.pdf_checksum.is_not(None)))
+    for row in rows.all():
+        if pdf_store.exists(row.pdf_checksum):
+            bind.execute(
+                invoices.update().where(invoices.c.id == row.id).values(pdf_blob=pdf_store.load(row.pdf_checksum))
+            )
@@ -0,0 +1,56 @@
+"""per-organization yearly document number sequences"""
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+_NUMBER = re.compile(r"(\d{4})-(\d+)")
+
+
+def upgrade() -> None:
+    sequences = op.create_table(
+        "document_sequences",
+        sa.Column(
+            "organization_id", sa.Integer, sa.ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("year", sa.Integer, primary_key=True),
+        sa.Column("doc_type", sa.String(length=20), primary_key=True),
+        sa.Column("last_value", sa.Integer, nullable=False, server_default="0"),
+    )
+    # Continue every existing series from the highest number already issued.
+    bind = op.get_bind()
+    last: dict[tuple[int, int, str], int] = {}
+    for table, doc_type in (("invoices", "invoice"), ("quotes", "quote")):
+        documents = sa.table(table, sa.column("organization_id", sa.Integer), sa.column("number", sa.String))
+        rows = bind.execute(
+            sa.select(documents.c.organization_id, documents.c.number).where(documents.c.number.is_not(None))
+        )
+        for organization_id, number in rows:
+            match = _NUMBER.fullmatch(number)
+            if match:
+                key = (organization_id, int(match.group(1)), doc_type)
+                last[key] = max(last.get(key, 0), int(match.group(2)))
+    if last:
+        op.bulk_insert(
+            sequences,
+            [
+                {"organization_id": org_id, "year": year, "doc_type": doc_type, "last_value": value}
+                for (org_id, year, doc_type), value in last.items()
+            ],
+        )
+    op.drop_index("ix_invoices_org_number", table_name="invoices")
+    op.create_index("uq_invoices_org_number", "invoices", ["organization_id", "number"], unique=True)
+    op.create_index("uq_quotes_org_number", "quotes", ["organization_id", "number"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_quotes_org_number", table_name="quotes")
+    op.drop_index("uq_invoices_org_number", table_name="invoices")
+    op.create_index("ix_invoices_org_number", "invoices", ["organization_id", "number"])
+    op.drop_table("document_sequences")
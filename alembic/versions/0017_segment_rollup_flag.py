@@ -0,0 +1,19 @@
+"""mark time segments folded into the daily rollups"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ticket_time_segments", sa.Column("rolled_up", sa.Boolean(), nullable=False, server_default=sa.false())
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ticket_time_segments", "rolled_up")
@@ -1,26 +1,43 @@
 from __future__ import annotations
 
 import os
-from typing import Annotated
+from hashlib import sha256
+from typing import Annotated, Any
 
-import firebase_admin
-from fastapi import Depends, Header, HTTPException, status
-from firebase_admin import auth
-from sqlalchemy import select
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.firebase import InvalidTokenError, KeysUnavailableError, get_token_verifier
 from app.core.logging import get_logger
-from app.db.session import get_session
-from app.models.core import OrgMembership, Organization, User
+from app.db.routing import wants_primary
+from app.db.session import get_read_session, get_session
+from app.models.core import User
+from app.services.identity import resolve_user
 
 logger = get_logger(__name__)
 
+token_cache: LRUCache[str, dict[str, Any]] = LRUCache(maxsize=settings.token_cache_size)
+metrics.register("token_cache", token_cache.stats)
+
+
+def token_cache_key(token: str) -> str:
+    return sha256(token.encode()).hexdigest()
+
 
 async def get_db() -> AsyncSession:
     async for session in get_session():
         yield session
 
 
+async def get_read_db(request: Request) -> AsyncSession:
+    sessions = get_session() if wants_primary(request) else get_read_session()
+    async for session in sessions:
+        yield session
+
+
 async def get_current_user(
     authorization: Annotated[str | None, Header()] = None,
     session: AsyncSession = Depends(get_db),
@@ -29,18 +46,26 @@ async def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing token")
 
     token = authorization.split(" ", 1)[1]
-    decoded: dict[str, str]
+    decoded: dict[str, Any] | None
     emulated_uid = os.getenv("FIREBASE_EMULATED_UID")
     if emulated_uid and token == "test-token":
         decoded = {"uid": emulated_uid, "email": f"{emulated_uid}@local", "name": "Test"}
     else:
-        try:
-            if not firebase_admin._apps:  # type: ignore[attr-defined]
-                firebase_admin.initialize_app()
-            decoded = auth.verify_id_token(token, clock_skew_seconds=30)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to verify token: %s", exc)
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
+        cache_key = token_cache_key(token)
+        decoded = token_cache.get(cache_key)
+        if decoded is None:
+            try:
+                decoded = await get_token_verifier().verify(token)
+            except KeysUnavailableError as exc:
+                logger.error("Token verification unavailable: %s", exc)
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Authentication unavailable"
+                ) from exc
+            except InvalidTokenError as exc:
+                logger.warning("Failed to verify token: %s", exc)
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
+            if "exp" in decoded:
+                token_cache.set(cache_key, decoded, expires_at=float(decoded["exp"]))
 
     firebase_uid = decoded.get("uid")
     email = decoded.get("email")
@@ -48,16 +73,4 @@ async def get_current_user(
     if not firebase_uid or not email:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    user = await session.scalar(select(User).where(User.firebase_uid == firebase_uid))
-    if user:
-        user.email = email
-        user.name = name
-    else:
-        user = User(firebase_uid=firebase_uid, email=email, name=name)
-        session.add(user)
-        org = await session.scalar(select(Organization))
-        if org:
-            session.add(OrgMembership(organization_id=org.id, user=user))
-    await session.commit()
-    await session.refresh(user)
-    return user
+    return await resolve_user(session, firebase_uid, email, name)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.routes import agenda, auth, billing, leads, notifications, organizations, projects, tickets
+from app.api.routes import agenda, auth, billing, leads, notifications, organizations, projects, reports, search, tickets
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(auth.router, tags=["auth"])
@@ -10,4 +10,6 @@ api_router.include_router(tickets.router, tags=["tickets"])
 api_router.include_router(billing.router, tags=["billing"])
 api_router.include_router(notifications.router, tags=["notifications"])
 api_router.include_router(agenda.router, tags=["agenda"])
+api_router.include_router(reports.router, tags=["reports"])
+api_router.include_router(search.router, tags=["search"])
 api_router.include_router(leads.router, tags=["public"], prefix="/public")
@@ -1,24 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.core.config import settings
 from app.models.agenda import AgendaEvent
-from app.models.core import GlobalRole, OrgMembership
-from app.schemas.agenda import AgendaEventCreate, AgendaEventOut
+from app.schemas.agenda import AgendaEventCreate, AgendaEventOut, FreeBusyOut, TimeSlot
+from app.services.agenda import as_utc, busy_intervals, free_slots, has_conflict, overlapping, visible_user_ids
+from app.services.authorization import Permission, load_grants
 
 router = APIRouter(prefix="/agenda")
 
 
-def can_view(user_role: GlobalRole) -> bool:
-    return user_role in {GlobalRole.OWNER, GlobalRole.ADMIN, GlobalRole.MEMBER}
+def _window(start: datetime | None, end: datetime | None) -> tuple[datetime, datetime]:
+    start = as_utc(start or datetime.utcnow())
+    end = as_utc(end) if end else start + timedelta(days=30)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end must be after start")
+    if end - start > timedelta(days=settings.agenda_max_window_days):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Time window too large")
+    return start, end
 
 
 @router.post("/", response_model=AgendaEventOut)
 async def create_event(
     payload: AgendaEventCreate,
+    allow_conflicts: bool = False,
     session: AsyncSession = Depends(get_db),
 ) -> AgendaEventOut:
+    if as_utc(payload.end_at) < as_utc(payload.start_at):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end_at must be after start_at")
+    if not allow_conflicts and await has_conflict(session, payload.user_id, payload.start_at, payload.end_at):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Event overlaps an existing event")
     event = AgendaEvent(**payload.model_dump())
     session.add(event)
     await session.commit()
@@ -28,11 +43,40 @@ async def create_event(
 
 @router.get("/", response_model=list[AgendaEventOut])
 async def list_events(
-    session: AsyncSession = Depends(get_db),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    session: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
 ) -> list[AgendaEventOut]:
-    membership = await session.scalar(select(OrgMembership).where(OrgMembership.user_id == current_user.id))
-    if not membership or not can_view(membership.role):
+    grants = await load_grants(session, current_user.id)
+    if Permission.AGENDA_VIEW not in grants.any_org():
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    result = await session.scalars(select(AgendaEvent).where(AgendaEvent.user_id == current_user.id))
+    start, end = _window(start, end)
+    stmt = overlapping(select(AgendaEvent).where(AgendaEvent.user_id == current_user.id), start, end)
+    result = await session.scalars(stmt.order_by(AgendaEvent.start_at))
     return list(result)
+
+
+@router.get("/free-busy", response_model=FreeBusyOut)
+async def free_busy(
+    user_ids: list[int] = Query(..., max_length=200),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FreeBusyOut:
+    grants = await load_grants(session, current_user.id)
+    if Permission.AGENDA_VIEW not in grants.any_org():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    start, end = _window(start, end)
+    visible = await visible_user_ids(session, grants.org_ids(Permission.AGENDA_VIEW), user_ids)
+    if visible != set(user_ids):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    busy = await busy_intervals(session, visible, start, end)
+    return FreeBusyOut(
+        start_at=start,
+        end_at=end,
+        user_ids=sorted(visible),
+        busy=[TimeSlot(start_at=s, end_at=e) for s, e in busy],
+        free=[TimeSlot(start_at=s, end_at=e) for s, e in free_slots(busy, start, end)],
+    )
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.models.billing import Invoice, InvoiceLine, InvoiceStatus, Quote, QuoteLine, QuoteStatus
 from app.schemas.billing import InvoiceCreate, InvoiceOut, QuoteCreate, QuoteOut
-from app.schemas.common import Message
-from app.services.billing import accept_quote, issue_invoice, next_document_number
+from app.services.authorization import Permission, load_grants
+from app.services.billing import accept_quote, issue_invoice
+from app.services.pdf_renderer import PdfRenderError
+from app.services.pdf_store import pdf_store
 
 router = APIRouter(prefix="/billing")
 
@@ -71,19 +74,47 @@ async def issue_invoice_endpoint(
     invoice = await session.get(Invoice, invoice_id)
     if not invoice:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invoice not found")
-    await issue_invoice(session, invoice)
-    await session.commit()
+    try:
+        await issue_invoice(session, invoice)
+    except PdfRenderError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
     await session.refresh(invoice)
     return InvoiceOut.model_validate(invoice, from_attributes=True)
 
 
-@router.get("/invoices/{invoice_id}/pdf")
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+@router.get("/invoices/{invoice_id}/pdf", response_class=FileResponse)
 async def get_invoice_pdf(
     invoice_id: int,
+    if_none_match: str | None = Header(default=None),
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-):
-    invoice = await session.get(Invoice, invoice_id)
-    if not invoice or not invoice.pdf_blob:
+) -> Response:
+    row = (
+        await session.execute(
+            select(Invoice.organization_id, Invoice.number, Invoice.pdf_checksum, Invoice.pdf_content_type).where(
+                Invoice.id == invoice_id
+            )
+        )
+    ).first()
+    # Outsiders get the same 404 as a missing invoice, so ids reveal nothing.
+    if not row or Permission.ORG_ACCESS not in (await load_grants(session, current_user.id)).org(row.organization_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF unavailable")
+    if not row.pdf_checksum or not pdf_store.exists(row.pdf_checksum):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF unavailable")
-    return Message(message=invoice.pdf_checksum or "missing")
+    # Stored files never change, so the checksum is a strong validator for caches and If-Range.
+    etag = f'"{row.pdf_checksum}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(
+        pdf_store.path_for(row.pdf_checksum),
+        media_type=row.pdf_content_type or "application/pdf",
+        filename=f"invoice-{row.number or invoice_id}.pdf",
+        content_disposition_type="inline",
+        headers=headers,
+    )
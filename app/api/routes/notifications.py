@@ -1,21 +1,47 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset, page
 from app.models.notification import Notification
-from app.schemas.common import Message
-from app.schemas.notification import NotificationOut
+from app.schemas.common import Message, Page
+from app.schemas.notification import NotificationCount, NotificationMarkRead, NotificationOut
+from app.services.notifications import count_unread, mark_many_read
 
 router = APIRouter(prefix="/notifications")
 
 
-@router.get("/", response_model=list[NotificationOut])
+@router.get("/", response_model=Page[NotificationOut])
 async def list_notifications(
-    session: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
-):
-    result = await session.scalars(select(Notification).where(Notification.user_id == current_user.id))
-    return list(result)
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    unread: bool = False,
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> Page[NotificationOut]:
+    stmt = select(Notification).where(Notification.user_id == current_user.id)
+    if unread:
+        stmt = stmt.where(Notification.read.is_(False))
+    stmt = keyset(stmt, Notification.created_at, Notification.id, cursor, limit, descending=True)
+    items, next_cursor = page(list(await session.scalars(stmt)), limit)
+    return Page(items=[NotificationOut.model_validate(item) for item in items], next_cursor=next_cursor)
+
+
+@router.get("/unread-count", response_model=NotificationCount)
+async def unread_count(
+    session: AsyncSession = Depends(get_read_db), current_user=Depends(get_current_user)
+) -> NotificationCount:
+    return NotificationCount(count=await count_unread(session, current_user.id))
+
+
+@router.post("/read", response_model=NotificationCount)
+async def mark_many(
+    payload: NotificationMarkRead,
+    session: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> NotificationCount:
+    return NotificationCount(count=await mark_many_read(session, current_user.id, payload.ids))
 
 
 @router.post("/{notification_id}/read", response_model=Message)
@@ -24,9 +50,8 @@ async def mark_read(
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> Message:
-    notification = await session.get(Notification, notification_id)
-    if not notification or notification.user_id != current_user.id:
-        return Message(message="not found")
-    notification.read = True
-    await session.commit()
+    if not await mark_many_read(session, current_user.id, [notification_id]):
+        notification = await session.get(Notification, notification_id)
+        if not notification or notification.user_id != current_user.id:
+            return Message(message="not found")
     return Message(message="ok")
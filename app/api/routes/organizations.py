@@ -1,20 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset, page
 from app.models.core import GlobalRole, OrgMembership, Organization
-from app.schemas.common import Message
+from app.schemas.common import Message, Page
 from app.schemas.organization import OrganizationCreate, OrganizationOut
+from app.services.authorization import Permission, load_grants
 
 router = APIRouter(prefix="/organizations")
 
 
-def ensure_owner(role: GlobalRole) -> None:
-    if role not in {GlobalRole.OWNER, GlobalRole.ADMIN}:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
-
-
 @router.post("/", response_model=OrganizationOut)
 async def create_organization(
     payload: OrganizationCreate,
@@ -30,10 +27,21 @@ async def create_organization(
     return organization
 
 
-@router.get("/", response_model=list[OrganizationOut])
-async def list_organizations(session: AsyncSession = Depends(get_db)) -> list[OrganizationOut]:
-    result = await session.scalars(select(Organization))
-    return list(result)
+@router.get("/", response_model=Page[OrganizationOut])
+async def list_organizations(
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    name: str | None = Query(None, min_length=1, description="Name prefix"),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[OrganizationOut]:
+    stmt = select(
+        Organization.id, Organization.name, Organization.e_invoicing_required_at, Organization.created_at
+    )
+    if name:
+        stmt = stmt.where(Organization.name.startswith(name, autoescape=True))
+    rows = (await session.execute(keyset(stmt, Organization.created_at, Organization.id, cursor, limit))).all()
+    items, next_cursor = page(rows, limit)
+    return Page(items=[OrganizationOut.model_validate(row._mapping) for row in items], next_cursor=next_cursor)
 
 
 @router.delete("/{org_id}", response_model=Message)
@@ -42,12 +50,11 @@ async def delete_org(
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> Message:
-    membership = await session.scalar(
-        select(OrgMembership).where(OrgMembership.organization_id == org_id, OrgMembership.user_id == current_user.id)
-    )
-    if not membership:
+    granted = (await load_grants(session, current_user.id)).org(org_id)
+    if not granted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Membership not found")
-    ensure_owner(membership.role)
+    if Permission.ORG_MANAGE not in granted:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
     organization = await session.get(Organization, org_id)
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
@@ -1,30 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.models.core import OrgMembership, Organization
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset, page
 from app.models.project import Project, ProjectMembership, ProjectRole, Sprint
-from app.schemas.project import ProjectCreate, ProjectOut, ProjectMembershipOut, SprintCreate, SprintOut
+from app.schemas.common import ActivityOut, Page
+from app.schemas.project import (
+    BoardOut,
+    ProjectCreate,
+    ProjectMembershipOut,
+    ProjectOut,
+    SprintBurndownOut,
+    SprintCreate,
+    SprintOut,
+)
+from app.services.authorization import Permission, ensure_project_access, load_grants
+from app.services.activity import activity_page
+from app.services.board import load_board
+from app.services.burndown import sprint_burndown
+from app.services.export import MEDIA_TYPES, ExportFormat, ExportResource, stream_export
 
 router = APIRouter(prefix="/projects")
 
 
-def ensure_org_access(session: AsyncSession, org_id: int, user_id: int) -> None:
-    # To be extended with finer RBAC
-    pass
-
-
 @router.post("/", response_model=ProjectOut)
 async def create_project(
     payload: ProjectCreate,
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> ProjectOut:
-    org_membership = await session.scalar(
-        select(OrgMembership).where(OrgMembership.organization_id == payload.organization_id, OrgMembership.user_id == current_user.id)
-    )
-    if not org_membership:
+    grants = await load_grants(session, current_user.id)
+    if Permission.ORG_ACCESS not in grants.org(payload.organization_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not in organization")
     project = Project(**payload.model_dump())
     session.add(project)
@@ -35,9 +43,22 @@ async def create_project(
     return project
 
 
-@router.get("/", response_model=list[ProjectOut])
-async def list_projects(session: AsyncSession = Depends(get_db)) -> list[ProjectOut]:
-    return list(await session.scalars(select(Project)))
+@router.get("/", response_model=Page[ProjectOut])
+async def list_projects(
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    organization_id: int | None = None,
+    name: str | None = Query(None, min_length=1, description="Name prefix"),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[ProjectOut]:
+    stmt = select(Project.id, Project.name, Project.description, Project.created_at)
+    if organization_id is not None:
+        stmt = stmt.where(Project.organization_id == organization_id)
+    if name:
+        stmt = stmt.where(Project.name.startswith(name, autoescape=True))
+    rows = (await session.execute(keyset(stmt, Project.created_at, Project.id, cursor, limit))).all()
+    items, next_cursor = page(rows, limit)
+    return Page(items=[ProjectOut.model_validate(row._mapping) for row in items], next_cursor=next_cursor)
 
 
 @router.post("/{project_id}/members", response_model=ProjectMembershipOut)
@@ -48,10 +69,8 @@ async def add_member(
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> ProjectMembershipOut:
-    owner = await session.scalar(
-        select(ProjectMembership).where(ProjectMembership.project_id == project_id, ProjectMembership.user_id == current_user.id)
-    )
-    if not owner or owner.role not in {ProjectRole.PROJECT_OWNER, ProjectRole.MAINTAINER}:
+    grants = await load_grants(session, current_user.id)
+    if Permission.MEMBER_MANAGE not in grants.project(project_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     membership = ProjectMembership(project_id=project_id, user_id=user_id, role=role)
     session.add(membership)
@@ -74,3 +93,59 @@ async def create_sprint(
     await session.commit()
     await session.refresh(sprint)
     return sprint
+
+
+@router.get("/{project_id}/sprints/{sprint_id}/burndown", response_model=SprintBurndownOut)
+async def get_sprint_burndown(
+    project_id: int,
+    sprint_id: int,
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> SprintBurndownOut:
+    await ensure_project_access(session, current_user.id, project_id)
+    sprint = await session.get(Sprint, sprint_id)
+    if not sprint or sprint.project_id != project_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sprint not found")
+    return await sprint_burndown(session, sprint)
+
+
+@router.get("/{project_id}/board", response_model=BoardOut)
+async def get_board(
+    project_id: int,
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> BoardOut:
+    await ensure_project_access(session, current_user.id, project_id)
+    board = await load_board(session, project_id)
+    if board is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    return board
+
+
+@router.get("/{project_id}/activity", response_model=Page[ActivityOut])
+async def project_activity(
+    project_id: int,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> Page[ActivityOut]:
+    await ensure_project_access(session, current_user.id, project_id)
+    return await activity_page(session, project_id, cursor, limit)
+
+
+@router.get("/{project_id}/export")
+async def export_project(
+    project_id: int,
+    resource: ExportResource = "tickets",
+    format: ExportFormat = "ndjson",
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> StreamingResponse:
+    await ensure_project_access(session, current_user.id, project_id)
+    filename = f"project-{project_id}-{resource}.{format}"
+    return StreamingResponse(
+        stream_export(session, project_id, resource, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
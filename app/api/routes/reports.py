@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_read_db
+from app.schemas.report import TimeReportOut, TimeReportRow
+from app.services.authorization import Permission, load_grants
+from app.services.time_reports import ReportGroup, time_report
+
+router = APIRouter(prefix="/reports")
+
+
+@router.get("/time", response_model=TimeReportOut)
+async def tracked_time(
+    group_by: ReportGroup = "project",
+    start: date | None = None,
+    end: date | None = None,
+    project_id: int | None = None,
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> TimeReportOut:
+    end = end or date.today()
+    start = start or end - timedelta(days=30)
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end must not be before start")
+    project_ids = (await load_grants(session, current_user.id)).project_ids(Permission.PROJECT_READ)
+    if project_id is not None:
+        if project_id not in project_ids:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No project access")
+        project_ids = [project_id]
+    rows = await time_report(session, project_ids, group_by, start, end) if project_ids else []
+    return TimeReportOut(
+        group_by=group_by,
+        start=start,
+        end=end,
+        rows=[TimeReportRow(key=key, seconds=seconds) for key, seconds in rows],
+    )
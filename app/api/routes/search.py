@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_read_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.schemas.search import SearchPage
+from app.services.authorization import Permission, load_grants
+from app.services.search import MAX_OFFSET, search
+
+router = APIRouter(prefix="/search")
+
+
+@router.get("/", response_model=SearchPage)
+async def search_tickets(
+    q: str = Query(..., min_length=1, max_length=200),
+    project_id: int | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_OFFSET),
+    session: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> SearchPage:
+    project_ids = (await load_grants(session, current_user.id)).project_ids(Permission.PROJECT_READ)
+    if project_id is not None:
+        if project_id not in project_ids:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No project access")
+        project_ids = [project_id]
+    return await search(session, project_ids, q, limit, offset)
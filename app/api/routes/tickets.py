@@ -1,35 +1,41 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps import get_current_user, get_db
 from app.models.kanban import KanbanColumn
-from app.models.notification import Event
-from app.models.project import ProjectMembership, ProjectRole
-from app.models.ticket import Ticket, TicketComment
+from app.models.ticket import Ticket, TicketComment, TicketTimeSegment
 from app.schemas.ticket import (
     CommentBase,
     CommentOut,
+    TicketBatch,
+    TicketBatchResult,
     TicketCreate,
     TicketMove,
     TicketOut,
     TicketTimeSegmentOut,
+    TicketTimeTotal,
 )
+from app.services.authorization import Permission, ensure_project_access
+from app.services.board import bump_board_version
+from app.services.burndown import record_sprint_changes
+from app.services.events import record_event
+from app.services.ranking import append_rank, rank_for_move
+from app.services.ticket_batch import apply_ticket_batch
 from app.services.time_tracking import start_timer, stop_timer
 
 router = APIRouter(prefix="/tickets")
 
 
-async def ensure_project_access(
-    session: AsyncSession, project_id: int, user_id: int, min_role: ProjectRole | None = None
-) -> None:
-    membership = await session.scalar(
-        select(ProjectMembership).where(ProjectMembership.project_id == project_id, ProjectMembership.user_id == user_id)
+def _version_conflict(ticket: Ticket) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "message": "Ticket was modified concurrently",
+            "ticket": TicketOut.model_validate(ticket, from_attributes=True).model_dump(mode="json"),
+        },
     )
-    if not membership:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No project access")
-    if min_role and membership.role not in {min_role, ProjectRole.PROJECT_OWNER, ProjectRole.MAINTAINER}:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
 
 
 @router.post("/", response_model=TicketOut)
@@ -38,19 +44,32 @@ async def create_ticket(
     session: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> TicketOut:
-    await ensure_project_access(session, payload.project_id, current_user.id)
+    await ensure_project_access(session, current_user.id, payload.project_id, Permission.TICKET_WRITE)
     column = await session.get(KanbanColumn, payload.column_id)
     if not column:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid column")
-    ticket = Ticket(**payload.model_dump())
+    ticket = Ticket(**payload.model_dump(), rank=await append_rank(session, payload.column_id))
     session.add(ticket)
     await session.flush()
-    session.add(Event(ticket_id=ticket.id, action="created", actor_id=current_user.id))
+    await record_event(
+        session, ticket_id=ticket.id, project_id=ticket.project_id, action="created", actor_id=current_user.id
+    )
+    await record_sprint_changes(session, [(ticket.sprint_id, ticket.estimation_minutes, None, column.name == "DONE")])
+    await bump_board_version(session, [ticket.project_id])
     await session.commit()
     await session.refresh(ticket)
     return TicketOut.model_validate(ticket, from_attributes=True)
 
 
+@router.post("/batch", response_model=TicketBatchResult)
+async def batch_tickets(
+    payload: TicketBatch,
+    session: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> TicketBatchResult:
+    return await apply_ticket_batch(session, current_user.id, payload)
+
+
 @router.post("/{ticket_id}/move", response_model=TicketOut)
 async def move_ticket(
     ticket_id: int,
@@ -61,17 +80,43 @@ async def move_ticket(
     ticket = await session.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
-    await ensure_project_access(session, ticket.project_id, current_user.id)
+    await ensure_project_access(session, current_user.id, ticket.project_id, Permission.TICKET_WRITE)
+    if payload.expected_version is not None and payload.expected_version != ticket.version:
+        raise _version_conflict(ticket)
     new_column = await session.get(KanbanColumn, payload.column_id)
     if not new_column:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid column")
+    rank = await rank_for_move(session, ticket.id, payload.column_id, payload.before_id, payload.after_id)
+    if rank is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid neighbours")
+    if ticket.sprint_id is not None:
+        old_column = await session.get(KanbanColumn, ticket.column_id)
+        change = (ticket.sprint_id, ticket.estimation_minutes, old_column.name == "DONE", new_column.name == "DONE")
+        await record_sprint_changes(session, [change])
     ticket.column_id = payload.column_id
-    await session.flush()
+    ticket.rank = rank
+    try:
+        await session.flush()
+    except StaleDataError:
+        # Another writer committed between our read and this conditional UPDATE.
+        await session.rollback()
+        current = await session.get(Ticket, ticket_id, populate_existing=True)
+        if not current:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
+        raise _version_conflict(current)
     if new_column.name == "IN_PROGRESS":
         await start_timer(ticket, session)
     elif new_column.name == "DONE":
         await stop_timer(ticket, session)
-    session.add(Event(ticket_id=ticket.id, action="moved", actor_id=current_user.id, details=str(payload.column_id)))
+    await record_event(
+        session,
+        ticket_id=ticket.id,
+        project_id=ticket.project_id,
+        action="moved",
+        actor_id=current_user.id,
+        details=str(payload.column_id),
+    )
+    await bump_board_version(session, [ticket.project_id])
     await session.commit()
     await session.refresh(ticket)
     return TicketOut.model_validate(ticket, from_attributes=True)
@@ -87,7 +132,7 @@ async def add_comment(
     ticket = await session.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
-    await ensure_project_access(session, ticket.project_id, current_user.id)
+    await ensure_project_access(session, current_user.id, ticket.project_id, Permission.TICKET_WRITE)
     comment = TicketComment(ticket_id=ticket_id, author_id=current_user.id, body=payload.body)
     session.add(comment)
     await session.commit()
@@ -100,5 +145,30 @@ async def list_time_segments(ticket_id: int, session: AsyncSession = Depends(get
     ticket = await session.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
-    await ensure_project_access(session, ticket.project_id, current_user.id)
-    return ticket.time_segments
+    await ensure_project_access(session, current_user.id, ticket.project_id)
+    result = await session.scalars(
+        select(TicketTimeSegment).where(TicketTimeSegment.ticket_id == ticket_id).order_by(TicketTimeSegment.started_at)
+    )
+    return list(result)
+
+
+@router.get("/{ticket_id}/time/total", response_model=TicketTimeTotal)
+async def time_total(
+    ticket_id: int, session: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
+) -> TicketTimeTotal:
+    row = (
+        await session.execute(
+            select(Ticket.project_id, Ticket.total_tracked_seconds, TicketTimeSegment.started_at)
+            .outerjoin(
+                TicketTimeSegment,
+                (TicketTimeSegment.ticket_id == Ticket.id) & TicketTimeSegment.ended_at.is_(None),
+            )
+            .where(Ticket.id == ticket_id)
+        )
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
+    await ensure_project_access(session, current_user.id, row.project_id)
+    return TicketTimeTotal(
+        ticket_id=ticket_id, total_tracked_seconds=row.total_tracked_seconds, running_since=row.started_at
+    )
@@ -0,0 +1,59 @@
+"""Maintenance commands, run with ``mael <command>`` or ``python -m app.cli <command>``."""
+
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.services.notifications import purge_read_notifications
+from app.services.ranking import rebalance_ranks
+from app.services.time_reports import rebuild_rollups
+
+
+async def _purge_notifications(args: argparse.Namespace) -> None:
+    cutoff = datetime.utcnow() - timedelta(days=args.days)
+    async for session in get_session():
+        purged = await purge_read_notifications(session, cutoff, batch_size=args.batch_size)
+    print(f"purged {purged} read notifications older than {cutoff:%Y-%m-%d}")
+
+
+async def _rebalance_ranks(args: argparse.Namespace) -> None:
+    async for session in get_session():
+        columns = await rebalance_ranks(session, args.max_length)
+    print(f"rebalanced {columns} columns")
+
+
+async def _rebuild_time_rollups(args: argparse.Namespace) -> None:
+    async for session in get_session():
+        segments = await rebuild_rollups(session, args.since, batch_size=args.batch_size)
+    print(f"rebuilt time rollups from {segments} segments")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mael")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    purge = commands.add_parser("purge-notifications", help="Delete old read notifications in batches")
+    purge.add_argument("--days", type=int, default=settings.notification_retention_days)
+    purge.add_argument("--batch-size", type=int, default=1000)
+    purge.set_defaults(handler=_purge_notifications)
+
+    rebalance = commands.add_parser("rebalance-ranks", help="Renumber columns whose ticket ranks grew too long")
+    rebalance.add_argument("--max-length", type=int, default=settings.rank_max_length)
+    rebalance.set_defaults(handler=_rebalance_ranks)
+
+    rollups = commands.add_parser("rebuild-time-rollups", help="Recompute daily tracked-time rollups")
+    rollups.add_argument("--since", type=date.fromisoformat, default=None, help="First day to rebuild (YYYY-MM-DD)")
+    rollups.add_argument("--batch-size", type=int, default=1000)
+    rollups.set_defaults(handler=_rebuild_time_rollups)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
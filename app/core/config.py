@@ -13,14 +13,47 @@ class Settings(BaseSettings):
 
     app_name: str = "Mael"
     database_url: str = Field(default="sqlite+aiosqlite:///:memory:", alias="DATABASE_URL")
+    database_read_url: str | None = Field(default=None, alias="DATABASE_READ_URL")
+    read_your_writes_seconds: int = Field(default=5, alias="READ_YOUR_WRITES_SECONDS")
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_statement_cache_size: int = Field(default=100, alias="DB_STATEMENT_CACHE_SIZE")
     firebase_project_id: str = Field(default="local-test-project", alias="FIREBASE_PROJECT_ID")
     firebase_credentials_path: str | None = Field(default=None, alias="FIREBASE_CREDENTIALS_PATH")
+    firebase_certs_url: str = Field(
+        default="https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com",
+        alias="FIREBASE_CERTS_URL",
+    )
+    firebase_certs_timeout_seconds: float = Field(default=2.0, alias="FIREBASE_CERTS_TIMEOUT_SECONDS")
+    firebase_certs_failure_threshold: int = Field(default=3, alias="FIREBASE_CERTS_FAILURE_THRESHOLD")
+    firebase_certs_reset_seconds: float = Field(default=30.0, alias="FIREBASE_CERTS_RESET_SECONDS")
     app_base_url: str = Field(default="http://localhost:8000", alias="APP_BASE_URL")
     cors_origins: str = Field(default="*", alias="CORS_ORIGINS")
     smtp_host: str | None = Field(default=None, alias="SMTP_HOST")
     smtp_port: int | None = Field(default=None, alias="SMTP_PORT")
     smtp_user: str | None = Field(default=None, alias="SMTP_USER")
     smtp_password: str | None = Field(default=None, alias="SMTP_PASSWORD")
+    token_cache_size: int = Field(default=4096, alias="TOKEN_CACHE_SIZE")
+    identity_cache_size: int = Field(default=4096, alias="IDENTITY_CACHE_SIZE")
+    identity_cache_ttl_seconds: float = Field(default=300.0, alias="IDENTITY_CACHE_TTL_SECONDS")
+    rbac_cache_size: int = Field(default=4096, alias="RBAC_CACHE_SIZE")
+    rbac_cache_ttl_seconds: float = Field(default=300.0, alias="RBAC_CACHE_TTL_SECONDS")
+    notification_retention_days: int = Field(default=90, alias="NOTIFICATION_RETENTION_DAYS")
+    agenda_max_window_days: int = Field(default=92, alias="AGENDA_MAX_WINDOW_DAYS")
+    board_cache_size: int = Field(default=512, alias="BOARD_CACHE_SIZE")
+    rank_max_length: int = Field(default=24, alias="RANK_MAX_LENGTH")
+    event_sink_enabled: bool = Field(default=False, alias="EVENT_SINK_ENABLED")
+    event_sink_batch_size: int = Field(default=500, alias="EVENT_SINK_BATCH_SIZE")
+    event_sink_flush_seconds: float = Field(default=1.0, alias="EVENT_SINK_FLUSH_SECONDS")
+    event_sink_max_pending: int = Field(default=10000, alias="EVENT_SINK_MAX_PENDING")
+    event_sink_backpressure_seconds: float = Field(default=0.5, alias="EVENT_SINK_BACKPRESSURE_SECONDS")
+    pdf_render_workers: int = Field(default=2, alias="PDF_RENDER_WORKERS")
+    pdf_render_timeout_seconds: float = Field(default=30.0, alias="PDF_RENDER_TIMEOUT_SECONDS")
+    pdf_render_queue_timeout_seconds: float = Field(default=10.0, alias="PDF_RENDER_QUEUE_TIMEOUT_SECONDS")
+    pdf_store_path: str = Field(default="var/pdfs", alias="PDF_STORE_PATH")
     security_headers: SecurityHeaders = SecurityHeaders()
 
 
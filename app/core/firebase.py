@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from typing import Any, Callable
+
+import httpx
+import jwt
+from cryptography import x509
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+class KeysUnavailableError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+
+
+def _parse_certificates(certs: dict[str, str]) -> dict[str, Any]:
+    return {kid: x509.load_pem_x509_certificate(pem.encode()).public_key() for kid, pem in certs.items()}
+
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens without blocking the event loop.
+
+    Google's signing certificates are held in memory and refreshed in the background
+    shortly before the ``Cache-Control: max-age`` of the last response runs out. When
+    the key endpoint keeps failing the circuit breaker opens, and requests are answered
+    from the last known keys instead of waiting on the network.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        certs_url: str,
+        http_client: httpx.AsyncClient | None = None,
+        fetch_timeout: float = 2.0,
+        refresh_margin: float = 60.0,
+        min_refresh_interval: float = 30.0,
+        breaker: CircuitBreaker | None = None,
+        clock_skew_seconds: int = 30,
+    ) -> None:
+        self.project_id = project_id
+        self.certs_url = certs_url
+        self.fetch_timeout = fetch_timeout
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self.clock_skew_seconds = clock_skew_seconds
+        self.breaker = breaker or CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+        self._client = http_client or httpx.AsyncClient()
+        self._keys: dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+        if header.get("alg") != "RS256":
+            raise InvalidTokenError("Unexpected signing algorithm")
+        kid = header.get("kid")
+        key = self._keys.get(kid) if kid else None
+        if key is None:
+            # An unknown kid usually means Google rotated its keys; refetch, but rate-limited.
+            await self._ensure_keys(force=time.time() - self._fetched_at > self.min_refresh_interval)
+            key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise InvalidTokenError("Unknown signing key")
+        try:
+            claims = await asyncio.to_thread(
+                jwt.decode,
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=f"https://securetoken.google.com/{self.project_id}",
+                leeway=self.clock_skew_seconds,
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.PyJWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+        if not claims["sub"] or len(claims["sub"]) > 128:
+            raise InvalidTokenError("Invalid subject")
+        claims["uid"] = claims["sub"]
+        return claims
+
+    async def _ensure_keys(self, force: bool = False) -> None:
+        if self._keys and not force and time.time() < self._expires_at:
+            return
+        async with self._refresh_lock:
+            if self._keys and not force and time.time() < self._expires_at:
+                return
+            await self.refresh()
+        if not self._keys:
+            raise KeysUnavailableError("No signing keys available")
+
+    async def refresh(self) -> None:
+        if not self.breaker.allow():
+            return
+        try:
+            response = await self._client.get(self.certs_url, timeout=self.fetch_timeout)
+            response.raise_for_status()
+            keys = await asyncio.to_thread(_parse_certificates, response.json())
+        except Exception as exc:
+            self.breaker.record_failure()
+            logger.warning("Failed to fetch Firebase signing keys: %s", exc)
+            return
+        self.breaker.record_success()
+        self._keys = keys
+        self._fetched_at = time.time()
+        match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else 3600
+        self._expires_at = time.time() + max_age
+        self._schedule_refresh(max(max_age - self.refresh_margin, 1.0))
+
+    def _schedule_refresh(self, delay: float) -> None:
+        current = self._refresh_task
+        if current and not current.done() and current is not asyncio.current_task():
+            current.cancel()
+        self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_later(delay))
+
+    async def _refresh_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        async with self._refresh_lock:
+            await self.refresh()
+        if time.time() >= self._expires_at:
+            # Refresh failed: keep serving the last keys and try again shortly.
+            self._schedule_refresh(min(self.breaker.reset_timeout, 60.0))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keys": len(self._keys),
+            "expires_in": max(self._expires_at - time.time(), 0.0),
+            "breaker_state": self.breaker.state,
+            "breaker_failures": self.breaker.failures,
+        }
+
+    async def aclose(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+        await self._client.aclose()
+
+
+_verifier: FirebaseTokenVerifier | None = None
+
+
+def get_token_verifier() -> FirebaseTokenVerifier:
+    global _verifier
+
+    if _verifier is None:
+        _verifier = FirebaseTokenVerifier(
+            settings.firebase_project_id,
+            certs_url=settings.firebase_certs_url,
+            fetch_timeout=settings.firebase_certs_timeout_seconds,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.firebase_certs_failure_threshold,
+                reset_timeout=settings.firebase_certs_reset_seconds,
+            ),
+        )
+    return _verifier
+
+
+def verifier_stats() -> dict[str, Any]:
+    return _verifier.stats() if _verifier else {}
+
+
+metrics.register("firebase_keys", verifier_stats)
+
+
+async def close_token_verifier() -> None:
+    global _verifier
+
+    if _verifier is not None:
+        await _verifier.aclose()
+        _verifier = None
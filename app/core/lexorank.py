@@ -0,0 +1,47 @@
+"""Lexicographic fractional ranks.
+
+Ranks are base-36 strings compared as plain strings, so a new rank can always be found
+between two neighbours without touching any other row. Generated ranks never end in
+``"0"``, which keeps room below every rank.
+"""
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """Return a rank strictly between ``before`` and ``after`` (``None`` means unbounded)."""
+    low = before or ""
+    high = after
+    if high is not None and low >= high:
+        raise ValueError(f"Invalid rank interval {before!r} .. {after!r}")
+    digits: list[str] = []
+    index = 0
+    while True:
+        low_digit = DIGITS.index(low[index]) if index < len(low) else 0
+        high_digit = DIGITS.index(high[index]) if high is not None and index < len(high) else BASE
+        if high_digit - low_digit > 1:
+            digits.append(DIGITS[(low_digit + high_digit) // 2])
+            return "".join(digits)
+        digits.append(DIGITS[low_digit])
+        if high_digit - low_digit == 1:
+            # The prefix is now below ``high``; only ``low`` still constrains the next digits.
+            high = None
+        index += 1
+
+
+def spread_ranks(count: int) -> list[str]:
+    """Return ``count`` evenly spaced short ranks, used to (re)number a whole column."""
+    width = 1
+    while BASE**width < (count + 1) * BASE:
+        width += 1
+    step = BASE**width // (count + 1)
+    ranks = []
+    for position in range(1, count + 1):
+        value = position * step
+        encoded = ""
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            encoded = DIGITS[digit] + encoded
+        ranks.append(encoded.rstrip("0"))
+    return ranks
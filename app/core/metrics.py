@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register(name: str, provider: Callable[[], dict[str, Any]]) -> None:
+    _providers[name] = provider
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    return {name: provider() for name, provider in _providers.items()}
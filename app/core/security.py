@@ -4,6 +4,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from app.core.config import settings
+from app.db.routing import ReadYourWritesMiddleware
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -25,3 +26,4 @@ def apply_middlewares(app: FastAPI) -> None:
         allow_headers=["*"],
     )
     app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(ReadYourWritesMiddleware)
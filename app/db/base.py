@@ -1,4 +1,4 @@
-from app.models import agenda, billing, core, email, kanban, notification, project, ticket
+from app.models import agenda, billing, core, email, kanban, notification, project, search, ticket
 
 __all__ = [
     "agenda",
@@ -8,5 +8,6 @@ __all__ = [
     "kanban",
     "notification",
     "project",
+    "search",
     "ticket",
 ]
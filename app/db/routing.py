@@ -0,0 +1,38 @@
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+
+PRIMARY_COOKIE = "mael_primary_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pins a client to the primary database for a short while after it writes.
+
+    Replicas lag behind the primary, so a client that just created or changed something
+    would otherwise not see it on its next read.
+    """
+
+    async def dispatch(self, request, call_next):  # type: ignore[override]
+        response: Response = await call_next(request)
+        if settings.database_read_url and request.method not in SAFE_METHODS and response.status_code < 400:
+            until = int(time.time()) + settings.read_your_writes_seconds
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                str(until),
+                max_age=settings.read_your_writes_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+
+def wants_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
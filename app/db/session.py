@@ -1,7 +1,12 @@
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core import metrics
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, pool_stats
 
 
 class Base(DeclarativeBase):
@@ -10,17 +15,65 @@ class Base(DeclarativeBase):
 
 _engine: AsyncEngine | None = None
 SessionLocal: async_sessionmaker[AsyncSession] | None = None
+_read_engine: AsyncEngine | None = None
+ReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+
+def engine_options(database_url: str) -> dict[str, Any]:
+    url = make_url(database_url)
+    options: dict[str, Any] = {"echo": False, "pool_pre_ping": settings.db_pool_pre_ping}
+    if url.get_backend_name() == "sqlite":
+        # SQLite keeps SQLAlchemy's defaults: StaticPool for memory databases, NullPool for files.
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        }
+    return options
 
 
 def get_engine():
     global _engine, SessionLocal
 
     if _engine is None:
-        _engine = create_async_engine(settings.database_url, echo=False)
+        _engine = create_async_engine(settings.database_url, **engine_options(settings.database_url))
         SessionLocal = async_sessionmaker(bind=_engine, expire_on_commit=False, class_=AsyncSession)
     return _engine
 
 
+def get_read_engine():
+    global _read_engine, ReadSessionLocal
+
+    if not settings.database_read_url:
+        return get_engine()
+    if _read_engine is None:
+        _read_engine = create_async_engine(
+            settings.database_read_url, **engine_options(settings.database_read_url)
+        )
+        ReadSessionLocal = async_sessionmaker(bind=_read_engine, expire_on_commit=False, class_=AsyncSession)
+    return _read_engine
+
+
+def engine_stats() -> dict[str, Any]:
+    return pool_stats(_engine.pool) if _engine is not None else {}
+
+
+def read_engine_stats() -> dict[str, Any]:
+    return pool_stats(_read_engine.pool) if _read_engine is not None else {}
+
+
+metrics.register("db_pool", engine_stats)
+metrics.register("db_read_pool", read_engine_stats)
+
+
 async def get_session() -> AsyncSession:
     if SessionLocal is None:
         get_engine()
@@ -29,3 +82,18 @@ async def get_session() -> AsyncSession:
 
     async with SessionLocal() as session:
         yield session
+
+
+async def get_read_session() -> AsyncSession:
+    if not settings.database_read_url:
+        async for session in get_session():
+            yield session
+        return
+
+    if ReadSessionLocal is None:
+        get_read_engine()
+
+    assert ReadSessionLocal is not None
+
+    async with ReadSessionLocal() as session:
+        yield session
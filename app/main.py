@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
 from fastapi import FastAPI
 
 from app.api import routes
+from app.core import metrics
+from app.core.config import settings
+from app.core.firebase import close_token_verifier
 from app.core.logging import setup_logging
 from app.core.security import apply_middlewares
+from app.db import session as db_session
+from app.services.events import start_event_sink, stop_event_sink
+from app.services.pdf_renderer import pdf_renderer
 
 setup_logging()
-app = FastAPI(title="Mael API", version="1.0.0")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.event_sink_enabled:
+        db_session.get_engine()
+        start_event_sink(db_session.SessionLocal)
+    yield
+    await stop_event_sink()
+    await pdf_renderer.shutdown()
+    await close_token_verifier()
+
+
+app = FastAPI(title="Mael API", version="1.0.0", lifespan=lifespan)
 apply_middlewares(app)
 app.include_router(routes.api_router)
 
@@ -15,3 +37,8 @@ app.include_router(routes.api_router)
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/health/metrics")
+async def health_metrics() -> dict[str, dict[str, Any]]:
+    return metrics.snapshot()
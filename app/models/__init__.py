@@ -1,15 +1,17 @@
 from app.models.agenda import AgendaEvent, AgendaEventType
-from app.models.billing import Invoice, InvoiceLine, InvoiceStatus, Quote, QuoteLine, QuoteStatus
+from app.models.billing import DocumentSequence, Invoice, InvoiceLine, InvoiceStatus, Quote, QuoteLine, QuoteStatus
 from app.models.core import GlobalRole, OrgMembership, Organization, User
 from app.models.email import EmailOutbox, EmailStatus
 from app.models.kanban import KanbanColumn
 from app.models.notification import Event, Notification, NotificationPreference, NotificationChannel
-from app.models.project import Project, ProjectMembership, ProjectRole, Sprint
-from app.models.ticket import Priority, Ticket, TicketComment, TicketTimeSegment
+from app.models.project import Project, ProjectMembership, ProjectRole, Sprint, SprintDailySnapshot
+from app.models.ticket import Priority, Ticket, TicketComment, TicketTimeRollup, TicketTimeSegment
+from app.models import search  # noqa: F401  (registers the full-text index DDL)
 
 __all__ = [
     "AgendaEvent",
     "AgendaEventType",
+    "DocumentSequence",
     "Invoice",
     "InvoiceLine",
     "InvoiceStatus",
@@ -31,8 +33,10 @@ __all__ = [
     "ProjectMembership",
     "ProjectRole",
     "Sprint",
+    "SprintDailySnapshot",
     "Priority",
     "Ticket",
     "TicketComment",
+    "TicketTimeRollup",
     "TicketTimeSegment",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as PgEnum, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum as PgEnum, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -17,6 +17,10 @@ class AgendaEventType(str, Enum):
 
 class AgendaEvent(Base):
     __tablename__ = "agenda_events"
+    __table_args__ = (
+        Index("ix_agenda_events_user_start", "user_id", "start_at"),
+        Index("ix_agenda_events_user_end", "user_id", "end_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, Enum as PgEnum, ForeignKey, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, Enum as PgEnum, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -23,10 +23,11 @@ class InvoiceStatus(str, Enum):
 
 class Quote(Base):
     __tablename__ = "quotes"
+    __table_args__ = (Index("uq_quotes_org_number", "organization_id", "number", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
-    number: Mapped[str | None] = mapped_column(String(50), unique=True)
+    number: Mapped[str | None] = mapped_column(String(50))
     title: Mapped[str] = mapped_column(String(255))
     status: Mapped[QuoteStatus] = mapped_column(PgEnum(QuoteStatus), default=QuoteStatus.DRAFT)
     valid_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -52,10 +53,11 @@ class QuoteLine(Base):
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (Index("uq_invoices_org_number", "organization_id", "number", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
-    number: Mapped[str | None] = mapped_column(String(50), unique=True)
+    number: Mapped[str | None] = mapped_column(String(50))
     status: Mapped[InvoiceStatus] = mapped_column(PgEnum(InvoiceStatus), default=InvoiceStatus.DRAFT)
     title: Mapped[str] = mapped_column(String(255))
     issue_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -63,7 +65,6 @@ class Invoice(Base):
     legal_mentions: Mapped[str | None] = mapped_column(Text())
     pdf_checksum: Mapped[str | None] = mapped_column(String(128))
     pdf_content_type: Mapped[str | None] = mapped_column(String(64))
-    pdf_blob: Mapped[bytes | None] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
     lines: Mapped[list[InvoiceLine]] = relationship(
@@ -81,3 +82,14 @@ class InvoiceLine(Base):
     unit_price: Mapped[float] = mapped_column(Numeric(10, 2))
 
     invoice: Mapped[Invoice] = relationship("Invoice", back_populates="lines")
+
+
+class DocumentSequence(Base):
+    """Last number handed out per organization, year and document type (``invoice``, ``quote``)."""
+
+    __tablename__ = "document_sequences"
+
+    organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    doc_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    last_value: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, Enum as PgEnum, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, Enum as PgEnum, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -18,6 +18,7 @@ class GlobalRole(str, Enum):
 
 class Organization(Base):
     __tablename__ = "organizations"
+    __table_args__ = (Index("ix_organizations_created_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -43,6 +44,10 @@ class User(Base):
 
 class OrgMembership(Base):
     __tablename__ = "org_memberships"
+    __table_args__ = (
+        Index("ix_org_memberships_org_user", "organization_id", "user_id"),
+        Index("ix_org_memberships_user_id", "user_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
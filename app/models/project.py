@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as PgEnum, ForeignKey, String
+from sqlalchemy import Date, DateTime, Enum as PgEnum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -19,12 +19,17 @@ class ProjectRole(str, Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_id", "created_at", "id"),
+        Index("ix_projects_org_created_id", "organization_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(500))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    board_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     organization: Mapped["Organization"] = relationship("Organization", back_populates="projects")
     memberships: Mapped[list[ProjectMembership]] = relationship(
@@ -39,6 +44,10 @@ class Project(Base):
 
 class ProjectMembership(Base):
     __tablename__ = "project_memberships"
+    __table_args__ = (
+        Index("ix_project_memberships_project_user", "project_id", "user_id"),
+        Index("ix_project_memberships_user_id", "user_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
@@ -61,3 +70,15 @@ class Sprint(Base):
 
     project: Mapped[Project] = relationship("Project", back_populates="sprints")
     tickets: Mapped[list["Ticket"]] = relationship("Ticket", back_populates="sprint")
+
+
+class SprintDailySnapshot(Base):
+    """Sprint burndown state at the end of each UTC day on which it changed."""
+
+    __tablename__ = "sprint_daily_snapshots"
+
+    sprint_id: Mapped[int] = mapped_column(ForeignKey("sprints.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    remaining_minutes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_minutes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_tickets: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
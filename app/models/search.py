@@ -0,0 +1,91 @@
+"""Full-text search index over ticket titles, descriptions and comment bodies.
+
+SQLite (tests, single node) keeps an FTS5 table filled by triggers; FTS rowids are
+``ticket.id * 2`` for tickets and ``comment.id * 2 + 1`` for comments so every trigger
+touches one row by rowid. Project scoping joins ``tickets`` at query time, so moving a
+ticket between projects needs no reindex. PostgreSQL uses generated ``tsvector`` columns
+with GIN indexes, which the database keeps current by itself. The statements are shared
+with the migration.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.models.ticket import TicketComment
+
+SQLITE_CREATE = [
+    (
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "body, kind UNINDEXED, ticket_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    ),
+    (
+        "CREATE TRIGGER search_tickets_ai AFTER INSERT ON tickets BEGIN "
+        "INSERT INTO search_index (rowid, body, kind, ticket_id) "
+        "VALUES (new.id * 2, new.title || ' ' || coalesce(new.description, ''), 'ticket', new.id); END"
+    ),
+    (
+        "CREATE TRIGGER search_tickets_au AFTER UPDATE OF title, description ON tickets BEGIN "
+        "UPDATE search_index SET body = new.title || ' ' || coalesce(new.description, '') "
+        "WHERE rowid = new.id * 2; END"
+    ),
+    (
+        "CREATE TRIGGER search_tickets_ad AFTER DELETE ON tickets BEGIN "
+        "DELETE FROM search_index WHERE rowid = old.id * 2; END"
+    ),
+    (
+        "CREATE TRIGGER search_comments_ai AFTER INSERT ON ticket_comments BEGIN "
+        "INSERT INTO search_index (rowid, body, kind, ticket_id) "
+        "VALUES (new.id * 2 + 1, new.body, 'comment', new.ticket_id); END"
+    ),
+    (
+        "CREATE TRIGGER search_comments_au AFTER UPDATE OF body ON ticket_comments BEGIN "
+        "UPDATE search_index SET body = new.body WHERE rowid = new.id * 2 + 1; END"
+    ),
+    (
+        "CREATE TRIGGER search_comments_ad AFTER DELETE ON ticket_comments BEGIN "
+        "DELETE FROM search_index WHERE rowid = old.id * 2 + 1; END"
+    ),
+]
+SQLITE_BACKFILL = [
+    (
+        "INSERT INTO search_index (rowid, body, kind, ticket_id) "
+        "SELECT id * 2, title || ' ' || coalesce(description, ''), 'ticket', id FROM tickets"
+    ),
+    (
+        "INSERT INTO search_index (rowid, body, kind, ticket_id) "
+        "SELECT id * 2 + 1, body, 'comment', ticket_id FROM ticket_comments"
+    ),
+]
+SQLITE_DROP = [
+    *(f"DROP TRIGGER IF EXISTS search_{table}_{op}" for table in ("tickets", "comments") for op in ("ai", "au", "ad")),
+    "DROP TABLE IF EXISTS search_index",
+]
+
+POSTGRES_CREATE = [
+    (
+        "ALTER TABLE tickets ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+    ),
+    "CREATE INDEX ix_tickets_search ON tickets USING gin (search_vector)",
+    (
+        "ALTER TABLE ticket_comments ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "to_tsvector('simple', coalesce(body, ''))) STORED"
+    ),
+    "CREATE INDEX ix_ticket_comments_search ON ticket_comments USING gin (search_vector)",
+]
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_ticket_comments_search",
+    "ALTER TABLE ticket_comments DROP COLUMN IF EXISTS search_vector",
+    "DROP INDEX IF EXISTS ix_tickets_search",
+    "ALTER TABLE tickets DROP COLUMN IF EXISTS search_vector",
+]
+
+# ``ticket_comments`` is created after ``tickets`` and dropped before it, so both tables exist here.
+for _statement in SQLITE_CREATE:
+    event.listen(TicketComment.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_CREATE:
+    event.listen(TicketComment.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_DROP:
+    event.listen(TicketComment.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_DROP:
+    event.listen(TicketComment.__table__, "before_drop", DDL(_statement).execute_if(dialect="postgresql"))
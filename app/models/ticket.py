@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
+from typing import Any, ClassVar
 
-from sqlalchemy import Column, DateTime, Enum as PgEnum, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import Column, Date, DateTime, Enum as PgEnum, ForeignKey, Index, Integer, String, Table, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -26,6 +27,10 @@ class Priority(str, Enum):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_project_id", "project_id"),
+        Index("ix_tickets_column_rank", "column_id", "rank"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
@@ -35,6 +40,9 @@ class Ticket(Base):
     description: Mapped[str | None] = mapped_column(Text())
     priority: Mapped[Priority] = mapped_column(PgEnum(Priority), default=Priority.MEDIUM)
     estimation_minutes: Mapped[int | None] = mapped_column(Integer)
+    rank: Mapped[str] = mapped_column(String(255), nullable=False)
+    total_tracked_seconds: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    version: Mapped[int] = mapped_column(Integer, server_default="1", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -49,9 +57,14 @@ class Ticket(Base):
         "TicketTimeSegment", back_populates="ticket", cascade="all, delete-orphan"
     )
 
+    # Every ORM UPDATE is conditional on the loaded version; counters maintained with Core
+    # statements (tracked time, rank rebalancing) deliberately leave it alone.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"version_id_col": version}
+
 
 class TicketComment(Base):
     __tablename__ = "ticket_comments"
+    __table_args__ = (Index("ix_ticket_comments_ticket_id", "ticket_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     ticket_id: Mapped[int] = mapped_column(ForeignKey("tickets.id", ondelete="CASCADE"))
@@ -65,10 +78,38 @@ class TicketComment(Base):
 
 class TicketTimeSegment(Base):
     __tablename__ = "ticket_time_segments"
+    __table_args__ = (
+        Index("ix_ticket_time_segments_ticket_id", "ticket_id"),
+        Index(
+            "uq_ticket_time_segments_open",
+            "ticket_id",
+            unique=True,
+            postgresql_where=text("ended_at IS NULL"),
+            sqlite_where=text("ended_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     ticket_id: Mapped[int] = mapped_column(ForeignKey("tickets.id", ondelete="CASCADE"))
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Set once the closed segment has been added to the daily rollups.
+    rolled_up: Mapped[bool] = mapped_column(default=False, server_default=text("false"))
 
     ticket: Mapped[Ticket] = relationship("Ticket", back_populates="time_segments")
+
+
+class TicketTimeRollup(Base):
+    """Tracked seconds per ticket and UTC day, with the ticket's project and sprint at closing time."""
+
+    __tablename__ = "ticket_time_rollups"
+    __table_args__ = (
+        Index("ix_ticket_time_rollups_project_day", "project_id", "day"),
+        Index("ix_ticket_time_rollups_sprint_day", "sprint_id", "day"),
+    )
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    ticket_id: Mapped[int] = mapped_column(ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True)
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
+    sprint_id: Mapped[int | None] = mapped_column(ForeignKey("sprints.id", ondelete="SET NULL"))
+    seconds: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -19,3 +19,16 @@ class AgendaEventOut(AgendaEventCreate):
     id: int
 
     model_config = {"from_attributes": True}
+
+
+class TimeSlot(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class FreeBusyOut(BaseModel):
+    start_at: datetime
+    end_at: datetime
+    user_ids: list[int]
+    busy: list[TimeSlot]
+    free: list[TimeSlot]
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+T = TypeVar("T")
+
 
 class ORMBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -16,3 +18,15 @@ class AuditEvent(ORMBase):
     action: str
     created_at: datetime
     details: Any | None = None
+
+
+class ActivityOut(AuditEvent):
+    id: int
+    ticket_id: int | None = None
+    actor_id: int | None = None
+    actor_name: str | None = None
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from pydantic import BaseModel, Field
+
 from app.schemas.common import ORMBase
 
 
@@ -10,3 +12,11 @@ class NotificationOut(ORMBase):
     body: str
     created_at: datetime
     read: bool
+
+
+class NotificationMarkRead(BaseModel):
+    ids: list[int] | None = Field(default=None, max_length=1000)
+
+
+class NotificationCount(BaseModel):
+    count: int
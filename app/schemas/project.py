@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 
 from app.models.project import ProjectRole
+from app.models.ticket import Priority
 
 
 class ProjectBase(BaseModel):
@@ -45,3 +46,43 @@ class SprintOut(SprintBase):
     project_id: int
 
     model_config = {"from_attributes": True}
+
+
+class BoardTicket(BaseModel):
+    id: int
+    title: str
+    rank: str
+    priority: Priority
+    sprint_id: int | None = None
+    estimation_minutes: int | None = None
+    assignee_ids: list[int] = []
+
+
+class BoardColumn(BaseModel):
+    id: int
+    name: str
+    position: int
+    tickets: list[BoardTicket] = []
+
+
+class BoardOut(BaseModel):
+    project_id: int
+    version: int
+    columns: list[BoardColumn]
+
+
+class SprintBurndownDay(BaseModel):
+    day: date
+    remaining_minutes: int
+    completed_minutes: int
+    completed_tickets: int
+    tracked_seconds: int
+
+
+class SprintBurndownOut(BaseModel):
+    sprint_id: int
+    start: date | None = None
+    end: date | None = None
+    capacity_minutes: int
+    tracked_seconds: int
+    days: list[SprintBurndownDay]
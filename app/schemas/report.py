@@ -0,0 +1,15 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class TimeReportRow(BaseModel):
+    key: int | date | None
+    seconds: int
+
+
+class TimeReportOut(BaseModel):
+    group_by: str
+    start: date
+    end: date
+    rows: list[TimeReportRow]
@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: Literal["ticket", "comment"]
+    ticket_id: int
+    comment_id: int | None = None
+    project_id: int
+    title: str
+    rank: float
+
+
+class SearchPage(BaseModel):
+    items: list[SearchHit]
+    next_offset: int | None = None
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.ticket import Priority
 
@@ -22,6 +22,9 @@ class TicketCreate(TicketBase):
 class TicketOut(TicketBase):
     id: int
     project_id: int
+    rank: str
+    total_tracked_seconds: int = 0
+    version: int = 1
     created_at: datetime
     updated_at: datetime
 
@@ -43,6 +46,9 @@ class CommentOut(CommentBase):
 
 class TicketMove(BaseModel):
     column_id: int
+    before_id: int | None = None
+    after_id: int | None = None
+    expected_version: int | None = None
 
 
 class TicketTimeSegmentOut(BaseModel):
@@ -52,3 +58,31 @@ class TicketTimeSegmentOut(BaseModel):
     ended_at: datetime | None
 
     model_config = {"from_attributes": True}
+
+
+class TicketBatchMove(BaseModel):
+    ticket_id: int
+    column_id: int
+    expected_version: int | None = None
+
+
+class TicketBatch(BaseModel):
+    create: list[TicketCreate] = Field(default_factory=list, max_length=500)
+    move: list[TicketBatchMove] = Field(default_factory=list, max_length=500)
+
+
+class TicketBatchItemResult(BaseModel):
+    index: int
+    ticket_id: int | None = None
+    error: str | None = None
+
+
+class TicketBatchResult(BaseModel):
+    created: list[TicketBatchItemResult]
+    moved: list[TicketBatchItemResult]
+
+
+class TicketTimeTotal(BaseModel):
+    ticket_id: int
+    total_tracked_seconds: int
+    running_since: datetime | None = None
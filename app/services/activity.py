@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import keyset, page
+from app.models.core import User
+from app.models.notification import Event
+from app.schemas.common import ActivityOut, Page
+
+
+async def activity_page(session: AsyncSession, project_id: int, cursor: str | None, limit: int) -> Page[ActivityOut]:
+    """Newest-first project events; actor names are resolved with one extra IN query per page."""
+    stmt = select(
+        Event.id, Event.ticket_id, Event.action, Event.actor_id, Event.details, Event.created_at
+    ).where(Event.project_id == project_id)
+    rows = (await session.execute(keyset(stmt, Event.created_at, Event.id, cursor, limit, descending=True))).all()
+    items, next_cursor = page(rows, limit)
+    actor_ids = {row.actor_id for row in items if row.actor_id is not None}
+    names: dict[int, str] = {}
+    if actor_ids:
+        names = dict((await session.execute(select(User.id, User.name).where(User.id.in_(actor_ids)))).all())
+    return Page(
+        items=[ActivityOut(**row._mapping, actor_name=names.get(row.actor_id)) for row in items],
+        next_cursor=next_cursor,
+    )
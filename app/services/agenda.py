@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import Select, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agenda import AgendaEvent, AgendaEventType
+from app.models.core import OrgMembership
+
+# Reminders are points in time and never block a slot.
+BLOCKING_TYPES = (AgendaEventType.MEETING, AgendaEventType.TASK)
+
+Interval = tuple[datetime, datetime]
+
+
+def as_utc(value: datetime) -> datetime:
+    """Naive timestamps are stored as UTC (``datetime.utcnow``); make every value comparable."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def overlapping(stmt: Select, start: datetime, end: datetime) -> Select:
+    """Restrict ``stmt`` to events intersecting ``[start, end)``.
+
+    ``end_at > start`` is the selective bound for current windows and is served by the
+    ``(user_id, end_at)`` index; ``start_at < end`` trims the remainder.
+    """
+    return stmt.where(AgendaEvent.end_at > start, AgendaEvent.start_at < end)
+
+
+async def has_conflict(session: AsyncSession, user_id: int, start: datetime, end: datetime) -> bool:
+    stmt = overlapping(
+        select(AgendaEvent.id).where(AgendaEvent.user_id == user_id, AgendaEvent.type.in_(BLOCKING_TYPES)),
+        start,
+        end,
+    )
+    return bool(await session.scalar(select(exists(stmt))))
+
+
+async def visible_user_ids(session: AsyncSession, org_ids: list[int], user_ids: Iterable[int]) -> set[int]:
+    """Return the subset of ``user_ids`` belonging to one of ``org_ids``."""
+    if not org_ids:
+        return set()
+    rows = await session.scalars(
+        select(OrgMembership.user_id)
+        .where(OrgMembership.user_id.in_(set(user_ids)), OrgMembership.organization_id.in_(org_ids))
+        .distinct()
+    )
+    return set(rows)
+
+
+def merge_intervals(intervals: Iterable[Interval], start: datetime, end: datetime) -> list[Interval]:
+    """Sweep ``intervals`` (sorted by start) once, clipping to the window and merging overlaps."""
+    merged: list[Interval] = []
+    for interval_start, interval_end in intervals:
+        interval_start, interval_end = max(interval_start, start), min(interval_end, end)
+        if interval_end <= interval_start:
+            continue
+        if merged and interval_start <= merged[-1][1]:
+            if interval_end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], interval_end)
+        else:
+            merged.append((interval_start, interval_end))
+    return merged
+
+
+def free_slots(busy: list[Interval], start: datetime, end: datetime) -> list[Interval]:
+    slots: list[Interval] = []
+    cursor = start
+    for busy_start, busy_end in busy:
+        if busy_start > cursor:
+            slots.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if cursor < end:
+        slots.append((cursor, end))
+    return slots
+
+
+async def busy_intervals(session: AsyncSession, user_ids: set[int], start: datetime, end: datetime) -> list[Interval]:
+    stmt = overlapping(
+        select(AgendaEvent.start_at, AgendaEvent.end_at).where(
+            AgendaEvent.user_id.in_(user_ids), AgendaEvent.type.in_(BLOCKING_TYPES)
+        ),
+        start,
+        end,
+    ).order_by(AgendaEvent.start_at)
+    rows = await session.execute(stmt)
+    return merge_intervals(((as_utc(row.start_at), as_utc(row.end_at)) for row in rows), as_utc(start), as_utc(end))
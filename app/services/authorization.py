@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntFlag, auto
+
+from fastapi import HTTPException, status
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.core import GlobalRole, OrgMembership, Organization
+from app.models.project import Project, ProjectMembership, ProjectRole
+
+
+class Permission(IntFlag):
+    NONE = 0
+    ORG_ACCESS = auto()
+    ORG_MANAGE = auto()
+    AGENDA_VIEW = auto()
+    PROJECT_READ = auto()
+    TICKET_WRITE = auto()
+    MEMBER_MANAGE = auto()
+
+
+ORG_ROLE_PERMISSIONS: dict[GlobalRole, Permission] = {
+    GlobalRole.OWNER: Permission.ORG_ACCESS | Permission.ORG_MANAGE | Permission.AGENDA_VIEW,
+    GlobalRole.ADMIN: Permission.ORG_ACCESS | Permission.ORG_MANAGE | Permission.AGENDA_VIEW,
+    GlobalRole.MEMBER: Permission.ORG_ACCESS | Permission.AGENDA_VIEW,
+    GlobalRole.CLIENT: Permission.ORG_ACCESS,
+}
+
+_PROJECT_MEMBER = Permission.PROJECT_READ | Permission.TICKET_WRITE
+PROJECT_ROLE_PERMISSIONS: dict[ProjectRole, Permission] = {
+    ProjectRole.PROJECT_OWNER: _PROJECT_MEMBER | Permission.MEMBER_MANAGE,
+    ProjectRole.MAINTAINER: _PROJECT_MEMBER | Permission.MEMBER_MANAGE,
+    ProjectRole.CONTRIBUTOR: _PROJECT_MEMBER,
+    ProjectRole.REPORTER: _PROJECT_MEMBER,
+    ProjectRole.VIEWER: _PROJECT_MEMBER,
+}
+
+
+@dataclass(frozen=True)
+class Grants:
+    user_id: int
+    orgs: dict[int, Permission]
+    projects: dict[int, Permission]
+
+    def org(self, org_id: int) -> Permission:
+        return self.orgs.get(org_id, Permission.NONE)
+
+    def project(self, project_id: int) -> Permission:
+        return self.projects.get(project_id, Permission.NONE)
+
+    def any_org(self) -> Permission:
+        mask = Permission.NONE
+        for permissions in self.orgs.values():
+            mask |= permissions
+        return mask
+
+    def org_ids(self, permission: Permission = Permission.ORG_ACCESS) -> list[int]:
+        return [org_id for org_id, mask in self.orgs.items() if permission in mask]
+
+    def project_ids(self, permission: Permission = Permission.PROJECT_READ) -> list[int]:
+        return [project_id for project_id, mask in self.projects.items() if permission in mask]
+
+
+grants_cache: LRUCache[int, Grants] = LRUCache(maxsize=settings.rbac_cache_size, ttl=settings.rbac_cache_ttl_seconds)
+metrics.register("rbac_cache", grants_cache.stats)
+
+
+async def load_grants(session: AsyncSession, user_id: int) -> Grants:
+    grants = grants_cache.get(user_id)
+    if grants is not None:
+        return grants
+    org_rows = await session.execute(
+        select(OrgMembership.organization_id, OrgMembership.role).where(OrgMembership.user_id == user_id)
+    )
+    project_rows = await session.execute(
+        select(ProjectMembership.project_id, ProjectMembership.role).where(ProjectMembership.user_id == user_id)
+    )
+    orgs: dict[int, Permission] = {}
+    for org_id, role in org_rows:
+        orgs[org_id] = orgs.get(org_id, Permission.NONE) | ORG_ROLE_PERMISSIONS[role]
+    projects: dict[int, Permission] = {}
+    for project_id, role in project_rows:
+        projects[project_id] = projects.get(project_id, Permission.NONE) | PROJECT_ROLE_PERMISSIONS[role]
+    grants = Grants(user_id=user_id, orgs=orgs, projects=projects)
+    grants_cache.set(user_id, grants)
+    return grants
+
+
+async def ensure_project_access(
+    session: AsyncSession,
+    user_id: int,
+    project_id: int,
+    permission: Permission = Permission.PROJECT_READ,
+    detail: str = "Insufficient role",
+) -> Grants:
+    grants = await load_grants(session, user_id)
+    granted = grants.project(project_id)
+    if not granted:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No project access")
+    if permission not in granted:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return grants
+
+
+# Membership rows changed in a session are collected at flush time and only evicted from the
+# cache once the transaction commits. Other workers rely on the cache TTL.
+_PENDING_KEY = "rbac_invalidate"
+_CLEAR_ALL = -1
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_membership_changes(session: Session, flush_context) -> None:
+    pending: set[int] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (OrgMembership, ProjectMembership)):
+            history = inspect(obj).attrs.user_id.history
+            pending.update(uid for uid in (obj.user_id, *history.deleted) if uid is not None)
+    if any(isinstance(obj, (Organization, Project)) for obj in session.deleted):
+        pending.add(_CLEAR_ALL)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_membership_changes(session: Session) -> None:
+    pending: set[int] = session.info.pop(_PENDING_KEY, set())
+    if _CLEAR_ALL in pending:
+        grants_cache.clear()
+        return
+    for user_id in pending:
+        grants_cache.pop(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_membership_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,53 +1,102 @@
 from __future__ import annotations
 
 from datetime import datetime
-from hashlib import sha256
 
-from fpdf import FPDF
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.billing import Invoice, InvoiceLine, InvoiceStatus, Quote, QuoteLine, QuoteStatus
+from app.db.upsert import dialect_insert
+from app.models.billing import DocumentSequence, Invoice, InvoiceLine, InvoiceStatus, Quote, QuoteLine, QuoteStatus
+from app.services.pdf_renderer import InvoiceDTO, InvoiceLineDTO, pdf_renderer
+from app.services.pdf_store import pdf_store
 
 
-async def next_document_number(session: AsyncSession, model: type[Invoice | Quote], org_id: int) -> str:
-    result = await session.execute(
-        select(model.number).where(model.organization_id == org_id, model.number.is_not(None)).order_by(model.number.desc())
+DOCUMENT_TYPES: dict[type[Invoice | Quote], str] = {Invoice: "invoice", Quote: "quote"}
+
+
+async def next_document_number(
+    session: AsyncSession, model: type[Invoice | Quote], org_id: int, year: int | None = None
+) -> str:
+    """Take the next ``YYYY-NNNN`` number of an organization's yearly sequence for ``model``.
+
+    One upsert increments the counter row and returns the new value. The row stays locked until
+    the caller's transaction ends, so concurrent issuers wait for each other instead of colliding,
+    and a rolled-back issue gives its number back. Commit promptly: every other issuer in the same
+    organization and year queues behind that lock.
+    """
+    year = year or datetime.utcnow().year
+    sequences = DocumentSequence.__table__
+    stmt = dialect_insert(session, sequences).values(
+        organization_id=org_id, year=year, doc_type=DOCUMENT_TYPES[model], last_value=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[sequences.c.organization_id, sequences.c.year, sequences.c.doc_type],
+        set_={"last_value": sequences.c.last_value + 1},
+    ).returning(sequences.c.last_value)
+    value = (await session.execute(stmt)).scalar_one()
+    return f"{year}-{value:04d}"
+
+
+async def invoice_dto(session: AsyncSession, invoice: Invoice) -> InvoiceDTO:
+    """Snapshot an invoice and its lines (loaded explicitly, in order) for a render worker."""
+    lines = await session.execute(
+        select(InvoiceLine.description, InvoiceLine.quantity, InvoiceLine.unit_price)
+        .where(InvoiceLine.invoice_id == invoice.id)
+        .order_by(InvoiceLine.id)
+    )
+    return InvoiceDTO(
+        number=invoice.number,
+        status=InvoiceStatus(invoice.status).value,
+        title=invoice.title,
+        lines=tuple(
+            InvoiceLineDTO(description=line.description, quantity=line.quantity, unit_price=str(line.unit_price))
+            for line in lines
+        ),
     )
-    last = result.scalars().first()
-    if last and "-" in last:
-        year, seq = last.split("-")
-        next_seq = int(seq) + 1
-    else:
-        year = datetime.utcnow().year
-        next_seq = 1
-    return f"{year}-{next_seq:04d}"
-
-
-def build_invoice_pdf(invoice: Invoice) -> bytes:
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    pdf.cell(200, 10, txt=f"Invoice {invoice.number}", ln=True, align="L")
-    pdf.cell(200, 10, txt=f"Status: {invoice.status}", ln=True, align="L")
-    pdf.cell(200, 10, txt=f"Title: {invoice.title}", ln=True, align="L")
-    for line in invoice.__dict__.get("lines", []) or []:
-        pdf.cell(200, 10, txt=f"{line.description} - {line.quantity} x {line.unit_price}", ln=True)
-    return bytes(pdf.output(dest="S"))
 
 
 async def issue_invoice(session: AsyncSession, invoice: Invoice) -> Invoice:
-    if invoice.locked:
+    """Number and lock ``invoice``, then render and store its PDF.
+
+    The number is committed before rendering so the sequence row lock only covers the upsert, not
+    the render (which may queue and run for ``PDF_RENDER_QUEUE_TIMEOUT + PDF_RENDER_TIMEOUT``).
+    If rendering fails the invoice stays issued without a PDF, and issuing it again only retries the
+    render, keeping its number. A concurrent issue of the same draft that loses the claim returns
+    the invoice as the winner left it.
+    """
+    if invoice.locked and invoice.pdf_checksum:
         return invoice
-    invoice.status = InvoiceStatus.ISSUED
-    invoice.issue_date = datetime.utcnow()
-    invoice.number = invoice.number or await next_document_number(session, Invoice, invoice.organization_id)
-    pdf_bytes = build_invoice_pdf(invoice)
-    invoice.pdf_blob = pdf_bytes
-    invoice.pdf_checksum = sha256(pdf_bytes).hexdigest()
+    if not invoice.locked:
+        issue_date = datetime.utcnow()
+        # Claim the draft atomically: only the caller that flips ``locked`` takes a number.
+        claimed = (
+            await session.execute(
+                update(Invoice)
+                .where(Invoice.id == invoice.id, Invoice.locked.is_(False))
+                .values(locked=True, status=InvoiceStatus.ISSUED, issue_date=issue_date)
+                .returning(Invoice.number)
+                .execution_options(synchronize_session=False)
+            )
+        ).first()
+        if claimed is None:
+            await session.refresh(invoice)
+            return invoice
+        if claimed.number is None:
+            number = await next_document_number(session, Invoice, invoice.organization_id, issue_date.year)
+            await session.execute(
+                update(Invoice)
+                .where(Invoice.id == invoice.id)
+                .values(number=number)
+                .execution_options(synchronize_session=False)
+            )
+        await session.refresh(invoice)
+    dto = await invoice_dto(session, invoice)
+    await session.commit()
+
+    pdf_bytes = await pdf_renderer.render(dto)
+    invoice.pdf_checksum = await pdf_store.put(pdf_bytes)
     invoice.pdf_content_type = "application/pdf"
-    invoice.locked = True
-    await session.flush()
+    await session.commit()
     return invoice
 
 
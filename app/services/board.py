@@ -0,0 +1,84 @@
+from typing import Iterable
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.kanban import KanbanColumn
+from app.models.project import Project
+from app.models.ticket import Ticket, ticket_assignees_table
+from app.schemas.project import BoardColumn, BoardOut, BoardTicket
+
+board_cache: LRUCache[int, BoardOut] = LRUCache(maxsize=settings.board_cache_size)
+metrics.register("board_cache", board_cache.stats)
+
+
+async def bump_board_version(session: AsyncSession, project_ids: Iterable[int]) -> None:
+    """Invalidate cached boards; call inside the transaction that changes the board."""
+    project_ids = set(project_ids)
+    if project_ids:
+        await session.execute(
+            update(Project)
+            .where(Project.id.in_(project_ids))
+            .values(board_version=Project.board_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def load_board(session: AsyncSession, project_id: int) -> BoardOut | None:
+    """Return the project's board, rebuilt only when ``board_version`` moved on.
+
+    The version is read before the board itself, so a concurrent write can only make the
+    cached snapshot newer than its version, never older.
+    """
+    version = await session.scalar(select(Project.board_version).where(Project.id == project_id))
+    if version is None:
+        return None
+    cached = board_cache.get(project_id)
+    if cached is not None and cached.version == version:
+        return cached
+
+    columns = {
+        row.id: BoardColumn(id=row.id, name=row.name, position=row.position)
+        for row in await session.execute(
+            select(KanbanColumn.id, KanbanColumn.name, KanbanColumn.position)
+            .where(KanbanColumn.project_id == project_id)
+            .order_by(KanbanColumn.position, KanbanColumn.id)
+        )
+    }
+    rows = await session.execute(
+        select(
+            Ticket.id,
+            Ticket.column_id,
+            Ticket.title,
+            Ticket.rank,
+            Ticket.priority,
+            Ticket.sprint_id,
+            Ticket.estimation_minutes,
+            ticket_assignees_table.c.user_id,
+        )
+        .outerjoin(ticket_assignees_table, ticket_assignees_table.c.ticket_id == Ticket.id)
+        .where(Ticket.project_id == project_id)
+        .order_by(Ticket.column_id, Ticket.rank, Ticket.id)
+    )
+    tickets: dict[int, BoardTicket] = {}
+    for row in rows:
+        ticket = tickets.get(row.id)
+        if ticket is None and row.column_id in columns:
+            ticket = tickets[row.id] = BoardTicket(
+                id=row.id,
+                title=row.title,
+                rank=row.rank,
+                priority=row.priority,
+                sprint_id=row.sprint_id,
+                estimation_minutes=row.estimation_minutes,
+            )
+            columns[row.column_id].tickets.append(ticket)
+        if ticket is not None and row.user_id is not None:
+            ticket.assignee_ids.append(row.user_id)
+
+    board = BoardOut(project_id=project_id, version=version, columns=list(columns.values()))
+    board_cache.set(project_id, board)
+    return board
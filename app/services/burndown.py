@@ -0,0 +1,152 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable
+
+from sqlalchemy import Date, Integer, bindparam, cast, func, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.upsert import dialect_insert
+from app.models.project import Sprint, SprintDailySnapshot
+from app.models.ticket import TicketTimeRollup
+from app.schemas.project import SprintBurndownDay, SprintBurndownOut
+from app.services.agenda import as_utc
+
+MAX_BURNDOWN_DAYS = 366
+
+# (sprint_id, estimation_minutes, was_done, is_done); ``was_done`` is None for a new ticket.
+SprintChange = tuple[int | None, int | None, bool | None, bool]
+
+
+def _upsert_statement(session: AsyncSession):
+    snapshots = SprintDailySnapshot.__table__
+    prior = snapshots.alias("prior")
+
+    def latest(column_name: str):
+        # Value from the sprint's most recent snapshot, so a new day starts where the last one ended.
+        column = prior.c[column_name]
+        return func.coalesce(
+            select(column)
+            .where(prior.c.sprint_id == bindparam("s_sprint_id"))
+            .order_by(prior.c.day.desc())
+            .limit(1)
+            .scalar_subquery(),
+            0,
+        )
+
+    deltas = {
+        "remaining_minutes": bindparam("d_remaining", type_=Integer),
+        "completed_minutes": bindparam("d_completed", type_=Integer),
+        "completed_tickets": bindparam("d_tickets", type_=Integer),
+    }
+    source = select(
+        bindparam("s_sprint_id", type_=Integer),
+        bindparam("s_day", type_=Date),
+        *(latest(name) + delta for name, delta in deltas.items()),
+    )
+    stmt = dialect_insert(session, snapshots).from_select(["sprint_id", "day", *deltas], source)
+    return stmt.on_conflict_do_update(
+        index_elements=[snapshots.c.sprint_id, snapshots.c.day],
+        set_={name: snapshots.c[name] + delta for name, delta in deltas.items()},
+    )
+
+
+async def record_sprint_changes(
+    session: AsyncSession, changes: Iterable[SprintChange], day: date | None = None
+) -> None:
+    """Fold ticket creations and moves into the current day's snapshot of each affected sprint.
+
+    One upsert row per sprint: a new day copies the latest snapshot plus the delta, an existing
+    day is adjusted in place, so concurrent moves never lose each other's updates.
+    """
+    deltas: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for sprint_id, minutes, was_done, is_done in changes:
+        if sprint_id is None:
+            continue
+        minutes = minutes or 0
+        delta = deltas[sprint_id]
+        if was_done is None:
+            delta[0] += 0 if is_done else minutes
+            if is_done:
+                delta[1] += minutes
+                delta[2] += 1
+        elif was_done != is_done:
+            sign = 1 if is_done else -1
+            delta[0] -= sign * minutes
+            delta[1] += sign * minutes
+            delta[2] += sign
+    day = day or datetime.now(timezone.utc).date()
+    rows = [
+        {"s_sprint_id": sprint_id, "s_day": day, "d_remaining": d[0], "d_completed": d[1], "d_tickets": d[2]}
+        for sprint_id, d in sorted(deltas.items())
+        if any(d)
+    ]
+    if rows:
+        await session.execute(_upsert_statement(session), rows)
+
+
+async def sprint_burndown(session: AsyncSession, sprint: Sprint) -> SprintBurndownOut:
+    """Daily remaining estimate and completions next to tracked time, from one UNION ALL query.
+
+    Days without a snapshot carry the previous day's values forward.
+    """
+    snapshots, rollups = SprintDailySnapshot, TicketTimeRollup
+    stmt = select(
+        snapshots.day,
+        snapshots.remaining_minutes,
+        snapshots.completed_minutes,
+        snapshots.completed_tickets,
+        literal(0).label("tracked_seconds"),
+    ).where(snapshots.sprint_id == sprint.id)
+    stmt = stmt.union_all(
+        select(
+            rollups.day,
+            cast(null(), Integer),
+            cast(null(), Integer),
+            cast(null(), Integer),
+            func.sum(rollups.seconds),
+        )
+        .where(rollups.sprint_id == sprint.id)
+        .group_by(rollups.day)
+    )
+    rows = (await session.execute(stmt)).all()
+
+    snapshot_by_day = {row[0]: row for row in rows if row[1] is not None}
+    tracked_by_day = {row[0]: int(row[4]) for row in rows if row[1] is None}
+    known_days = sorted({row[0] for row in rows})
+    start = as_utc(sprint.start_date).date() if sprint.start_date else (known_days[0] if known_days else None)
+    end = as_utc(sprint.end_date).date() if sprint.end_date else (known_days[-1] if known_days else start)
+    if start is None or end is None:
+        return SprintBurndownOut(sprint_id=sprint.id, capacity_minutes=0, tracked_seconds=0, days=[])
+    end = min(end, datetime.now(timezone.utc).date(), start + timedelta(days=MAX_BURNDOWN_DAYS - 1))
+
+    # Seed the running values with the last snapshot taken before the window opens.
+    current = (0, 0, 0)
+    for day in known_days:
+        if day >= start:
+            break
+        if day in snapshot_by_day:
+            current = tuple(snapshot_by_day[day][1:4])
+    days, day = [], start
+    while day <= end:
+        if day in snapshot_by_day:
+            current = tuple(snapshot_by_day[day][1:4])
+        remaining, completed_minutes, completed_tickets = current
+        days.append(
+            SprintBurndownDay(
+                day=day,
+                remaining_minutes=remaining,
+                completed_minutes=completed_minutes,
+                completed_tickets=completed_tickets,
+                tracked_seconds=tracked_by_day.get(day, 0),
+            )
+        )
+        day += timedelta(days=1)
+    remaining, completed_minutes, _ = current
+    return SprintBurndownOut(
+        sprint_id=sprint.id,
+        start=start,
+        end=end,
+        capacity_minutes=remaining + completed_minutes,
+        tracked_seconds=sum(tracked_by_day.values()),
+        days=days,
+    )
@@ -0,0 +1,220 @@
+"""Audit event recording with an optional buffered sink.
+
+By default events are inserted in the caller's transaction. With ``EVENT_SINK_ENABLED`` the
+records of a session are handed to :class:`EventSink` when that session commits (and dropped
+on rollback), then written in multi-row INSERTs by a background task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.notification import Event
+
+logger = get_logger(__name__)
+
+_PENDING_KEY = "pending_events"
+
+
+class EventSink:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: deque[dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self.flushed = 0
+        self.batches = 0
+        self.failures = 0
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-sink")
+
+    async def stop(self) -> None:
+        """Stop the background task and flush whatever is still buffered."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        if self._pending:
+            logger.error("event sink stopped with %d unwritten events", len(self._pending))
+
+    async def wait_for_capacity(self, timeout: float) -> bool:
+        """Block producers while the buffer is full; ``False`` once ``timeout`` expires."""
+        if len(self._pending) < self.max_pending:
+            return True
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+        except TimeoutError:
+            return False
+        return len(self._pending) < self.max_pending
+
+    def offer(self, records: list[dict[str, Any]]) -> None:
+        self._pending.extend(records)
+        if len(self._pending) >= self.max_pending:
+            self._drained.clear()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+            try:
+                await self._insert(batch)
+                unwritten: list[dict[str, Any]] = []
+            except IntegrityError:
+                # A row that can never be written (e.g. its ticket was deleted while it sat in the
+                # buffer) must not block the others: retry row by row and drop the offenders.
+                unwritten = await self._insert_one_by_one(batch)
+            except Exception:
+                logger.exception("event sink flush failed")
+                unwritten = batch
+            if unwritten:
+                # Keep the rest for the next tick; producers slow down once the buffer fills up.
+                self.failures += 1
+                self._pending.extendleft(reversed(unwritten))
+                logger.warning("event sink flush interrupted; %d events buffered", len(self._pending))
+            if len(self._pending) < self.max_pending:
+                self._drained.set()
+            if unwritten:
+                return
+            self.batches += 1
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as session:
+            await session.execute(insert(Event), rows)
+            await session.commit()
+        self.flushed += len(rows)
+
+    async def _insert_one_by_one(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert ``rows`` separately; return the ones left unwritten by a transient error."""
+        for index, row in enumerate(rows):
+            try:
+                await self._insert([row])
+            except IntegrityError:
+                self.dropped += 1
+                logger.exception("event sink dropped an event that cannot be written: %r", row)
+            except Exception:
+                logger.exception("event sink flush failed")
+                return rows[index:]
+        return []
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "failures": self.failures,
+            "dropped": self.dropped,
+        }
+
+
+event_sink: EventSink | None = None
+
+
+def sink_stats() -> dict[str, Any]:
+    return event_sink.stats() if event_sink is not None else {"running": False}
+
+
+metrics.register("event_sink", sink_stats)
+
+
+def start_event_sink(session_factory: Callable[[], AsyncSession]) -> EventSink:
+    global event_sink
+    event_sink = EventSink(
+        session_factory,
+        batch_size=settings.event_sink_batch_size,
+        flush_interval=settings.event_sink_flush_seconds,
+        max_pending=settings.event_sink_max_pending,
+    )
+    event_sink.start()
+    return event_sink
+
+
+async def stop_event_sink() -> None:
+    global event_sink
+    if event_sink is not None:
+        await event_sink.stop()
+        event_sink = None
+
+
+async def record_events(session: AsyncSession, records: list[dict[str, Any]]) -> None:
+    """Record ``Event`` rows as part of ``session``'s transaction.
+
+    Without a running sink, or when the sink stays full for longer than the backpressure
+    timeout, the rows are inserted inline.
+    """
+    if not records:
+        return
+    # Stamp at record time: buffered rows are written later, and the activity feed orders by created_at.
+    now = datetime.utcnow()
+    for record in records:
+        record.setdefault("created_at", now)
+    sink = event_sink
+    if sink is not None and sink.running and await sink.wait_for_capacity(settings.event_sink_backpressure_seconds):
+        # Make sure a transaction is open so its commit or rollback decides the records' fate.
+        await session.connection()
+        session.info.setdefault(_PENDING_KEY, []).extend(records)
+        return
+    await session.execute(insert(Event), records)
+
+
+async def record_event(session: AsyncSession, **fields: Any) -> None:
+    await record_events(session, [fields])
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_over_events(session: Session) -> None:
+    records = session.info.pop(_PENDING_KEY, None)
+    if not records:
+        return
+    if event_sink is not None:
+        event_sink.offer(records)
+    else:
+        logger.error("event sink stopped before %d committed events were handed over", len(records))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
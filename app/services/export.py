@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Literal
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Event
+from app.models.ticket import Ticket, TicketComment
+
+ExportResource = Literal["tickets", "comments", "events"]
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+BATCH_SIZE = 1000
+
+
+def export_statement(project_id: int, resource: ExportResource) -> Select:
+    """Column-only selects: rows never enter the identity map."""
+    if resource == "tickets":
+        return (
+            select(
+                Ticket.id,
+                Ticket.sprint_id,
+                Ticket.column_id,
+                Ticket.title,
+                Ticket.description,
+                Ticket.priority,
+                Ticket.estimation_minutes,
+                Ticket.created_at,
+                Ticket.updated_at,
+            )
+            .where(Ticket.project_id == project_id)
+            .order_by(Ticket.id)
+        )
+    if resource == "comments":
+        return (
+            select(
+                TicketComment.id,
+                TicketComment.ticket_id,
+                TicketComment.author_id,
+                TicketComment.body,
+                TicketComment.created_at,
+            )
+            .join(Ticket, Ticket.id == TicketComment.ticket_id)
+            .where(Ticket.project_id == project_id)
+            .order_by(TicketComment.id)
+        )
+    return (
+        select(Event.id, Event.ticket_id, Event.action, Event.actor_id, Event.details, Event.created_at)
+        .join(Ticket, Ticket.id == Event.ticket_id)
+        .where(Ticket.project_id == project_id)
+        .order_by(Event.id)
+    )
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def stream_export(
+    session: AsyncSession, project_id: int, resource: ExportResource, fmt: ExportFormat
+) -> AsyncIterator[str]:
+    """Yield the export one chunk per fetched batch, reading through a server-side cursor."""
+    stmt = export_statement(project_id, resource).execution_options(yield_per=BATCH_SIZE)
+    result = await session.stream(stmt)
+    keys = list(result.keys())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if fmt == "csv":
+        writer.writerow(keys)
+    async for rows in result.partitions():
+        for row in rows:
+            values = [_plain(value) for value in row]
+            if fmt == "csv":
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(keys, values)), ensure_ascii=False))
+                buffer.write("\n")
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core import metrics
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.core import OrgMembership, Organization, User
+
+user_cache: LRUCache[str, User] = LRUCache(
+    maxsize=settings.identity_cache_size, ttl=settings.identity_cache_ttl_seconds
+)
+metrics.register("identity_cache", user_cache.stats)
+
+
+def _snapshot(user: User) -> User:
+    # Cache a detached copy so that no request ever shares an instance owned by another session.
+    copy = User(
+        id=user.id,
+        firebase_uid=user.firebase_uid,
+        email=user.email,
+        name=user.name,
+        created_at=user.created_at,
+        is_active=user.is_active,
+    )
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def resolve_user(session: AsyncSession, firebase_uid: str, email: str, name: str | None) -> User:
+    """Load or create the user behind a verified token, through a per-process cache.
+
+    Email and name changes carried by the token refresh the row and the cache at once; other
+    user columns (e.g. ``is_active``) may be up to ``IDENTITY_CACHE_TTL_SECONDS`` stale.
+    """
+    cached = user_cache.get(firebase_uid)
+    if cached is not None and cached.email == email and cached.name == name:
+        return await session.merge(cached, load=False)
+
+    user = await session.scalar(select(User).where(User.firebase_uid == firebase_uid))
+    if user is None:
+        user = User(firebase_uid=firebase_uid, email=email, name=name)
+        session.add(user)
+        org = await session.scalar(select(Organization))
+        if org:
+            session.add(OrgMembership(organization_id=org.id, user=user))
+        await session.commit()
+        await session.refresh(user)
+    elif user.email != email or user.name != name:
+        user.email = email
+        user.name = name
+        await session.commit()
+    user_cache.set(firebase_uid, _snapshot(user))
+    return user
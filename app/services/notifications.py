@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Notification
+
+
+async def count_unread(session: AsyncSession, user_id: int) -> int:
+    stmt = select(func.count()).select_from(Notification).where(
+        Notification.user_id == user_id, Notification.read.is_(False)
+    )
+    return (await session.execute(stmt)).scalar_one()
+
+
+async def mark_many_read(session: AsyncSession, user_id: int, ids: list[int] | None = None) -> int:
+    """Mark the user's unread notifications (all of them, or only ``ids``) read in one UPDATE."""
+    stmt = (
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.read.is_(False))
+        .values(read=True)
+        .execution_options(synchronize_session=False)
+    )
+    if ids is not None:
+        stmt = stmt.where(Notification.id.in_(ids))
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount
+
+
+async def purge_read_notifications(session: AsyncSession, older_than: datetime, batch_size: int = 1000) -> int:
+    """Delete read notifications created before ``older_than``, committing every ``batch_size`` rows.
+
+    Short transactions keep row locks and WAL growth bounded while the inbox stays writable.
+    """
+    purged = 0
+    while True:
+        ids = list(
+            await session.scalars(
+                select(Notification.id)
+                .where(Notification.read.is_(True), Notification.created_at < older_than)
+                .order_by(Notification.created_at)
+                .limit(batch_size)
+            )
+        )
+        if not ids:
+            return purged
+        await session.execute(
+            delete(Notification).where(Notification.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        purged += len(ids)
@@ -0,0 +1,174 @@
+"""Invoice PDF rendering off the event loop.
+
+FPDF is CPU-bound, so documents are rendered in a ``spawn`` process pool from plain
+:class:`InvoiceDTO` values; workers never see ORM objects or sessions. A semaphore sized to
+the pool admits one job per worker, so callers waiting for a slot form a measurable queue
+instead of piling up inside the executor. ``PDF_RENDER_WORKERS=0`` renders in a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fpdf import FPDF
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PdfRenderError(RuntimeError):
+    """Rendering failed, timed out, or no worker slot freed up in time."""
+
+
+@dataclass(frozen=True, slots=True)
+class InvoiceLineDTO:
+    description: str
+    quantity: int
+    unit_price: str
+
+
+@dataclass(frozen=True, slots=True)
+class InvoiceDTO:
+    number: str | None
+    status: str
+    title: str
+    lines: tuple[InvoiceLineDTO, ...] = ()
+
+
+def render_invoice_pdf(invoice: InvoiceDTO) -> bytes:
+    """Runs in a worker process; module level so the pool pickles it by reference."""
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    pdf.cell(200, 10, txt=f"Invoice {invoice.number}", ln=True, align="L")
+    pdf.cell(200, 10, txt=f"Status: {invoice.status}", ln=True, align="L")
+    pdf.cell(200, 10, txt=f"Title: {invoice.title}", ln=True, align="L")
+    for line in invoice.lines:
+        pdf.cell(200, 10, txt=f"{line.description} - {line.quantity} x {line.unit_price}", ln=True)
+    return bytes(pdf.output(dest="S"))
+
+
+class PdfRenderer:
+    def __init__(self, max_workers: int = 2, render_timeout: float = 30.0, queue_timeout: float = 10.0) -> None:
+        self.max_workers = max_workers
+        self.render_timeout = render_timeout
+        self.queue_timeout = queue_timeout
+        self._executor: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.waiting = 0
+        self.running = 0
+        self.rendered = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.render_seconds_total = 0.0
+        self.render_seconds_max = 0.0
+
+    def _slots_for_loop(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots, self._loop = asyncio.Semaphore(max(self.max_workers, 1)), loop
+        return self._slots
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers:
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(self.max_workers, mp_context=context)
+            else:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix="pdf-render")
+        return self._executor
+
+    def _discard_pool(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self, slots: asyncio.Semaphore) -> None:
+        self.running -= 1
+        slots.release()
+
+    def _release_when_done(
+        self, loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore
+    ) -> Callable[[Future], None]:
+        def callback(_: Future) -> None:
+            # Runs on the executor's thread once the job has really ended.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._release, slots)
+
+        return callback
+
+    async def render(self, invoice: InvoiceDTO) -> bytes:
+        slots = self._slots_for_loop()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            raise PdfRenderError("No PDF worker available") from None
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        started = time.perf_counter()
+        job: Future | None = None
+        try:
+            job = self._pool().submit(render_invoice_pdf, invoice)
+            # The slot follows the job, not this coroutine: a job that outlives its timeout
+            # keeps its worker busy, so no other job may be admitted in its place.
+            job.add_done_callback(self._release_when_done(asyncio.get_running_loop(), slots))
+            pdf_bytes = await asyncio.wait_for(asyncio.wrap_future(job), self.render_timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            raise PdfRenderError("PDF rendering timed out") from None
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash): start a fresh pool for the next job.
+            self.failures += 1
+            self._discard_pool()
+            raise PdfRenderError("PDF worker crashed") from None
+        except Exception as exc:
+            self.failures += 1
+            logger.exception("invoice PDF rendering failed")
+            raise PdfRenderError("PDF rendering failed") from exc
+        finally:
+            if job is None:
+                self._release(slots)
+        elapsed = time.perf_counter() - started
+        self.rendered += 1
+        self.render_seconds_total += elapsed
+        self.render_seconds_max = max(self.render_seconds_max, elapsed)
+        return pdf_bytes
+
+    async def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "waiting": self.waiting,
+            "running": self.running,
+            "rendered": self.rendered,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "render_ms_avg": round(self.render_seconds_total / self.rendered * 1000, 3) if self.rendered else 0.0,
+            "render_ms_max": round(self.render_seconds_max * 1000, 3),
+        }
+
+
+pdf_renderer = PdfRenderer(
+    max_workers=settings.pdf_render_workers,
+    render_timeout=settings.pdf_render_timeout_seconds,
+    queue_timeout=settings.pdf_render_queue_timeout_seconds,
+)
+metrics.register("pdf_renderer", pdf_renderer.stats)
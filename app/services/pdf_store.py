@@ -0,0 +1,61 @@
+"""Content-addressed storage for generated PDFs.
+
+Files are named by their SHA-256 (``Invoice.pdf_checksum``) under ``PDF_STORE_PATH``, fanned
+out over two directory levels. Identical documents share one file, a stored file never
+changes, and writes go through a temporary file plus ``os.replace`` so readers never see a
+partial PDF. A file written for a transaction that later rolls back is simply unreferenced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+
+from app.core.config import settings
+
+_CHECKSUM = re.compile(r"[0-9a-f]{64}")
+
+
+class PdfStore:
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, checksum: str) -> Path:
+        if not _CHECKSUM.fullmatch(checksum):
+            raise ValueError(f"Invalid checksum {checksum!r}")
+        return self.root / checksum[:2] / checksum[2:4] / f"{checksum}.pdf"
+
+    def exists(self, checksum: str) -> bool:
+        return self.path_for(checksum).is_file()
+
+    def save(self, data: bytes) -> str:
+        """Store ``data`` if it is not there yet and return its checksum."""
+        checksum = sha256(data).hexdigest()
+        path = self.path_for(checksum)
+        if path.is_file():
+            return checksum
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return checksum
+
+    def load(self, checksum: str) -> bytes:
+        return self.path_for(checksum).read_bytes()
+
+    async def put(self, data: bytes) -> str:
+        return await asyncio.to_thread(self.save, data)
+
+
+pdf_store = PdfStore(settings.pdf_store_path)
@@ -0,0 +1,96 @@
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.lexorank import rank_between, spread_ranks
+from app.models.ticket import Ticket
+from app.services.board import bump_board_version
+
+# Renumbering is not an edit: keep ``updated_at`` instead of letting its onupdate fire.
+_tickets = Ticket.__table__
+_renumber = (
+    update(_tickets)
+    .where(_tickets.c.id == bindparam("ticket_id"))
+    .values(rank=bindparam("new_rank"), updated_at=_tickets.c.updated_at)
+)
+
+
+async def last_rank(session: AsyncSession, column_id: int) -> str | None:
+    return await session.scalar(select(func.max(Ticket.rank)).where(Ticket.column_id == column_id))
+
+
+async def append_rank(session: AsyncSession, column_id: int) -> str:
+    return rank_between(await last_rank(session, column_id), None)
+
+
+async def rank_for_move(
+    session: AsyncSession, ticket_id: int, column_id: int, before_id: int | None, after_id: int | None
+) -> str | None:
+    """Rank placing ``ticket_id`` between ``before_id`` (above) and ``after_id`` (below).
+
+    With a single neighbour the other side is the adjacent ticket in the column, found through
+    the ``(column_id, rank)`` index. Returns ``None`` when a neighbour is not in ``column_id``
+    or the neighbours are out of order. Concurrent appends can leave two tickets on the same
+    rank; placing a ticket between such twins respreads the column first.
+    """
+    if before_id is None and after_id is None:
+        return await append_rank(session, column_id)
+    neighbours = {
+        row.id: row
+        for row in await session.execute(
+            select(Ticket.id, Ticket.column_id, Ticket.rank).where(
+                Ticket.id.in_({before_id, after_id} - {None}), Ticket.id != ticket_id
+            )
+        )
+    }
+    before = neighbours.get(before_id) if before_id is not None else None
+    after = neighbours.get(after_id) if after_id is not None else None
+    if (before_id is not None and (before is None or before.column_id != column_id)) or (
+        after_id is not None and (after is None or after.column_id != column_id)
+    ):
+        return None
+    in_column = select(func.min(Ticket.rank)).where(Ticket.column_id == column_id, Ticket.id != ticket_id)
+    if after is None:
+        after_rank = await session.scalar(in_column.where(Ticket.rank > before.rank))
+        return rank_between(before.rank, after_rank)
+    if before is None:
+        before_rank = await session.scalar(
+            select(func.max(Ticket.rank)).where(
+                Ticket.column_id == column_id, Ticket.id != ticket_id, Ticket.rank < after.rank
+            )
+        )
+        return rank_between(before_rank, after.rank)
+    before_rank, after_rank = before.rank, after.rank
+    if before_rank == after_rank:
+        await respread_column(session, column_id)
+        ranks = dict(
+            (await session.execute(select(Ticket.id, Ticket.rank).where(Ticket.id.in_((before_id, after_id))))).all()
+        )
+        before_rank, after_rank = ranks[before_id], ranks[after_id]
+    if before_rank >= after_rank:
+        return None
+    return rank_between(before_rank, after_rank)
+
+
+async def respread_column(session: AsyncSession, column_id: int) -> None:
+    """Give a column evenly spaced ranks, keeping its board order (rank, then id)."""
+    ids = list(
+        await session.scalars(select(Ticket.id).where(Ticket.column_id == column_id).order_by(Ticket.rank, Ticket.id))
+    )
+    if ids:
+        await session.execute(
+            _renumber, [{"ticket_id": ticket_id, "new_rank": rank} for ticket_id, rank in zip(ids, spread_ranks(len(ids)))]
+        )
+
+
+async def rebalance_ranks(session: AsyncSession, max_length: int) -> int:
+    """Renumber every column holding a rank longer than ``max_length``; one commit per column."""
+    columns = list(
+        await session.execute(
+            select(Ticket.column_id, Ticket.project_id).where(func.length(Ticket.rank) > max_length).distinct()
+        )
+    )
+    for column_id, project_id in columns:
+        await respread_column(session, column_id)
+        await bump_board_version(session, [project_id])
+        await session.commit()
+    return len(columns)
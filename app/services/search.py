@@ -0,0 +1,69 @@
+import re
+from typing import Sequence
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.search import SearchHit, SearchPage
+
+MAX_TERMS = 8
+MAX_OFFSET = 1000
+
+# Matching rows come from the FTS table (SQLite) or the GIN-indexed tsvector columns (PostgreSQL);
+# tickets are joined only for the matches to fetch their title and project.
+_SQLITE_SEARCH = text(
+    """
+    SELECT search_index.kind AS kind,
+           search_index.ticket_id AS ticket_id,
+           CASE WHEN search_index.kind = 'comment' THEN search_index.rowid / 2 END AS comment_id,
+           tickets.project_id AS project_id,
+           tickets.title AS title,
+           -bm25(search_index) AS rank
+    FROM search_index JOIN tickets ON tickets.id = search_index.ticket_id
+    WHERE search_index MATCH :query AND tickets.project_id IN :project_ids
+    ORDER BY bm25(search_index), search_index.rowid
+    LIMIT :limit OFFSET :offset
+    """
+).bindparams(bindparam("project_ids", expanding=True))
+
+_POSTGRES_SEARCH = text(
+    """
+    SELECT * FROM (
+        SELECT 'ticket' AS kind, t.id AS ticket_id, NULL::integer AS comment_id, t.project_id, t.title,
+               ts_rank(t.search_vector, q.query) AS rank
+        FROM tickets t, to_tsquery('simple', :query) AS q(query)
+        WHERE t.search_vector @@ q.query AND t.project_id IN :project_ids
+        UNION ALL
+        SELECT 'comment', c.ticket_id, c.id, t.project_id, t.title, ts_rank(c.search_vector, q.query)
+        FROM ticket_comments c JOIN tickets t ON t.id = c.ticket_id, to_tsquery('simple', :query) AS q(query)
+        WHERE c.search_vector @@ q.query AND t.project_id IN :project_ids
+    ) AS hits
+    ORDER BY rank DESC, ticket_id, comment_id NULLS FIRST
+    LIMIT :limit OFFSET :offset
+    """
+).bindparams(bindparam("project_ids", expanding=True))
+
+
+def search_terms(query: str) -> list[str]:
+    """Word tokens of a user query; punctuation and operators are dropped so input never reaches the parser raw."""
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+async def search(
+    session: AsyncSession, project_ids: Sequence[int], query: str, limit: int, offset: int = 0
+) -> SearchPage:
+    """Rank ticket and comment matches for every term (as a prefix) within ``project_ids``."""
+    terms = search_terms(query)
+    if not terms or not project_ids:
+        return SearchPage(items=[])
+    if session.get_bind().dialect.name == "postgresql":
+        stmt, match = _POSTGRES_SEARCH, " & ".join(f"{term}:*" for term in terms)
+    else:
+        stmt, match = _SQLITE_SEARCH, " ".join(f'"{term}"*' for term in terms)
+    rows = (
+        await session.execute(
+            stmt, {"query": match, "project_ids": list(project_ids), "limit": limit + 1, "offset": offset}
+        )
+    ).all()
+    next_offset = offset + limit if len(rows) > limit and offset + limit <= MAX_OFFSET else None
+    return SearchPage(items=[SearchHit(**row._mapping) for row in rows[:limit]], next_offset=next_offset)
@@ -0,0 +1,138 @@
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.lexorank import rank_between
+from app.models.kanban import KanbanColumn
+from app.models.ticket import Ticket
+from app.schemas.ticket import TicketBatch, TicketBatchItemResult, TicketBatchResult
+from app.services.authorization import Permission, load_grants
+from app.services.board import bump_board_version
+from app.services.burndown import record_sprint_changes
+from app.services.events import record_events
+from app.services.ranking import last_rank
+from app.services.time_tracking import start_timers, stop_timers
+
+
+async def apply_ticket_batch(session: AsyncSession, user_id: int, batch: TicketBatch) -> TicketBatchResult:
+    """Validate and apply a batch of creates and moves in one transaction.
+
+    Columns, tickets and permissions are checked with one query each; invalid items are
+    reported and skipped while the rest are written with bulk INSERT/UPDATE statements.
+    """
+    grants = await load_grants(session, user_id)
+    tickets = {
+        row.id: row
+        for row in await session.execute(
+            select(
+                Ticket.id,
+                Ticket.project_id,
+                Ticket.column_id,
+                Ticket.sprint_id,
+                Ticket.estimation_minutes,
+                Ticket.version,
+            ).where(Ticket.id.in_({item.ticket_id for item in batch.move}))
+        )
+    }
+    # Current columns of moved tickets are loaded too: leaving DONE changes sprint burndown.
+    column_ids = {item.column_id for item in batch.create} | {item.column_id for item in batch.move}
+    column_ids |= {ticket.column_id for ticket in tickets.values()}
+    columns = {
+        row.id: row
+        for row in await session.execute(
+            select(KanbanColumn.id, KanbanColumn.project_id, KanbanColumn.name).where(KanbanColumn.id.in_(column_ids))
+        )
+    }
+
+    def check(project_id: int, column_id: int) -> str | None:
+        permissions = grants.project(project_id)
+        if not permissions:
+            return "No project access"
+        if Permission.TICKET_WRITE not in permissions:
+            return "Insufficient role"
+        column = columns.get(column_id)
+        if column is None or column.project_id != project_id:
+            return "Invalid column"
+        return None
+
+    created = [TicketBatchItemResult(index=index) for index in range(len(batch.create))]
+    new_rows, new_indexes, touched = [], [], set()
+    for index, item in enumerate(batch.create):
+        created[index].error = check(item.project_id, item.column_id)
+        if created[index].error is None:
+            new_rows.append(item.model_dump())
+            new_indexes.append(index)
+            touched.add(item.project_id)
+
+    moved = [TicketBatchItemResult(index=index, ticket_id=item.ticket_id) for index, item in enumerate(batch.move)]
+    updates, seen = [], set()
+    for index, item in enumerate(batch.move):
+        ticket = tickets.get(item.ticket_id)
+        if ticket is None:
+            moved[index].error = "Ticket not found"
+        elif item.ticket_id in seen:
+            moved[index].error = "Duplicate ticket"
+        elif item.expected_version is not None and item.expected_version != ticket.version:
+            moved[index].error = "Version conflict"
+        else:
+            moved[index].error = check(ticket.project_id, item.column_id)
+        if moved[index].error is None:
+            seen.add(item.ticket_id)
+            touched.add(tickets[item.ticket_id].project_id)
+            updates.append({"id": item.ticket_id, "column_id": item.column_id, "version": ticket.version})
+
+    # New and moved tickets are appended to their target column in request order.
+    tails: dict[int, str | None] = {}
+    for row in [*new_rows, *updates]:
+        column_id = row["column_id"]
+        if column_id not in tails:
+            tails[column_id] = await last_rank(session, column_id)
+        row["rank"] = tails[column_id] = rank_between(tails[column_id], None)
+
+    events = []
+    if new_rows:
+        new_ids = await session.scalars(insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True), new_rows)
+        for index, ticket_id in zip(new_indexes, new_ids):
+            created[index].ticket_id = ticket_id
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "project_id": batch.create[index].project_id,
+                    "action": "created",
+                    "actor_id": user_id,
+                    "details": None,
+                }
+            )
+    if updates:
+        try:
+            # Versioned bulk UPDATE: each row is conditional on the version read above.
+            await session.execute(update(Ticket), updates)
+        except StaleDataError:
+            await session.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Tickets were modified concurrently")
+        events.extend(
+            {
+                "ticket_id": row["id"],
+                "project_id": tickets[row["id"]].project_id,
+                "action": "moved",
+                "actor_id": user_id,
+                "details": str(row["column_id"]),
+            }
+            for row in updates
+        )
+        await start_timers(session, {row["id"] for row in updates if columns[row["column_id"]].name == "IN_PROGRESS"})
+        await stop_timers(session, {row["id"] for row in updates if columns[row["column_id"]].name == "DONE"})
+    done = {column.id for column in columns.values() if column.name == "DONE"}
+    sprint_changes = []
+    for index in new_indexes:
+        item = batch.create[index]
+        sprint_changes.append((item.sprint_id, item.estimation_minutes, None, item.column_id in done))
+    for row in updates:
+        ticket = tickets[row["id"]]
+        sprint_changes.append((ticket.sprint_id, ticket.estimation_minutes, ticket.column_id in done, row["column_id"] in done))
+    await record_sprint_changes(session, sprint_changes)
+    await record_events(session, events)
+    await bump_board_version(session, touched)
+    await session.commit()
+    return TicketBatchResult(created=created, moved=moved)
@@ -0,0 +1,130 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable, Iterator, Literal
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.upsert import dialect_insert
+from app.models.ticket import Ticket, TicketTimeRollup, TicketTimeSegment, ticket_assignees_table
+
+ReportGroup = Literal["project", "sprint", "assignee", "day"]
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def split_by_day(started_at: datetime, ended_at: datetime) -> Iterator[tuple[date, int]]:
+    """Yield ``(utc_day, seconds)`` for each UTC day the interval touches."""
+    start, end = _utc(started_at), _utc(ended_at)
+    while start < end:
+        midnight = datetime.combine(start.date() + timedelta(days=1), time(), tzinfo=timezone.utc)
+        chunk_end = min(midnight, end)
+        yield start.date(), int((chunk_end - start).total_seconds())
+        start = chunk_end
+
+
+async def _add_to_rollups(session: AsyncSession, seconds: dict[tuple[date, int], int]) -> None:
+    seconds = {key: value for key, value in seconds.items() if value > 0}
+    if not seconds:
+        return
+    tickets = {
+        row.id: row
+        for row in await session.execute(
+            select(Ticket.id, Ticket.project_id, Ticket.sprint_id).where(Ticket.id.in_({key[1] for key in seconds}))
+        )
+    }
+    rows = [
+        {
+            "day": day,
+            "ticket_id": ticket_id,
+            "project_id": tickets[ticket_id].project_id,
+            "sprint_id": tickets[ticket_id].sprint_id,
+            "seconds": value,
+        }
+        for (day, ticket_id), value in seconds.items()
+        if ticket_id in tickets
+    ]
+    rollups = TicketTimeRollup.__table__
+    stmt = dialect_insert(session, rollups)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[rollups.c.day, rollups.c.ticket_id],
+        set_={
+            "seconds": rollups.c.seconds + stmt.excluded.seconds,
+            "project_id": stmt.excluded.project_id,
+            "sprint_id": stmt.excluded.sprint_id,
+        },
+    )
+    await session.execute(stmt, rows)
+
+
+async def record_closed_segments(session: AsyncSession, segments: Iterable[Any]) -> None:
+    """Add closed segments (rows with ``ticket_id``, ``started_at``, ``ended_at``) to the daily rollups."""
+    seconds: dict[tuple[date, int], int] = defaultdict(int)
+    for segment in segments:
+        for day, value in split_by_day(segment.started_at, segment.ended_at):
+            seconds[(day, segment.ticket_id)] += value
+    await _add_to_rollups(session, seconds)
+
+
+async def rebuild_rollups(session: AsyncSession, since: date | None = None, batch_size: int = 1000) -> int:
+    """Recompute rollups from ``since`` (or from scratch) out of closed segments.
+
+    The rollups are cleared and the segments unmarked in one transaction; segments are then
+    folded back in id order, ``batch_size`` at a time, with one commit per batch. Segments that
+    ``stop_timers`` closes meanwhile are added and marked by it, so the rebuild skips them.
+    Returns the number of segments processed.
+    """
+    segments = TicketTimeSegment.__table__
+    stale = delete(TicketTimeRollup)
+    unmark = update(segments).where(segments.c.ended_at.is_not(None)).values(rolled_up=False)
+    if since is not None:
+        stale = stale.where(TicketTimeRollup.day >= since)
+        unmark = unmark.where(segments.c.ended_at >= datetime.combine(since, time()))
+    # Rollups first: a timer stopping concurrently then either is unmarked here or keeps its rollup.
+    await session.execute(stale)
+    await session.execute(unmark)
+    await session.commit()
+
+    stmt = select(segments.c.id, segments.c.ticket_id, segments.c.started_at, segments.c.ended_at)
+    stmt = stmt.where(segments.c.ended_at.is_not(None), segments.c.rolled_up.is_(False))
+    if since is not None:
+        stmt = stmt.where(segments.c.ended_at >= datetime.combine(since, time()))
+    processed, last_id = 0, 0
+    while True:
+        batch = (await session.execute(stmt.where(segments.c.id > last_id).order_by(segments.c.id).limit(batch_size))).all()
+        if not batch:
+            return processed
+        seconds: dict[tuple[date, int], int] = defaultdict(int)
+        for segment in batch:
+            for day, value in split_by_day(segment.started_at, segment.ended_at):
+                if since is None or day >= since:
+                    seconds[(day, segment.ticket_id)] += value
+        await _add_to_rollups(session, seconds)
+        await session.execute(
+            update(segments).where(segments.c.id.in_([segment.id for segment in batch])).values(rolled_up=True)
+        )
+        await session.commit()
+        processed += len(batch)
+        last_id = batch[-1].id
+
+
+async def time_report(
+    session: AsyncSession, project_ids: list[int], group_by: ReportGroup, start: date, end: date
+) -> list[tuple[Any, int]]:
+    rollup = TicketTimeRollup
+    if group_by == "assignee":
+        key = ticket_assignees_table.c.user_id
+        stmt = select(key, func.sum(rollup.seconds)).outerjoin(
+            ticket_assignees_table, ticket_assignees_table.c.ticket_id == rollup.ticket_id
+        )
+    else:
+        key = {"project": rollup.project_id, "sprint": rollup.sprint_id, "day": rollup.day}[group_by]
+        stmt = select(key, func.sum(rollup.seconds))
+    stmt = (
+        stmt.where(rollup.project_id.in_(project_ids), rollup.day >= start, rollup.day <= end)
+        .group_by(key)
+        .order_by(key)
+    )
+    return [(row[0], int(row[1])) for row in await session.execute(stmt)]
@@ -1,30 +1,76 @@
 from datetime import datetime
+from typing import Sequence
 
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, update
 
+from app.db.upsert import dialect_insert
 from app.models.ticket import Ticket, TicketTimeSegment
+from app.services.time_reports import record_closed_segments
 
+_tickets = Ticket.__table__
+_add_tracked = (
+    update(_tickets)
+    .where(_tickets.c.id == bindparam("ticket_id"))
+    .values(total_tracked_seconds=_tickets.c.total_tracked_seconds + bindparam("seconds"))
+)
 
-async def start_timer(ticket: Ticket, session: AsyncSession) -> None:
-    result = await session.scalars(
-        select(TicketTimeSegment).where(TicketTimeSegment.ticket_id == ticket.id)
+
+def _insert_open_segments(session: AsyncSession):
+    # The partial unique index on open segments turns a concurrent second start into a no-op.
+    return dialect_insert(session, TicketTimeSegment).on_conflict_do_nothing(
+        index_elements=[TicketTimeSegment.ticket_id], index_where=TicketTimeSegment.ended_at.is_(None)
     )
-    existing = list(result)
-    if any(segment.ended_at is None for segment in existing):
-        return
 
-    segment = TicketTimeSegment(ticket_id=ticket.id, started_at=datetime.utcnow())
-    session.add(segment)
-    await session.flush()
 
+async def start_timer(ticket: Ticket, session: AsyncSession) -> None:
+    await start_timers(session, {ticket.id})
+
+
+async def stop_timer(ticket: Ticket, session: AsyncSession) -> Sequence[Row]:
+    return await stop_timers(session, {ticket.id})
 
-async def stop_timer(ticket: Ticket, session: AsyncSession) -> None:
-    result = await session.scalars(
-        select(TicketTimeSegment).where(TicketTimeSegment.ticket_id == ticket.id)
+
+async def start_timers(session: AsyncSession, ticket_ids: set[int]) -> None:
+    """Open a segment for every ticket in ``ticket_ids`` that has none open, in one INSERT."""
+    if not ticket_ids:
+        return
+    now = datetime.utcnow()
+    await session.execute(
+        _insert_open_segments(session), [{"ticket_id": ticket_id, "started_at": now} for ticket_id in sorted(ticket_ids)]
     )
-    segments = list(result)
-    for segment in segments:
-        if segment.ended_at is None:
-            segment.ended_at = datetime.utcnow()
-    await session.flush()
+
+
+async def stop_timers(session: AsyncSession, ticket_ids: set[int]) -> Sequence[Row]:
+    """Close the open segments of ``ticket_ids`` and add their durations to the ticket totals
+    and the daily rollups.
+
+    Returns the closed segments as ``(id, ticket_id, started_at, ended_at)`` rows.
+    """
+    if not ticket_ids:
+        return []
+    closed = (
+        await session.execute(
+            update(TicketTimeSegment)
+            .where(TicketTimeSegment.ticket_id.in_(ticket_ids), TicketTimeSegment.ended_at.is_(None))
+            .values(ended_at=datetime.utcnow(), rolled_up=True)
+            .returning(
+                TicketTimeSegment.id,
+                TicketTimeSegment.ticket_id,
+                TicketTimeSegment.started_at,
+                TicketTimeSegment.ended_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+    if closed:
+        await session.execute(
+            _add_tracked,
+            [
+                {"ticket_id": row.ticket_id, "seconds": int((row.ended_at - row.started_at).total_seconds())}
+                for row in closed
+            ],
+        )
+        await record_closed_segments(session, closed)
+    return closed
@@ -13,9 +13,10 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 from app.db.session import Base
 from app.main import app
+from app.services.pdf_store import pdf_store
 
 
 @pytest.fixture(scope="session")
@@ -25,6 +26,12 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def pdf_store_root(tmp_path_factory):
+    pdf_store.root = tmp_path_factory.mktemp("pdfs")
+    return pdf_store.root
+
+
 @pytest.fixture(scope="session")
 def test_engine(event_loop):
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
@@ -65,6 +72,7 @@ def client(session_factory, monkeypatch):
             yield session
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_read_db] = _get_db_override
     os.environ["FIREBASE_EMULATED_UID"] = "test-user"
     with TestClient(app) as c:
         yield c
@@ -0,0 +1,33 @@
+from app.models.kanban import KanbanColumn
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_project_activity_feed_pages_newest_first(client, db_session, event_loop):
+    me = client.get("/api/v1/me", headers=HEADERS).json()
+    org_id = client.post("/api/v1/organizations/", json={"name": "FeedOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "FeedProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _columns():
+        columns = [KanbanColumn(project_id=project_id, name="TO_DO"), KanbanColumn(project_id=project_id, name="DONE")]
+        db_session.add_all(columns)
+        await db_session.commit()
+        return [column.id for column in columns]
+
+    to_do, done = event_loop.run_until_complete(_columns())
+    ticket_id = client.post(
+        "/api/v1/tickets/", json={"project_id": project_id, "title": "Feed", "column_id": to_do}, headers=HEADERS
+    ).json()["id"]
+    client.post(f"/api/v1/tickets/{ticket_id}/move", json={"column_id": done}, headers=HEADERS)
+    batch = {"create": [{"project_id": project_id, "title": "Feed2", "column_id": to_do}]}
+    client.post("/api/v1/tickets/batch", json=batch, headers=HEADERS)
+
+    url = f"/api/v1/projects/{project_id}/activity"
+    first = client.get(url, params={"limit": 2}, headers=HEADERS).json()
+    second = client.get(url, params={"limit": 2, "cursor": first["next_cursor"]}, headers=HEADERS).json()
+    entries = first["items"] + second["items"]
+    assert [entry["action"] for entry in entries] == ["created", "moved", "created"]
+    assert {entry["actor_name"] for entry in entries} == {me["name"]}
+    assert second["next_cursor"] is None
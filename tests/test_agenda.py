@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from app.models.agenda import AgendaEvent, AgendaEventType
+from app.models.core import GlobalRole, OrgMembership, User
+from app.services.agenda import merge_intervals
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2030, 5, 6, hour, minute)
+
+
+def test_merge_intervals_clips_and_merges_in_one_pass():
+    intervals = [(at(7), at(9)), (at(8), at(10)), (at(10), at(11)), (at(13), at(14)), (at(13), at(13, 30))]
+    assert merge_intervals(intervals, at(8), at(18)) == [(at(8), at(11)), (at(13), at(14))]
+
+
+def test_free_busy_and_conflicts(client, db_session, event_loop):
+    me = client.get("/api/v1/me", headers=HEADERS).json()["id"]
+    org_id = client.post("/api/v1/organizations/", json={"name": "AgendaOrg"}, headers=HEADERS).json()["id"]
+
+    async def _seed():
+        colleague = User(firebase_uid="agenda-colleague", email="colleague@agenda.local", name="Colleague")
+        outsider = User(firebase_uid="agenda-outsider", email="outsider@agenda.local", name="Outsider")
+        db_session.add_all([colleague, outsider])
+        await db_session.flush()
+        db_session.add(OrgMembership(organization_id=org_id, user_id=colleague.id, role=GlobalRole.MEMBER))
+        for kind, start, end in ((AgendaEventType.MEETING, 9, 10), (AgendaEventType.REMINDER, 11, 12)):
+            db_session.add(AgendaEvent(user_id=colleague.id, type=kind, title="x", start_at=at(start), end_at=at(end)))
+        await db_session.commit()
+        return colleague.id, outsider.id
+
+    colleague, outsider = event_loop.run_until_complete(_seed())
+
+    event = {"user_id": me, "type": "MEETING", "title": "sync"}
+    event.update(start_at=at(9, 30).isoformat(), end_at=at(11).isoformat())
+    assert client.post("/api/v1/agenda/", json=event, headers=HEADERS).status_code == 200
+    clash = {**event, "start_at": at(10).isoformat(), "end_at": at(10, 30).isoformat()}
+    assert client.post("/api/v1/agenda/", json=clash, headers=HEADERS).status_code == 409
+    forced = client.post("/api/v1/agenda/", json=clash, params={"allow_conflicts": True}, headers=HEADERS)
+    assert forced.status_code == 200
+
+    window = {"start": at(8).isoformat(), "end": at(18).isoformat()}
+    listed = client.get("/api/v1/agenda/", params=window, headers=HEADERS).json()
+    assert [item["title"] for item in listed] == ["sync", "sync"]
+
+    params = {**window, "user_ids": [me, colleague]}
+    body = client.get("/api/v1/agenda/free-busy", params=params, headers=HEADERS).json()
+    assert [(slot["start_at"][11:16], slot["end_at"][11:16]) for slot in body["busy"]] == [("09:00", "11:00")]
+    assert [(slot["start_at"][11:16], slot["end_at"][11:16]) for slot in body["free"]] == [
+        ("08:00", "09:00"),
+        ("11:00", "18:00"),
+    ]
+
+    denied = client.get("/api/v1/agenda/free-busy", params={**window, "user_ids": [outsider]}, headers=HEADERS)
+    assert denied.status_code == 403
+
+
+def test_create_event_compares_naive_and_aware_timestamps(client):
+    me = client.get("/api/v1/me", headers=HEADERS).json()["id"]
+    event = {"user_id": me, "type": "REMINDER", "title": "mixed"}
+    backwards = {**event, "start_at": at(15).isoformat(), "end_at": at(14).isoformat() + "+00:00"}
+    assert client.post("/api/v1/agenda/", json=backwards, headers=HEADERS).status_code == 422
+    # 16:00+02:00 is 14:00 UTC, so this event runs from 13:00 to 14:00 UTC.
+    forwards = {**event, "start_at": at(13).isoformat(), "end_at": at(16).isoformat() + "+02:00"}
+    assert client.post("/api/v1/agenda/", json=forwards, headers=HEADERS).status_code == 200
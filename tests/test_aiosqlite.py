@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+import aiosqlite
+
+
+def test_connection_uses_one_dedicated_thread(event_loop, tmp_path):
+    async def _run():
+        async with aiosqlite.connect(str(tmp_path / "worker.db")) as conn:
+            await conn.create_function("tid", 0, threading.get_ident)
+            first = await conn.execute_fetchall("SELECT tid()")
+            second = await conn.execute_fetchall("SELECT tid()")
+            assert first == second
+            assert first[0][0] != threading.get_ident()
+            assert (await conn.execute_fetchall("PRAGMA journal_mode"))[0][0] == "wal"
+            assert (await conn.execute_fetchall("PRAGMA synchronous"))[0][0] == 1
+
+    event_loop.run_until_complete(_run())
+
+
+def test_cursor_iterates_in_batches(event_loop):
+    async def _run():
+        async with aiosqlite.connect(":memory:", iter_chunk_size=16) as conn:
+            await conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            await conn.executemany("INSERT INTO items (id) VALUES (?)", [(i,) for i in range(100)])
+            cursor = await conn.execute("SELECT id FROM items ORDER BY id")
+            assert [row[0] async for row in cursor] == list(range(100))
+
+    event_loop.run_until_complete(_run())
+
+
+def test_single_writer_serialises_write_transactions(event_loop, tmp_path):
+    path = str(tmp_path / "writers.db")
+
+    async def _run():
+        writer_a = await aiosqlite.connect(path, single_writer=True, isolation_level="")
+        writer_b = await aiosqlite.connect(path, single_writer=True, isolation_level="")
+        reader = await aiosqlite.connect(path)
+        await writer_a.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        await writer_a.commit()
+
+        await writer_a.execute("INSERT INTO items (id) VALUES (1)")
+        pending = asyncio.ensure_future(writer_b.execute("INSERT INTO items (id) VALUES (2)"))
+        await asyncio.sleep(0.1)
+        assert not pending.done()
+        assert await reader.execute_fetchall("SELECT count(*) FROM items") == [(0,)]
+
+        await writer_a.commit()
+        await pending
+        await writer_b.commit()
+        assert await reader.execute_fetchall("SELECT count(*) FROM items") == [(2,)]
+        for conn in (writer_a, writer_b, reader):
+            await conn.close()
+
+    event_loop.run_until_complete(_run())
@@ -0,0 +1,39 @@
+from sqlalchemy import event
+
+from app.models.core import GlobalRole, OrgMembership, Organization, User
+from app.models.project import Project, ProjectMembership, ProjectRole
+from app.services.authorization import Permission, load_grants
+
+
+def test_grants_are_cached_until_memberships_change(db_session, event_loop, test_engine):
+    async def _run():
+        org = Organization(name="RbacOrg")
+        user = User(firebase_uid="rbac-user", email="rbac@local", name="Rbac")
+        db_session.add_all([org, user])
+        await db_session.flush()
+        db_session.add(OrgMembership(organization_id=org.id, user_id=user.id, role=GlobalRole.CLIENT))
+        project = Project(organization_id=org.id, name="RbacProject")
+        db_session.add(project)
+        await db_session.commit()
+
+        grants = await load_grants(db_session, user.id)
+        assert Permission.ORG_ACCESS in grants.org(org.id)
+        assert Permission.ORG_MANAGE not in grants.org(org.id)
+        assert not grants.project(project.id)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(test_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            assert await load_grants(db_session, user.id) is grants
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", listener)
+        assert statements == []
+
+        db_session.add(ProjectMembership(project_id=project.id, user_id=user.id, role=ProjectRole.VIEWER))
+        await db_session.commit()
+        grants = await load_grants(db_session, user.id)
+        assert Permission.TICKET_WRITE in grants.project(project.id)
+        assert Permission.MEMBER_MANAGE not in grants.project(project.id)
+
+    event_loop.run_until_complete(_run())
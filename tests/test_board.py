@@ -0,0 +1,50 @@
+from sqlalchemy import event, insert
+
+from app.models.kanban import KanbanColumn
+from app.models.ticket import ticket_assignees_table
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_board_snapshot_is_cached_until_a_ticket_changes(client, db_session, event_loop, test_engine):
+    me = client.get("/api/v1/me", headers=HEADERS).json()["id"]
+    org_id = client.post("/api/v1/organizations/", json={"name": "BoardOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "BoardProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _columns():
+        columns = [KanbanColumn(project_id=project_id, name="TO_DO", position=0)]
+        columns.append(KanbanColumn(project_id=project_id, name="DONE", position=1))
+        db_session.add_all(columns)
+        await db_session.commit()
+        return [column.id for column in columns]
+
+    to_do, done = event_loop.run_until_complete(_columns())
+    ticket = {"project_id": project_id, "title": "Card", "column_id": to_do, "priority": "HIGH"}
+    ticket_id = client.post("/api/v1/tickets/", json=ticket, headers=HEADERS).json()["id"]
+
+    async def _assign():
+        await db_session.execute(insert(ticket_assignees_table).values(ticket_id=ticket_id, user_id=me))
+        await db_session.commit()
+
+    event_loop.run_until_complete(_assign())
+    board_url = f"/api/v1/projects/{project_id}/board"
+    board = client.get(board_url, headers=HEADERS).json()
+    assert [column["name"] for column in board["columns"]] == ["TO_DO", "DONE"]
+    card = board["columns"][0]["tickets"][0]
+    assert (card["id"], card["priority"], card["assignee_ids"]) == (ticket_id, "HIGH", [me])
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(test_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        assert client.get(board_url, headers=HEADERS).json() == board
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", listener)
+    assert len(statements) == 1 and "board_version" in statements[0]
+
+    client.post(f"/api/v1/tickets/{ticket_id}/move", json={"column_id": done}, headers=HEADERS)
+    moved = client.get(board_url, headers=HEADERS).json()
+    assert moved["version"] > board["version"]
+    assert [len(column["tickets"]) for column in moved["columns"]] == [0, 1]
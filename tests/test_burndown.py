@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.kanban import KanbanColumn
+from app.models.ticket import TicketTimeRollup
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_sprint_burndown_follows_moves_and_tracked_time(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "BurnOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "BurnProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+    today = datetime.now(timezone.utc).date()
+    sprint_id = client.post(
+        f"/api/v1/projects/{project_id}/sprints",
+        json={"name": "S1", "project_id": project_id, "start_date": str(today - timedelta(days=2))},
+        headers=HEADERS,
+    ).json()["id"]
+
+    async def _columns():
+        columns = [KanbanColumn(project_id=project_id, name=name) for name in ("TO_DO", "DONE")]
+        db_session.add_all(columns)
+        await db_session.commit()
+        return [column.id for column in columns]
+
+    to_do, done = event_loop.run_until_complete(_columns())
+    ticket = {"project_id": project_id, "sprint_id": sprint_id, "column_id": to_do}
+    first = client.post("/api/v1/tickets/", json={**ticket, "title": "A", "estimation_minutes": 60}, headers=HEADERS)
+    batch = {"create": [{**ticket, "title": "B", "estimation_minutes": 30}, {**ticket, "title": "C"}]}
+    second = client.post("/api/v1/tickets/batch", json=batch, headers=HEADERS).json()["created"][0]["ticket_id"]
+    client.post(f"/api/v1/tickets/{first.json()['id']}/move", json={"column_id": done}, headers=HEADERS)
+    client.post("/api/v1/tickets/batch", json={"move": [{"ticket_id": second, "column_id": done}]}, headers=HEADERS)
+    client.post("/api/v1/tickets/batch", json={"move": [{"ticket_id": second, "column_id": to_do}]}, headers=HEADERS)
+
+    async def _tracked():
+        db_session.add(
+            TicketTimeRollup(
+                day=today - timedelta(days=1),
+                ticket_id=first.json()["id"],
+                project_id=project_id,
+                sprint_id=sprint_id,
+                seconds=900,
+            )
+        )
+        await db_session.commit()
+
+    event_loop.run_until_complete(_tracked())
+    body = client.get(f"/api/v1/projects/{project_id}/sprints/{sprint_id}/burndown", headers=HEADERS).json()
+    assert body["capacity_minutes"] == 90
+    assert body["tracked_seconds"] == 900
+    assert [(day["remaining_minutes"], day["completed_tickets"], day["tracked_seconds"]) for day in body["days"]] == [
+        (0, 0, 0),
+        (0, 0, 900),
+        (30, 1, 0),
+    ]
+    missing = client.get(f"/api/v1/projects/{project_id}/sprints/999999/burndown", headers=HEADERS)
+    assert missing.status_code == 404
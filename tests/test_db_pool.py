@@ -0,0 +1,36 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.pool import InstrumentedQueuePool, pool_stats
+from app.db.session import engine_options
+
+
+def test_engine_options_are_applied_per_dialect():
+    pg = engine_options("postgresql+asyncpg://user:pass@db/app")
+    assert pg["poolclass"] is InstrumentedQueuePool
+    assert pg["connect_args"]["prepared_statement_cache_size"] == pg["connect_args"]["statement_cache_size"]
+    assert "pool_size" not in engine_options("sqlite+aiosqlite:///:memory:")
+
+
+def test_instrumented_pool_reports_checkouts(event_loop, tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    async def _run():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = pool_stats(engine.pool)
+            assert stats["checked_out"] == 1
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        stats = pool_stats(engine.pool)
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 2
+        assert stats["overflow"] <= 0
+        await engine.dispose()
+
+    event_loop.run_until_complete(_run())
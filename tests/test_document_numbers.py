@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.models.billing import DocumentSequence, Invoice, InvoiceStatus
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_invoice_numbers_follow_one_sequence_per_organization(client, db_session, event_loop):
+    def issue(org_id: int) -> str:
+        invoice_id = client.post(
+            "/api/v1/billing/invoices", json={"organization_id": org_id, "title": "N", "lines": []}, headers=HEADERS
+        ).json()["id"]
+        return client.post(f"/api/v1/billing/invoices/{invoice_id}/issue", headers=HEADERS).json()["number"]
+
+    first_org, second_org = (
+        client.post("/api/v1/organizations/", json={"name": name}, headers=HEADERS).json()["id"]
+        for name in ("NumberOrgA", "NumberOrgB")
+    )
+    year = datetime.utcnow().year
+    assert [issue(first_org), issue(second_org), issue(first_org)] == [
+        f"{year}-0001",
+        f"{year}-0001",
+        f"{year}-0002",
+    ]
+
+    async def _sequence():
+        return await db_session.scalar(
+            select(DocumentSequence.last_value).where(
+                DocumentSequence.organization_id == first_org,
+                DocumentSequence.year == year,
+                DocumentSequence.doc_type == "invoice",
+            )
+        )
+
+    assert event_loop.run_until_complete(_sequence()) == 2
+
+
+def test_issue_commits_the_number_before_rendering(client, db_session, event_loop, monkeypatch):
+    from app.services import billing as billing_service
+    from app.services.pdf_renderer import PdfRenderError
+
+    org_id = client.post("/api/v1/organizations/", json={"name": "NumberOrgC"}, headers=HEADERS).json()["id"]
+    invoice_id = client.post(
+        "/api/v1/billing/invoices", json={"organization_id": org_id, "title": "N", "lines": []}, headers=HEADERS
+    ).json()["id"]
+    issuing_sessions = []
+    in_transaction_during_render = []
+
+    async def _invoice_dto(session, invoice):
+        issuing_sessions.append(session)
+        return await invoice_dto(session, invoice)
+
+    async def _failing_render(dto):
+        # The sequence row lock lives as long as the issuing transaction.
+        in_transaction_during_render.append(issuing_sessions[-1].in_transaction())
+        raise PdfRenderError("PDF rendering timed out")
+
+    invoice_dto = billing_service.invoice_dto
+    render = billing_service.pdf_renderer.render
+    monkeypatch.setattr(billing_service, "invoice_dto", _invoice_dto)
+    monkeypatch.setattr(billing_service.pdf_renderer, "render", _failing_render)
+    assert client.post(f"/api/v1/billing/invoices/{invoice_id}/issue", headers=HEADERS).status_code == 503
+    assert in_transaction_during_render == [False]
+
+    year = datetime.utcnow().year
+    issued = event_loop.run_until_complete(db_session.get(Invoice, invoice_id))
+    assert (issued.status, issued.number, issued.pdf_checksum) == (InvoiceStatus.ISSUED, f"{year}-0001", None)
+    assert client.get(f"/api/v1/billing/invoices/{invoice_id}/pdf", headers=HEADERS).status_code == 404
+
+    monkeypatch.setattr(billing_service.pdf_renderer, "render", render)
+    retried = client.post(f"/api/v1/billing/invoices/{invoice_id}/issue", headers=HEADERS)
+    assert retried.json()["number"] == f"{year}-0001"
+    assert client.get(f"/api/v1/billing/invoices/{invoice_id}/pdf", headers=HEADERS).status_code == 200
+
+
+def test_concurrent_issues_of_one_draft_take_a_single_number(client, session_factory, event_loop):
+    from app.services.billing import issue_invoice
+
+    org_id = client.post("/api/v1/organizations/", json={"name": "NumberOrgD"}, headers=HEADERS).json()["id"]
+    invoice_id = client.post(
+        "/api/v1/billing/invoices", json={"organization_id": org_id, "title": "N", "lines": []}, headers=HEADERS
+    ).json()["id"]
+
+    async def _run():
+        async with session_factory() as first, session_factory() as second:
+            # Both requests read the draft before either of them issues it.
+            drafts = [await first.get(Invoice, invoice_id), await second.get(Invoice, invoice_id)]
+            await second.commit()
+            issued = [await issue_invoice(first, drafts[0]), await issue_invoice(second, drafts[1])]
+            assert issued[0].number == issued[1].number == f"{datetime.utcnow().year}-0001"
+            return await first.scalar(
+                select(DocumentSequence.last_value).where(
+                    DocumentSequence.organization_id == org_id, DocumentSequence.doc_type == "invoice"
+                )
+            )
+
+    assert event_loop.run_until_complete(_run()) == 1
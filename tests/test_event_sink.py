@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.session import Base
+from app.models.core import Organization
+from app.models.kanban import KanbanColumn
+from app.models.notification import Event
+from app.models.project import Project
+from app.models.ticket import Ticket
+from app.services import events
+from app.services.events import EventSink, record_event
+
+
+def test_sink_buffers_committed_events_and_flushes_on_stop(session_factory, event_loop, monkeypatch):
+    async def _count(session):
+        return await session.scalar(select(func.count()).select_from(Event).where(Event.action == "sink-test"))
+
+    async def _run():
+        sink = EventSink(session_factory, batch_size=100, flush_interval=60, max_pending=3)
+        monkeypatch.setattr(events, "event_sink", sink)
+        sink.start()
+        async with session_factory() as session:
+            await record_event(session, action="sink-test", actor_id=1)
+            await session.rollback()
+            for _ in range(3):
+                await record_event(session, action="sink-test", actor_id=1)
+            await session.commit()
+            assert sink.stats()["pending"] == 3
+            assert await _count(session) == 0
+            assert not await sink.wait_for_capacity(0.05)
+
+            await sink.stop()
+            assert sink.stats()["pending"] == 0
+            assert await _count(session) == 3
+
+            # Without a running sink events are written in the caller's transaction.
+            await record_event(session, action="sink-test", actor_id=1)
+            await session.commit()
+            assert await _count(session) == 4
+
+    event_loop.run_until_complete(_run())
+
+
+def test_sink_flushes_when_batch_is_full(session_factory, event_loop, monkeypatch):
+    async def _run():
+        sink = EventSink(session_factory, batch_size=2, flush_interval=60)
+        monkeypatch.setattr(events, "event_sink", sink)
+        sink.start()
+        async with session_factory() as session:
+            await record_event(session, action="sink-batch", actor_id=1)
+            await record_event(session, action="sink-batch", actor_id=1)
+            await session.commit()
+            for _ in range(50):
+                if sink.stats()["batches"]:
+                    break
+                await asyncio.sleep(0.01)
+            assert sink.stats()["flushed"] == 2
+        await sink.stop()
+
+    event_loop.run_until_complete(_run())
+
+
+def test_buffered_events_keep_their_record_time(session_factory, event_loop, monkeypatch):
+    async def _run():
+        sink = EventSink(session_factory, batch_size=100, flush_interval=60)
+        monkeypatch.setattr(events, "event_sink", sink)
+        sink.start()
+        async with session_factory() as session:
+            before = datetime.utcnow()
+            await record_event(session, action="sink-stamp", actor_id=1)
+            after = datetime.utcnow()
+            await session.commit()
+            await asyncio.sleep(0.2)
+            await sink.stop()
+            created_at = await session.scalar(select(Event.created_at).where(Event.action == "sink-stamp"))
+            assert before <= created_at.replace(tzinfo=None) <= after
+
+    event_loop.run_until_complete(_run())
+
+
+def test_sink_drops_events_that_can_never_be_written(event_loop, tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'sink.db'}",
+        connect_args={"pragmas": {"foreign_keys": "ON"}, "isolation_level": ""},
+    )
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            org = Organization(name="SinkOrg")
+            session.add(org)
+            await session.flush()
+            project = Project(organization_id=org.id, name="Sink")
+            session.add(project)
+            await session.flush()
+            column = KanbanColumn(project_id=project.id, name="Todo")
+            session.add(column)
+            await session.flush()
+            ticket = Ticket(project_id=project.id, column_id=column.id, title="Gone", rank="a")
+            session.add(ticket)
+            await session.commit()
+
+            sink = EventSink(factory, batch_size=100, flush_interval=60)
+            sink.offer(
+                [
+                    {"action": "sink-kept", "project_id": project.id},
+                    {"action": "sink-orphan", "ticket_id": ticket.id, "project_id": project.id},
+                    {"action": "sink-kept", "project_id": project.id},
+                ]
+            )
+            # The ticket is deleted while its event still sits in the buffer.
+            await session.execute(delete(Ticket).where(Ticket.id == ticket.id))
+            await session.commit()
+
+            await sink.flush()
+            assert sink.stats()["pending"] == 0
+            assert (sink.flushed, sink.dropped) == (2, 1)
+            actions = (await session.scalars(select(Event.action).order_by(Event.id))).all()
+            assert actions == ["sink-kept", "sink-kept"]
+        await engine.dispose()
+
+    event_loop.run_until_complete(_run())
@@ -0,0 +1,43 @@
+import csv
+import io
+import json
+
+from app.models.kanban import KanbanColumn
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_project_export_streams_ndjson_and_csv(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "ExportOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "ExportProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _column():
+        column = KanbanColumn(project_id=project_id, name="TO_DO", position=1)
+        db_session.add(column)
+        await db_session.commit()
+        return column.id
+
+    column_id = event_loop.run_until_complete(_column())
+    for i in range(3):
+        ticket = {"project_id": project_id, "title": f"T{i}, \"quoted\"", "column_id": column_id}
+        ticket_id = client.post("/api/v1/tickets/", json=ticket, headers=HEADERS).json()["id"]
+    client.post(f"/api/v1/tickets/{ticket_id}/comments", json={"body": "hello"}, headers=HEADERS)
+
+    response = client.get(f"/api/v1/projects/{project_id}/export", headers=HEADERS)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    tickets = [json.loads(line) for line in response.text.splitlines()]
+    assert [t["title"] for t in tickets] == [f"T{i}, \"quoted\"" for i in range(3)]
+    assert tickets[0]["priority"] == "MEDIUM"
+
+    response = client.get(
+        f"/api/v1/projects/{project_id}/export", params={"resource": "events", "format": "csv"}, headers=HEADERS
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["action"] for row in rows] == ["created"] * 3
+
+    comments = client.get(f"/api/v1/projects/{project_id}/export", params={"resource": "comments"}, headers=HEADERS)
+    assert [json.loads(line)["body"] for line in comments.text.splitlines()] == ["hello"]
+
+    assert client.get("/api/v1/projects/999999/export", headers=HEADERS).status_code == 403
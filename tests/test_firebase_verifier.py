@@ -0,0 +1,129 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from app.core.firebase import (
+    CircuitBreaker,
+    FirebaseTokenVerifier,
+    InvalidTokenError,
+    KeysUnavailableError,
+)
+
+PROJECT_ID = "local-test-project"
+
+
+def _make_key_pair():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken")])
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.utcnow() - timedelta(days=1))
+        .not_valid_after(datetime.utcnow() + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return key, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+class KeyServer:
+    """Local stand-in for Google's securetoken certificate endpoint."""
+
+    def __init__(self, certs, max_age=3600):
+        self.certs = certs
+        self.max_age = max_age
+        self.requests = 0
+        self.fail = False
+
+    def handler(self, request):
+        self.requests += 1
+        if self.fail:
+            return httpx.Response(503)
+        return httpx.Response(
+            200, json=self.certs, headers={"Cache-Control": f"public, max-age={self.max_age}"}
+        )
+
+    def verifier(self, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return FirebaseTokenVerifier(PROJECT_ID, certs_url="https://keys.local/certs", http_client=client, **kwargs)
+
+
+def _sign(key, kid, **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "firebase-user",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture(scope="module")
+def key_pair():
+    return _make_key_pair()
+
+
+def test_verifier_caches_keys_and_rejects_bad_tokens(event_loop, key_pair):
+    key, cert = key_pair
+    server = KeyServer({"kid-1": cert})
+
+    async def _run():
+        verifier = server.verifier()
+        claims = await verifier.verify(_sign(key, "kid-1"))
+        assert claims["uid"] == "firebase-user"
+        await verifier.verify(_sign(key, "kid-1", sub="other"))
+        assert server.requests == 1
+
+        other_key, _ = _make_key_pair()
+        with pytest.raises(InvalidTokenError):
+            await verifier.verify(_sign(other_key, "kid-1"))
+        with pytest.raises(InvalidTokenError):
+            await verifier.verify(_sign(key, "kid-1", aud="someone-else"))
+        await verifier.aclose()
+
+    event_loop.run_until_complete(_run())
+
+
+def test_verifier_refreshes_in_background(event_loop, key_pair):
+    key, cert = key_pair
+    server = KeyServer({"kid-1": cert}, max_age=2)
+
+    async def _run():
+        verifier = server.verifier(refresh_margin=1.5)
+        await verifier.verify(_sign(key, "kid-1"))
+        await asyncio.sleep(1.3)
+        assert server.requests == 2
+        await verifier.aclose()
+
+    event_loop.run_until_complete(_run())
+
+
+def test_circuit_breaker_stops_hammering_key_endpoint(event_loop, key_pair):
+    key, cert = key_pair
+    server = KeyServer({"kid-1": cert})
+    server.fail = True
+
+    async def _run():
+        verifier = server.verifier(breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        for _ in range(5):
+            with pytest.raises(KeysUnavailableError):
+                await verifier.verify(_sign(key, "kid-1"))
+        assert server.requests == 2
+        assert verifier.stats()["breaker_state"] == "open"
+        await verifier.aclose()
+
+    event_loop.run_until_complete(_run())
@@ -0,0 +1,25 @@
+from sqlalchemy import event
+
+from app.services.identity import user_cache
+
+
+def test_authenticated_reads_do_not_write(client, test_engine):
+    headers = {"Authorization": "Bearer test-token"}
+    user_cache.clear()
+    first = client.get("/api/v1/me", headers=headers)
+    assert first.status_code == 200
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        second = client.get("/api/v1/me", headers=headers)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert statements == []
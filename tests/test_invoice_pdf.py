@@ -0,0 +1,42 @@
+from app.models.billing import Invoice, InvoiceLine
+from app.models.core import User
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_invoice_pdf_is_served_from_the_store_with_validators(client, db_session, event_loop, pdf_store_root, monkeypatch):
+    org_id = client.post("/api/v1/organizations/", json={"name": "PdfOrg"}, headers=HEADERS).json()["id"]
+
+    async def _invoice():
+        # A preset number keeps issuance independent from numbering in other tests.
+        invoice = Invoice(organization_id=org_id, title="Invoice P", number="PDF-0001")
+        invoice.lines.append(InvoiceLine(description="Work", quantity=1, unit_price=10))
+        db_session.add(invoice)
+        await db_session.commit()
+        return invoice.id
+
+    invoice_id = event_loop.run_until_complete(_invoice())
+    url = f"/api/v1/billing/invoices/{invoice_id}/pdf"
+    assert client.get(url, headers=HEADERS).status_code == 404
+    client.post(f"/api/v1/billing/invoices/{invoice_id}/issue", headers=HEADERS)
+
+    full = client.get(url, headers=HEADERS)
+    assert full.status_code == 200
+    assert full.content.startswith(b"%PDF") and full.headers["content-type"] == "application/pdf"
+    etag = full.headers["etag"]
+    assert list(pdf_store_root.rglob(f"{etag.strip(chr(34))}.pdf"))
+
+    cached = client.get(url, headers={**HEADERS, "If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+    partial = client.get(url, headers={**HEADERS, "Range": "bytes=0-3", "If-Range": etag})
+    assert partial.status_code == 206 and partial.content == b"%PDF"
+    assert partial.headers["content-range"] == f"bytes 0-3/{len(full.content)}"
+
+    async def _outsider():
+        # Created up front so sign-in does not attach the user to any organization.
+        db_session.add(User(firebase_uid="pdf-outsider", email="outsider@local", name="Outsider"))
+        await db_session.commit()
+
+    event_loop.run_until_complete(_outsider())
+    monkeypatch.setenv("FIREBASE_EMULATED_UID", "pdf-outsider")
+    assert client.get(url, headers=HEADERS).status_code == 404
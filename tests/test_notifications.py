@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from app.models.notification import Notification
+from app.services.notifications import purge_read_notifications
+
+
+def test_inbox_pages_counts_and_bulk_marks(client, db_session, event_loop):
+    headers = {"Authorization": "Bearer test-token"}
+    user_id = client.get("/api/v1/me", headers=headers).json()["id"]
+    base = datetime(2024, 1, 1)
+
+    async def _seed():
+        db_session.add_all(
+            Notification(user_id=user_id, title=f"n{i}", body="b", created_at=base + timedelta(minutes=i))
+            for i in range(7)
+        )
+        await db_session.commit()
+
+    event_loop.run_until_complete(_seed())
+
+    titles, cursor = [], None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/v1/notifications/", params=params, headers=headers).json()
+        titles += [item["title"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert titles == [f"n{i}" for i in reversed(range(7))]
+
+    assert client.get("/api/v1/notifications/unread-count", headers=headers).json() == {"count": 7}
+    newest = client.get("/api/v1/notifications/", params={"limit": 2}, headers=headers).json()["items"]
+    first_ids = [item["id"] for item in newest]
+    marked = client.post("/api/v1/notifications/read", json={"ids": first_ids}, headers=headers)
+    assert marked.json() == {"count": 2}
+    assert client.get("/api/v1/notifications/unread-count", headers=headers).json() == {"count": 5}
+    assert client.post("/api/v1/notifications/read", json={}, headers=headers).json() == {"count": 5}
+    assert client.get("/api/v1/notifications/unread-count", headers=headers).json() == {"count": 0}
+
+
+def test_purge_removes_old_read_notifications_in_batches(db_session, event_loop):
+    async def _run():
+        old = datetime(2020, 1, 1)
+        db_session.add_all(
+            Notification(user_id=999, title="old", body="b", created_at=old, read=i % 2 == 0) for i in range(10)
+        )
+        db_session.add(Notification(user_id=999, title="recent", body="b", created_at=datetime.utcnow(), read=True))
+        await db_session.commit()
+
+        assert await purge_read_notifications(db_session, datetime(2021, 1, 1), batch_size=2) == 5
+        remaining = await db_session.scalar(select(func.count()).where(Notification.user_id == 999))
+        assert remaining == 6
+
+    event_loop.run_until_complete(_run())
@@ -0,0 +1,21 @@
+def test_organizations_are_paginated_by_cursor(client):
+    headers = {"Authorization": "Bearer test-token"}
+    for i in range(5):
+        assert client.post("/api/v1/organizations/", json={"name": f"PageOrg_{i}"}, headers=headers).status_code == 200
+    client.post("/api/v1/organizations/", json={"name": "PageOrgX"}, headers=headers)
+
+    names, cursor = [], None
+    while True:
+        params = {"limit": 2, "name": "PageOrg_"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/v1/organizations/", params=params).json()
+        assert len(body["items"]) <= 2
+        names += [org["name"] for org in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert names == [f"PageOrg_{i}" for i in range(5)]
+
+    assert client.get("/api/v1/organizations/", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/v1/organizations/", params={"limit": 1000}).status_code == 422
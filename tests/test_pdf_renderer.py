@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services import pdf_renderer as renderer_module
+
+from app.services.pdf_renderer import InvoiceDTO, InvoiceLineDTO, PdfRenderError, PdfRenderer
+
+INVOICE = InvoiceDTO(
+    number="2024-0001",
+    status="ISSUED",
+    title="Invoice A",
+    lines=(InvoiceLineDTO(description="Work", quantity=2, unit_price="100.00"),),
+)
+
+
+def test_renders_in_a_worker_process_and_reports_timings(event_loop):
+    renderer = PdfRenderer(max_workers=1)
+
+    async def _run():
+        try:
+            return await renderer.render(INVOICE)
+        finally:
+            await renderer.shutdown()
+
+    assert event_loop.run_until_complete(_run()).startswith(b"%PDF")
+    stats = renderer.stats()
+    assert stats["rendered"] == 1 and stats["waiting"] == stats["running"] == 0
+    assert stats["render_ms_max"] > 0
+
+
+def test_render_gives_up_when_no_slot_frees_up(event_loop):
+    renderer = PdfRenderer(max_workers=0, queue_timeout=0.01)
+
+    async def _run():
+        slots = renderer._slots_for_loop()
+        await slots.acquire()
+        with pytest.raises(PdfRenderError):
+            await renderer.render(INVOICE)
+        slots.release()
+        assert (await renderer.render(INVOICE)).startswith(b"%PDF")
+
+    event_loop.run_until_complete(_run())
+    assert renderer.stats()["timeouts"] == 1
+
+
+def test_timed_out_job_keeps_its_slot_until_the_worker_finishes(event_loop, monkeypatch):
+    render = renderer_module.render_invoice_pdf
+
+    def _slow(invoice):
+        time.sleep(0.3)
+        return render(invoice)
+
+    monkeypatch.setattr(renderer_module, "render_invoice_pdf", _slow)
+    renderer = PdfRenderer(max_workers=0, render_timeout=0.05, queue_timeout=0.05)
+
+    async def _run():
+        with pytest.raises(PdfRenderError, match="timed out"):
+            await renderer.render(INVOICE)
+        assert renderer.stats()["running"] == 1
+        with pytest.raises(PdfRenderError, match="No PDF worker"):
+            await renderer.render(INVOICE)
+        await asyncio.sleep(0.4)
+        assert renderer.stats()["running"] == 0
+        monkeypatch.setattr(renderer_module, "render_invoice_pdf", render)
+        assert (await renderer.render(INVOICE)).startswith(b"%PDF")
+        await renderer.shutdown()
+
+    event_loop.run_until_complete(_run())
@@ -0,0 +1,137 @@
+"""EXPLAIN the hot queries against a seeded SQLite database and reject full table scans."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+
+from app.db.session import Base
+from app.models.agenda import AgendaEvent
+from app.models.billing import DocumentSequence, Invoice
+from app.core.pagination import encode_cursor, keyset
+from app.models.core import OrgMembership, Organization
+from app.models.notification import Event, Notification
+from app.models.project import Project, ProjectMembership, SprintDailySnapshot
+from app.models.ticket import Ticket, TicketTimeRollup, TicketTimeSegment
+from app.services.agenda import overlapping
+from app.services.export import export_statement
+
+ROWS = 500
+DAY = datetime(2024, 1, 1)
+
+HOT_QUERIES = {
+    "ticket_time_segments": select(TicketTimeSegment).where(TicketTimeSegment.ticket_id == 7),
+    "open_time_segment": select(TicketTimeSegment.id).where(
+        TicketTimeSegment.ticket_id == 7, TicketTimeSegment.ended_at.is_(None)
+    ),
+    "project_membership": select(ProjectMembership).where(
+        ProjectMembership.project_id == 7, ProjectMembership.user_id == 7
+    ),
+    "project_grants": select(ProjectMembership.project_id, ProjectMembership.role).where(
+        ProjectMembership.user_id == 7
+    ),
+    "org_membership": select(OrgMembership).where(
+        OrgMembership.organization_id == 7, OrgMembership.user_id == 7
+    ),
+    "org_grants": select(OrgMembership.organization_id, OrgMembership.role).where(OrgMembership.user_id == 7),
+    "notification_inbox": select(Notification)
+    .where(Notification.user_id == 7)
+    .order_by(Notification.created_at.desc()),
+    "unread_notifications": select(func.count())
+    .select_from(Notification)
+    .where(Notification.user_id == 7, Notification.read.is_(False)),
+    "notification_page": keyset(
+        select(Notification).where(Notification.user_id == 7),
+        Notification.created_at,
+        Notification.id,
+        encode_cursor(DAY, 7),
+        50,
+        descending=True,
+    ),
+    "notification_retention": select(Notification.id)
+    .where(Notification.read.is_(True), Notification.created_at < DAY)
+    .order_by(Notification.created_at)
+    .limit(1000),
+    "agenda_events": select(AgendaEvent).where(AgendaEvent.user_id == 7),
+    "agenda_range": overlapping(select(AgendaEvent).where(AgendaEvent.user_id == 7), DAY, DAY),
+    "organization_page": keyset(
+        select(Organization.id, Organization.name), Organization.created_at, Organization.id, encode_cursor(DAY, 7), 50
+    ),
+    "project_page_by_org": keyset(
+        select(Project.id, Project.name).where(Project.organization_id == 7), Project.created_at, Project.id, None, 50
+    ),
+    "activity_feed": keyset(
+        select(Event.id).where(Event.project_id == 7), Event.created_at, Event.id, encode_cursor(DAY, 7), 50, True
+    ),
+    "export_tickets": export_statement(7, "tickets"),
+    "export_comments": export_statement(7, "comments"),
+    "export_events": export_statement(7, "events"),
+    "column_tail": select(func.max(Ticket.rank)).where(Ticket.column_id == 7),
+    "rank_neighbour": select(func.min(Ticket.rank)).where(Ticket.column_id == 7, Ticket.rank > "i"),
+    "sprint_snapshots": select(SprintDailySnapshot).where(SprintDailySnapshot.sprint_id == 7),
+    "sprint_tracked_time": select(TicketTimeRollup.day, func.sum(TicketTimeRollup.seconds))
+    .where(TicketTimeRollup.sprint_id == 7)
+    .group_by(TicketTimeRollup.day),
+    "invoice_by_number": select(Invoice.id).where(Invoice.organization_id == 7, Invoice.number == "2024-0007"),
+    "document_sequence": select(DocumentSequence.last_value).where(
+        DocumentSequence.organization_id == 7, DocumentSequence.year == 2024, DocumentSequence.doc_type == "invoice"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(TicketTimeSegment),
+            [{"ticket_id": i % 50, "ended_at": None if i < 50 else DAY} for i in range(ROWS)],
+        )
+        conn.execute(insert(Organization), [{"name": f"org-{i}", "created_at": DAY} for i in range(ROWS)])
+        conn.execute(
+            insert(Project), [{"organization_id": i % 40, "name": "p", "created_at": DAY} for i in range(ROWS)]
+        )
+        conn.execute(
+            insert(ProjectMembership), [{"project_id": i % 40, "user_id": i, "role": "VIEWER"} for i in range(ROWS)]
+        )
+        conn.execute(
+            insert(OrgMembership), [{"organization_id": i % 40, "user_id": i, "role": "MEMBER"} for i in range(ROWS)]
+        )
+        conn.execute(
+            insert(Notification),
+            [{"user_id": i % 25, "title": "t", "body": "b", "read": bool(i % 3)} for i in range(ROWS)],
+        )
+        conn.execute(
+            insert(AgendaEvent),
+            [
+                {
+                    "user_id": i % 25,
+                    "type": "TASK",
+                    "title": "t",
+                    "start_at": DAY,
+                    "end_at": DAY,
+                }
+                for i in range(ROWS)
+            ],
+        )
+        conn.execute(
+            insert(Invoice),
+            [{"organization_id": i % 20, "title": "t", "number": f"2024-{i:04d}"} for i in range(ROWS)],
+        )
+        conn.exec_driver_sql("ANALYZE")
+    yield engine
+    engine.dispose()
+
+
+def explain(engine, statement) -> list[str]:
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(seeded_engine, name):
+    plan = explain(seeded_engine, HOT_QUERIES[name])
+    full_scans = [step for step in plan if step.startswith("SCAN")]
+    assert not full_scans, f"{name} falls back to a full scan: {plan}"
@@ -0,0 +1,99 @@
+import random
+
+from sqlalchemy import select
+
+from app.core.lexorank import rank_between, spread_ranks
+from app.models.kanban import KanbanColumn
+from app.models.ticket import Ticket
+from app.services.ranking import rebalance_ranks
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_rank_between_keeps_order_under_random_inserts():
+    rng = random.Random(7)
+    ranks = [rank_between(None, None)]
+    for _ in range(2000):
+        index = rng.randrange(len(ranks) + 1)
+        before = ranks[index - 1] if index else None
+        after = ranks[index] if index < len(ranks) else None
+        ranks.insert(index, rank_between(before, after))
+    assert ranks == sorted(ranks) and len(set(ranks)) == len(ranks)
+    assert spread_ranks(5) == sorted(spread_ranks(5))
+
+
+def test_reorder_updates_one_rank_and_rebalance_shortens(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "RankOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "RankProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _column():
+        column = KanbanColumn(project_id=project_id, name="TO_DO")
+        db_session.add(column)
+        await db_session.commit()
+        return column.id
+
+    column_id = event_loop.run_until_complete(_column())
+    ticket = {"project_id": project_id, "title": "R", "column_id": column_id}
+    ids = [client.post("/api/v1/tickets/", json=ticket, headers=HEADERS).json()["id"] for _ in range(3)]
+
+    def order():
+        board = client.get(f"/api/v1/projects/{project_id}/board", headers=HEADERS).json()
+        return [ticket["id"] for ticket in board["columns"][0]["tickets"]]
+
+    assert order() == ids
+    move = {"column_id": column_id, "before_id": ids[0], "after_id": ids[1]}
+    assert client.post(f"/api/v1/tickets/{ids[2]}/move", json=move, headers=HEADERS).status_code == 200
+    assert order() == [ids[0], ids[2], ids[1]]
+    top = {"column_id": column_id, "after_id": ids[0]}
+    assert client.post(f"/api/v1/tickets/{ids[1]}/move", json=top, headers=HEADERS).status_code == 200
+    assert order() == [ids[1], ids[0], ids[2]]
+    bad = {"column_id": column_id, "before_id": ids[2], "after_id": ids[0]}
+    assert client.post(f"/api/v1/tickets/{ids[1]}/move", json=bad, headers=HEADERS).status_code == 400
+
+    async def _rebalance():
+        for _ in range(30):
+            first, second = await db_session.scalars(
+                select(Ticket.rank).where(Ticket.column_id == column_id).order_by(Ticket.rank).limit(2)
+            )
+            await db_session.execute(
+                Ticket.__table__.update().where(Ticket.id == ids[2]).values(rank=rank_between(first, second))
+            )
+        await db_session.commit()
+        assert await rebalance_ranks(db_session, max_length=4) >= 1
+        ranks = list(await db_session.scalars(select(Ticket.rank).where(Ticket.column_id == column_id)))
+        assert max(map(len, ranks)) == 1
+
+    event_loop.run_until_complete(_rebalance())
+    assert order() == [ids[1], ids[2], ids[0]]
+
+
+def test_move_between_tickets_sharing_a_rank_respreads_the_column(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "RankTieOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "RankTieProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _column():
+        column = KanbanColumn(project_id=project_id, name="TO_DO")
+        db_session.add(column)
+        await db_session.commit()
+        return column.id
+
+    column_id = event_loop.run_until_complete(_column())
+    ticket = {"project_id": project_id, "title": "T", "column_id": column_id}
+    ids = [client.post("/api/v1/tickets/", json=ticket, headers=HEADERS).json()["id"] for _ in range(3)]
+
+    async def _tie():
+        # Two concurrent appends that read the same last rank end up like this.
+        await db_session.execute(Ticket.__table__.update().where(Ticket.id.in_(ids[:2])).values(rank="m"))
+        await db_session.commit()
+
+    event_loop.run_until_complete(_tie())
+    move = {"column_id": column_id, "before_id": ids[0], "after_id": ids[1]}
+    assert client.post(f"/api/v1/tickets/{ids[2]}/move", json=move, headers=HEADERS).status_code == 200
+    board = client.get(f"/api/v1/projects/{project_id}/board", headers=HEADERS).json()
+    tickets = board["columns"][0]["tickets"]
+    assert [ticket["id"] for ticket in tickets] == [ids[0], ids[2], ids[1]]
+    assert len({ticket["rank"] for ticket in tickets}) == 3
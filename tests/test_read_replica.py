@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db import session as db_session_module
+from app.db.session import Base
+from app.main import app
+from app.models.core import Organization
+
+
+def _seed(event_loop, url, org_name):
+    engine = create_async_engine(url)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(Organization.__table__.insert().values(name=org_name))
+        await engine.dispose()
+
+    event_loop.run_until_complete(_run())
+
+
+def test_reads_use_replica_until_client_writes(event_loop, tmp_path, monkeypatch):
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    _seed(event_loop, primary_url, "primary-org")
+    _seed(event_loop, replica_url, "replica-org")
+
+    monkeypatch.setattr(settings, "database_url", primary_url)
+    monkeypatch.setattr(settings, "database_read_url", replica_url)
+    for name in ("_engine", "SessionLocal", "_read_engine", "ReadSessionLocal"):
+        monkeypatch.setattr(db_session_module, name, None)
+    monkeypatch.setenv("FIREBASE_EMULATED_UID", "replica-user")
+    headers = {"Authorization": "Bearer test-token"}
+
+    def org_names(client):
+        return {org["name"] for org in client.get("/api/v1/organizations/").json()["items"]}
+
+    with TestClient(app) as client:
+        assert org_names(client) == {"replica-org"}
+        created = client.post("/api/v1/organizations/", json={"name": "fresh-org"}, headers=headers)
+        assert created.status_code == 200
+        assert org_names(client) == {"primary-org", "fresh-org"}
+        client.cookies.clear()
+        assert org_names(client) == {"replica-org"}
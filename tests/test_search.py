@@ -0,0 +1,51 @@
+from app.models.kanban import KanbanColumn
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_search_ranks_tickets_and_comments_in_accessible_projects(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "SearchOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "SearchProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _column():
+        column = KanbanColumn(project_id=project_id, name="TO_DO")
+        db_session.add(column)
+        await db_session.commit()
+        return column.id
+
+    column_id = event_loop.run_until_complete(_column())
+    tickets = [
+        {"title": "Flaky frobnicator", "description": "frobnicator crashes on frobnicator restart"},
+        {"title": "Billing export", "description": "mentions the frobnicator once"},
+        {"title": "Unrelated", "description": "nothing to see"},
+    ]
+    ids = [
+        client.post(
+            "/api/v1/tickets/", json={"project_id": project_id, "column_id": column_id, **ticket}, headers=HEADERS
+        ).json()["id"]
+        for ticket in tickets
+    ]
+    comment = client.post(f"/api/v1/tickets/{ids[2]}/comments", json={"body": "Frobnicators again?"}, headers=HEADERS)
+
+    params = {"q": "frobnic", "project_id": project_id}
+    hits = client.get("/api/v1/search/", params=params, headers=HEADERS).json()["items"]
+    assert hits[0]["ticket_id"] == ids[0]
+    assert {(hit["kind"], hit["ticket_id"], hit["comment_id"]) for hit in hits} == {
+        ("ticket", ids[0], None),
+        ("ticket", ids[1], None),
+        ("comment", ids[2], comment.json()["id"]),
+    }
+
+    first = client.get("/api/v1/search/", params={**params, "limit": 2}, headers=HEADERS).json()
+    assert first["next_offset"] == 2
+    rest = client.get("/api/v1/search/", params={**params, "limit": 2, "offset": 2}, headers=HEADERS).json()
+    assert [hit["ticket_id"] for hit in first["items"] + rest["items"]] == [hit["ticket_id"] for hit in hits]
+    assert rest["next_offset"] is None
+
+    assert client.get("/api/v1/search/", params={"q": "\"*:(", "project_id": project_id}, headers=HEADERS).json() == {
+        "items": [],
+        "next_offset": None,
+    }
+    assert client.get("/api/v1/search/", params={"q": "frob", "project_id": 10**6}, headers=HEADERS).status_code == 403
@@ -0,0 +1,55 @@
+from sqlalchemy import func, select
+
+from app.models.kanban import KanbanColumn
+from app.models.notification import Event
+from app.models.ticket import Ticket, TicketTimeSegment
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_batch_creates_and_moves_with_per_item_errors(client, db_session, event_loop):
+    org_id = client.post("/api/v1/organizations/", json={"name": "BatchOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "BatchProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _columns():
+        columns = [KanbanColumn(project_id=project_id, name=name) for name in ("TO_DO", "IN_PROGRESS", "DONE")]
+        db_session.add_all(columns)
+        await db_session.commit()
+        return [column.id for column in columns]
+
+    to_do, in_progress, done = event_loop.run_until_complete(_columns())
+    create = [{"project_id": project_id, "title": f"B{i}", "column_id": to_do} for i in range(3)]
+    create.append({"project_id": project_id, "title": "bad", "column_id": 999999})
+    create.append({"project_id": 999999, "title": "foreign", "column_id": to_do})
+    body = client.post("/api/v1/tickets/batch", json={"create": create}, headers=HEADERS).json()
+    assert [item["error"] for item in body["created"]] == [None, None, None, "Invalid column", "No project access"]
+    ids = [item["ticket_id"] for item in body["created"][:3]]
+    assert all(ids) and body["created"][3]["ticket_id"] is None
+
+    moves = [{"ticket_id": ticket_id, "column_id": in_progress} for ticket_id in ids]
+    moves.append({"ticket_id": 999999, "column_id": in_progress})
+    body = client.post("/api/v1/tickets/batch", json={"move": moves}, headers=HEADERS).json()
+    assert [item["error"] for item in body["moved"]] == [None, None, None, "Ticket not found"]
+    done_moves = [{"ticket_id": ids[0], "column_id": done}, {"ticket_id": ids[0], "column_id": to_do}]
+    body = client.post("/api/v1/tickets/batch", json={"move": done_moves}, headers=HEADERS).json()
+    assert [item["error"] for item in body["moved"]] == [None, "Duplicate ticket"]
+
+    async def _check():
+        columns = dict((await db_session.execute(select(Ticket.id, Ticket.column_id).where(Ticket.id.in_(ids)))).all())
+        assert columns == {ids[0]: done, ids[1]: in_progress, ids[2]: in_progress}
+        segments = (
+            await db_session.execute(
+                select(TicketTimeSegment.ticket_id, TicketTimeSegment.ended_at).where(TicketTimeSegment.ticket_id.in_(ids))
+            )
+        ).all()
+        assert sorted((ticket_id, ended is None) for ticket_id, ended in segments) == [
+            (ids[0], False),
+            (ids[1], True),
+            (ids[2], True),
+        ]
+        events = await db_session.scalar(select(func.count()).select_from(Event).where(Event.ticket_id.in_(ids)))
+        assert events == 3 + 3 + 1
+
+    event_loop.run_until_complete(_check())
@@ -0,0 +1,59 @@
+from sqlalchemy import update
+
+from app.api.routes import tickets as ticket_routes
+from app.models.kanban import KanbanColumn
+from app.models.ticket import Ticket
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_moves_are_conditional_on_ticket_version(client, db_session, event_loop, monkeypatch):
+    org_id = client.post("/api/v1/organizations/", json={"name": "VersionOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "VersionProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _columns():
+        columns = [KanbanColumn(project_id=project_id, name=name) for name in ("TO_DO", "REVIEW")]
+        db_session.add_all(columns)
+        await db_session.commit()
+        return [column.id for column in columns]
+
+    to_do, review = event_loop.run_until_complete(_columns())
+    ticket = client.post(
+        "/api/v1/tickets/", json={"project_id": project_id, "title": "V", "column_id": to_do}, headers=HEADERS
+    ).json()
+    assert ticket["version"] == 1
+    url = f"/api/v1/tickets/{ticket['id']}/move"
+    moved = client.post(url, json={"column_id": review, "expected_version": 1}, headers=HEADERS)
+    assert moved.json()["version"] == 2
+
+    stale = client.post(url, json={"column_id": to_do, "expected_version": 1}, headers=HEADERS)
+    assert stale.status_code == 409
+    assert stale.json()["detail"]["ticket"]["version"] == 2
+    assert stale.json()["detail"]["ticket"]["column_id"] == review
+
+    body = client.post(
+        "/api/v1/tickets/batch",
+        json={"move": [{"ticket_id": ticket["id"], "column_id": to_do, "expected_version": 1}]},
+        headers=HEADERS,
+    ).json()
+    assert body["moved"][0]["error"] == "Version conflict"
+    body = client.post(
+        "/api/v1/tickets/batch",
+        json={"move": [{"ticket_id": ticket["id"], "column_id": to_do, "expected_version": 2}]},
+        headers=HEADERS,
+    ).json()
+    assert body["moved"][0]["error"] is None
+
+    # A write landing between the read and the flush makes the conditional UPDATE match nothing.
+    rank_for_move = ticket_routes.rank_for_move
+
+    async def _concurrent_write(session, ticket_id, *args):
+        await session.execute(update(Ticket.__table__).where(Ticket.id == ticket_id).values(version=Ticket.version + 1))
+        return await rank_for_move(session, ticket_id, *args)
+
+    monkeypatch.setattr(ticket_routes, "rank_for_move", _concurrent_write)
+    raced = client.post(url, json={"column_id": review}, headers=HEADERS)
+    assert raced.status_code == 409
+    assert raced.json()["detail"]["ticket"]["column_id"] == to_do
@@ -0,0 +1,96 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from app.models.ticket import Ticket, TicketTimeRollup, TicketTimeSegment, ticket_assignees_table
+from app.services.time_reports import rebuild_rollups, split_by_day
+from app.services.time_tracking import start_timers, stop_timers
+
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_split_by_day_cuts_at_utc_midnight():
+    pieces = list(split_by_day(datetime(2024, 3, 1, 23, 0), datetime(2024, 3, 3, 1, 30)))
+    assert pieces == [(date(2024, 3, 1), 3600), (date(2024, 3, 2), 86400), (date(2024, 3, 3), 5400)]
+
+
+def test_rollups_feed_reports_and_rebuild(client, db_session, event_loop):
+    me = client.get("/api/v1/me", headers=HEADERS).json()["id"]
+    org_id = client.post("/api/v1/organizations/", json={"name": "ReportOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "ReportProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _track():
+        ticket = Ticket(project_id=project_id, column_id=1, title="Billable", rank="i")
+        db_session.add(ticket)
+        await db_session.flush()
+        await db_session.execute(insert(ticket_assignees_table).values(ticket_id=ticket.id, user_id=me))
+        await start_timers(db_session, {ticket.id})
+        await db_session.execute(
+            TicketTimeSegment.__table__.update()
+            .where(TicketTimeSegment.ticket_id == ticket.id)
+            .values(started_at=datetime(2024, 3, 1, 23, 0))
+        )
+        closed = await stop_timers(db_session, {ticket.id})
+        # Pin the end so the expected totals do not depend on today's date.
+        await db_session.execute(
+            TicketTimeSegment.__table__.update()
+            .where(TicketTimeSegment.id == closed[0].id)
+            .values(ended_at=datetime(2024, 3, 2, 1, 0))
+        )
+        await db_session.commit()
+        assert await rebuild_rollups(db_session, since=date(2024, 3, 1), batch_size=1) >= 1
+        rows = await db_session.execute(
+            select(TicketTimeRollup.day, TicketTimeRollup.seconds).where(TicketTimeRollup.ticket_id == ticket.id)
+        )
+        assert sorted(rows.all()) == [(date(2024, 3, 1), 3600), (date(2024, 3, 2), 3600)]
+
+    event_loop.run_until_complete(_track())
+    window = {"start": "2024-03-01", "end": "2024-03-31", "project_id": project_id}
+    by_day = client.get("/api/v1/reports/time", params={**window, "group_by": "day"}, headers=HEADERS).json()
+    assert by_day["rows"] == [{"key": "2024-03-01", "seconds": 3600}, {"key": "2024-03-02", "seconds": 3600}]
+    by_user = client.get("/api/v1/reports/time", params={**window, "group_by": "assignee"}, headers=HEADERS).json()
+    assert by_user["rows"] == [{"key": me, "seconds": 7200}]
+    assert client.get("/api/v1/reports/time", params={"project_id": 999999}, headers=HEADERS).status_code == 403
+
+
+def test_rebuild_counts_a_segment_closed_meanwhile_once(client, db_session, session_factory, event_loop, monkeypatch):
+    org_id = client.post("/api/v1/organizations/", json={"name": "RebuildOrg"}, headers=HEADERS).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "RebuildProj", "organization_id": org_id}, headers=HEADERS
+    ).json()["id"]
+
+    async def _run():
+        ticket = Ticket(project_id=project_id, column_id=1, title="Live", rank="i")
+        db_session.add(ticket)
+        await db_session.flush()
+        await start_timers(db_session, {ticket.id})
+        await db_session.execute(
+            TicketTimeSegment.__table__.update()
+            .where(TicketTimeSegment.ticket_id == ticket.id)
+            .values(started_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        await db_session.commit()
+        closed = []
+        commit = db_session.commit
+
+        async def _commit_then_stop_timer():
+            await commit()
+            if not closed:
+                # The timer stops right after the rebuild cleared the rollups.
+                async with session_factory() as other:
+                    closed.extend(await stop_timers(other, {ticket.id}))
+                    await other.commit()
+
+        monkeypatch.setattr(db_session, "commit", _commit_then_stop_timer)
+        await rebuild_rollups(db_session)
+        monkeypatch.undo()
+        assert closed
+        tracked = sum(seconds for _, seconds in split_by_day(closed[0].started_at, closed[0].ended_at))
+        total = await db_session.scalar(
+            select(func.sum(TicketTimeRollup.seconds)).where(TicketTimeRollup.ticket_id == ticket.id)
+        )
+        assert total == tracked >= 3600
+
+    event_loop.run_until_complete(_run())
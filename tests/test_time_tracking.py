@@ -1,10 +1,12 @@
 import asyncio
+from datetime import datetime, timedelta
 from time import sleep
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.models.kanban import KanbanColumn
-from app.models.ticket import TicketTimeSegment
+from app.models.ticket import Ticket, TicketTimeSegment
+from app.services.time_tracking import start_timers, stop_timers
 
 
 def test_time_tracking_segments(client, db_session, event_loop):
@@ -64,3 +66,41 @@ def test_time_tracking_segments(client, db_session, event_loop):
         assert seg_list[0].ended_at is not None
 
     event_loop.run_until_complete(_run())
+
+
+def test_open_segment_is_unique_and_totals_roll_up(client, db_session, event_loop):
+    headers = {"Authorization": "Bearer test-token"}
+    org_id = client.post("/api/v1/organizations/", json={"name": "TimerOrg"}, headers=headers).json()["id"]
+    project_id = client.post(
+        "/api/v1/projects/", json={"name": "TimerProj", "organization_id": org_id}, headers=headers
+    ).json()["id"]
+
+    async def _run():
+        column = KanbanColumn(project_id=project_id, name="TO_DO")
+        db_session.add(column)
+        await db_session.flush()
+        ticket = Ticket(project_id=project_id, column_id=column.id, title="Timer", rank="i")
+        db_session.add(ticket)
+        await db_session.commit()
+
+        await start_timers(db_session, {ticket.id})
+        await start_timers(db_session, {ticket.id})
+        open_segments = await db_session.scalars(
+            select(TicketTimeSegment).where(TicketTimeSegment.ticket_id == ticket.id, TicketTimeSegment.ended_at.is_(None))
+        )
+        assert len(list(open_segments)) == 1
+        await db_session.execute(
+            update(TicketTimeSegment)
+            .where(TicketTimeSegment.ticket_id == ticket.id)
+            .values(started_at=datetime.utcnow() - timedelta(minutes=5))
+        )
+        assert len(await stop_timers(db_session, {ticket.id})) == 1
+        assert await stop_timers(db_session, {ticket.id}) == []
+        await start_timers(db_session, {ticket.id})
+        await db_session.commit()
+        return ticket.id
+
+    ticket_id = event_loop.run_until_complete(_run())
+    total = client.get(f"/api/v1/tickets/{ticket_id}/time/total", headers=headers).json()
+    assert 299 <= total["total_tracked_seconds"] <= 301
+    assert total["running_since"] is not None
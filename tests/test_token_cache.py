@@ -0,0 +1,38 @@
+import time
+
+from app.api import deps
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_expiry_and_eviction():
+    now = [1000.0]
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, clock=lambda: now[0])
+    cache.set("a", 1, expires_at=1010.0)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 1010.0
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_verified_token_is_cached(client, monkeypatch):
+    calls = []
+
+    class FakeVerifier:
+        async def verify(self, token):
+            calls.append(token)
+            return {"uid": "cached-user", "email": "cached@local", "name": "Cached", "exp": time.time() + 600}
+
+    monkeypatch.setattr(deps, "get_token_verifier", FakeVerifier)
+    deps.token_cache.clear()
+    headers = {"Authorization": "Bearer real-token"}
+
+    assert client.get("/api/v1/me", headers=headers).status_code == 200
+    assert client.get("/api/v1/me", headers=headers).status_code == 200
+    assert calls == ["real-token"]
+    assert deps.token_cache_key("real-token") != "real-token"
+    assert client.get("/health/metrics").json()["token_cache"]["hits"] >= 1